@@ -1,7 +1,20 @@
 from fastapi import status
 
 from app.schemas.base import BaseResponseSchema
-from app.schemas.webhooks import WebhookListResponseSchema
+from app.schemas.webhooks import (
+    WebhookDeadLetterListResponseSchema,
+    WebhookEventStatusResponseSchema,
+    WebhookLatencyBreakdownResponseSchema,
+    WebhookListResponseSchema,
+    WebhookReplayJobResponseSchema,
+)
+
+WEBHOOK_INGEST_REQUEST_BODY: dict = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": {"type": "object"}}},
+    }
+}
 
 WEBHOOK_INGEST_RESPONSES: dict = {
     status.HTTP_201_CREATED: {
@@ -12,7 +25,16 @@ WEBHOOK_INGEST_RESPONSES: dict = {
     status.HTTP_401_UNAUTHORIZED: {
         "description": "Unauthorized request due to signature mismatch"
     },
+    status.HTTP_409_CONFLICT: {
+        "description": "Idempotency key belongs to an event that is no longer stored"
+    },
+    status.HTTP_429_TOO_MANY_REQUESTS: {
+        "description": "Producer rate limit or daily quota exceeded, see Retry-After"
+    },
     status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
+    status.HTTP_503_SERVICE_UNAVAILABLE: {
+        "description": "Ingest shed while delivery is overloaded, see Retry-After"
+    },
 }
 
 WEBHOOK_DOWNSTREAM_RECEIVE_RESPONSES: dict = {
@@ -33,3 +55,59 @@ WEBHOOK_SEARCH_RESPONSES: dict = {
     status.HTTP_400_BAD_REQUEST: {"description": "Invalid request"},
     status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
 }
+
+WEBHOOK_LATENCY_BREAKDOWN_RESPONSES: dict = {
+    status.HTTP_200_OK: {
+        "model": WebhookLatencyBreakdownResponseSchema,
+        "description": "Webhook latency breakdown retrieved successfully!",
+    },
+    status.HTTP_400_BAD_REQUEST: {"description": "Invalid request"},
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
+}
+
+WEBHOOK_DEAD_LETTER_LIST_RESPONSES: dict = {
+    status.HTTP_200_OK: {
+        "model": WebhookDeadLetterListResponseSchema,
+        "description": "Dead-lettered webhook events retrieved successfully!",
+    },
+    status.HTTP_400_BAD_REQUEST: {"description": "Invalid request"},
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
+}
+
+WEBHOOK_DEAD_LETTER_REPLAY_RESPONSES: dict = {
+    status.HTTP_202_ACCEPTED: {
+        "model": WebhookReplayJobResponseSchema,
+        "description": "Dead-letter replay started",
+    },
+    status.HTTP_400_BAD_REQUEST: {"description": "Invalid request"},
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
+}
+
+WEBHOOK_REPLAY_JOB_RESPONSES: dict = {
+    status.HTTP_200_OK: {
+        "model": WebhookReplayJobResponseSchema,
+        "description": "Replay job retrieved successfully!",
+    },
+    status.HTTP_400_BAD_REQUEST: {"description": "Invalid job id"},
+    status.HTTP_404_NOT_FOUND: {"description": "Replay job not found"},
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
+}
+
+WEBHOOK_EXPORT_RESPONSES: dict = {
+    status.HTTP_200_OK: {
+        "content": {"application/x-ndjson": {}, "application/gzip": {}},
+        "description": "Matching webhook events streamed as NDJSON, one event per line",
+    },
+    status.HTTP_400_BAD_REQUEST: {"description": "Invalid request"},
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
+}
+
+WEBHOOK_EVENT_STATUS_RESPONSES: dict = {
+    status.HTTP_200_OK: {
+        "model": WebhookEventStatusResponseSchema,
+        "description": "Webhook event status retrieved successfully!",
+    },
+    status.HTTP_400_BAD_REQUEST: {"description": "Invalid event id"},
+    status.HTTP_404_NOT_FOUND: {"description": "Webhook event not found"},
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
+}
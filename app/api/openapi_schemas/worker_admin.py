@@ -0,0 +1,21 @@
+from fastapi import status
+
+from app.schemas.worker_admin import WorkerStatsResponseSchema
+
+WORKER_STATS_RESPONSES: dict = {
+    status.HTTP_200_OK: {
+        "model": WorkerStatsResponseSchema,
+        "description": "Worker stats retrieved successfully!",
+    },
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
+}
+
+WORKER_CONTROL_RESPONSES: dict = {
+    status.HTTP_200_OK: {
+        "model": WorkerStatsResponseSchema,
+        "description": "Worker updated successfully!",
+    },
+    status.HTTP_400_BAD_REQUEST: {"description": "Invalid request"},
+    status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Delivery loop not running"},
+    status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
+}
@@ -1,47 +1,115 @@
-from fastapi import APIRouter, Body, Depends, Header, status
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from datetime import datetime, timezone
+from typing import Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, Body, Depends, Header, Path, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.api.openapi_schemas.webhooks import (
+    WEBHOOK_DEAD_LETTER_LIST_RESPONSES,
+    WEBHOOK_DEAD_LETTER_REPLAY_RESPONSES,
     WEBHOOK_DOWNSTREAM_RECEIVE_RESPONSES,
+    WEBHOOK_EVENT_STATUS_RESPONSES,
+    WEBHOOK_EXPORT_RESPONSES,
+    WEBHOOK_INGEST_REQUEST_BODY,
     WEBHOOK_INGEST_RESPONSES,
+    WEBHOOK_LATENCY_BREAKDOWN_RESPONSES,
+    WEBHOOK_REPLAY_JOB_RESPONSES,
     WEBHOOK_SEARCH_RESPONSES,
 )
-from app.dependencies.auth import verify_webhook_signature
-from app.dependencies.db import get_db
-from app.dependencies.filtering import WebhookEventFilter
+from app.config.settings import settings
+from app.dependencies.admission import admit_ingest_event_type, ingest_admission
+from app.dependencies.backends import (
+    get_dead_letter_service,
+    get_latency_breakdown_service,
+    get_webhook_event_service,
+)
+from app.dependencies.filtering import (
+    WebhookDeadLetterFilter,
+    WebhookEventFilter,
+    WebhookLatencyFilter,
+)
 from app.dependencies.pagination import PaginationParams
-from app.dependencies.rate_limiter import RateLimiterDependency, TokenBucketRateLimiter
+from app.dependencies.payload import (
+    get_event_attrs,
+    get_expires_at,
+    get_ordering_key,
+    get_webhook_payload,
+)
+from app.dependencies.rate_limiter import (
+    ProducerIngestLimiter,
+    ProducerIngestLimiterDependency,
+    RateLimiterDependency,
+    TokenBucketRateLimiter,
+)
 from app.schemas.base import BaseResponseSchema
 from app.schemas.webhooks import (
+    WebhookDeadLetterListResponseSchema,
+    WebhookDeadLetterPaginatedSchema,
+    WebhookEventStatusResponseSchema,
+    WebhookEventStatusSchema,
     WebhookIngestSchema,
+    WebhookLatencyBreakdownResponseSchema,
+    WebhookLatencyBreakdownSchema,
     WebhookListPaginatedSchema,
     WebhookListResponseSchema,
+    WebhookReplayJobResponseSchema,
+    WebhookReplayJobSchema,
+    WebhookReplayRequestSchema,
 )
+from app.services.dead_letters import DeadLetterService
+from app.services.latency import LatencyBreakdownService
 from app.services.webhooks import WebhookEventService
+from app.tasks.dead_letter_replay import start_dead_letter_replay
 from app.utils.custom_responses import CustomAPIResponse
+from app.utils.enums.webhooks import SearchCountStrategyEnum
+from app.utils.exceptions.webhooks import WebhookEventException
 
 webhook_router = APIRouter(prefix="/api/v1/webhooks", tags=["Webhooks"])
 
+# Dependencies run in declaration order: signature, load shedding, producer limits, then
+# the body, so rejected requests are never parsed or stored and shed requests never
+# consume the producer's limits
+producer_ingest_limiter = ProducerIngestLimiter()
+
 
 @webhook_router.post(
     path="/ingest",
     status_code=status.HTTP_201_CREATED,
     response_model=BaseResponseSchema,
     responses=WEBHOOK_INGEST_RESPONSES,
+    openapi_extra=WEBHOOK_INGEST_REQUEST_BODY,
 )
 async def ingest_webhook(
-    payload: dict = Body(...),
     idempotency_key: str = Header(..., alias="Idempotency-Key"),
-    _: bool = Depends(verify_webhook_signature),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    x_ordering_key: Optional[str] = Header(
+        None, description="Events sharing an ordering key are delivered in order"
+    ),
+    x_expires_at: Optional[str] = Header(
+        None, description="ISO 8601 time after which the event is no longer delivered"
+    ),
+    _: bool = Depends(ingest_admission),
+    __: str = Depends(ProducerIngestLimiterDependency(limiter=producer_ingest_limiter)),
+    payload: dict = Depends(get_webhook_payload),
+    ___: None = Depends(admit_ingest_event_type),
+    webhook_event_service: WebhookEventService = Depends(get_webhook_event_service),
 ) -> dict:
     """Ingest and persist validated webhook payload."""
 
-    webhook_event_service = WebhookEventService(db=db)
+    received_at = datetime.now(tz=timezone.utc)
     webhook_ingest_schema = WebhookIngestSchema(
         data=payload,
         event_type=payload.get("event_type"),
         idempotency_key=idempotency_key,
+        received_at=received_at,
+        ordering_key=get_ordering_key(payload=payload, x_ordering_key=x_ordering_key),
+        attrs=get_event_attrs(event_type=payload.get("event_type"), payload=payload),
+        expires_at=get_expires_at(
+            event_type=payload.get("event_type"),
+            received_at=received_at,
+            x_expires_at=x_expires_at,
+        ),
     )
     result = await webhook_event_service.insert_webhook_event(
         webhook_ingest_schema=webhook_ingest_schema
@@ -53,7 +121,7 @@ async def ingest_webhook(
     )
 
 
-downstream_rate_limiter = TokenBucketRateLimiter(rate=3, capacity=3)
+downstream_rate_limiter = TokenBucketRateLimiter(rate=3, capacity=3, name="downstream")
 
 
 @webhook_router.post(
@@ -88,18 +156,203 @@ async def downstream_webhook_receive(
 async def list_webhook_events(
     pagination_params: PaginationParams = Depends(),
     filter_params: WebhookEventFilter = Depends(),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    count_strategy: Optional[SearchCountStrategyEnum] = Query(
+        None, description="How the total count is computed, defaults to the setting"
+    ),
+    webhook_event_service: WebhookEventService = Depends(get_webhook_event_service),
 ) -> dict:
     """Retrieve paginated webhook events based on filters."""
     filter_params.validate_timestamp()
-    webhook_event_service = WebhookEventService(db=db)
     webhook_events = await webhook_event_service.get_filtered_search_webhook_events(
-        pagination_params=pagination_params, filter_params=filter_params
+        pagination_params=pagination_params,
+        filter_params=filter_params,
+        count_strategy=count_strategy or settings.SEARCH_COUNT_STRATEGY,
     )
     return CustomAPIResponse().get_success_response(
         code=status.HTTP_200_OK,
         message="Webhook events retrieved successfully!",
         data=WebhookListPaginatedSchema(
-            total_count=pagination_params.total_count, results=webhook_events
+            total_count=pagination_params.total_count,
+            results=webhook_events,
+            count_strategy=pagination_params.count_strategy,
+        ),
+    )
+
+
+@webhook_router.get(
+    path="/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses=WEBHOOK_EXPORT_RESPONSES,
+)
+async def export_webhook_events(
+    filter_params: WebhookEventFilter = Depends(),
+    gzip: bool = Query(False, description="Gzip-compress the NDJSON stream"),
+    webhook_event_service: WebhookEventService = Depends(get_webhook_event_service),
+) -> StreamingResponse:
+    """Stream all webhook events matching the filters as NDJSON."""
+    filter_params.validate_timestamp()
+    filename = "webhook_events.ndjson.gz" if gzip else "webhook_events.ndjson"
+    return StreamingResponse(
+        content=webhook_event_service.export_filtered_webhook_events(
+            filter_params=filter_params, compress=gzip
+        ),
+        media_type="application/gzip" if gzip else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@webhook_router.get(
+    path="/latency-breakdown",
+    status_code=status.HTTP_200_OK,
+    response_model=WebhookLatencyBreakdownResponseSchema,
+    responses=WEBHOOK_LATENCY_BREAKDOWN_RESPONSES,
+)
+async def get_webhook_latency_breakdown(
+    filter_params: WebhookLatencyFilter = Depends(),
+    latency_breakdown_service: LatencyBreakdownService = Depends(
+        get_latency_breakdown_service
+    ),
+) -> dict:
+    """Retrieve p50/p95/p99 latency per delivery lifecycle stage for a time window."""
+    filter_params.validate_timestamp()
+    latency_breakdown = await latency_breakdown_service.get_latency_breakdown(
+        filter_params=filter_params
+    )
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_200_OK,
+        message="Webhook latency breakdown retrieved successfully!",
+        data=WebhookLatencyBreakdownSchema(**latency_breakdown),
+    )
+
+
+@webhook_router.get(
+    path="/dead-letters",
+    status_code=status.HTTP_200_OK,
+    response_model=WebhookDeadLetterListResponseSchema,
+    responses=WEBHOOK_DEAD_LETTER_LIST_RESPONSES,
+)
+async def list_dead_letter_webhook_events(
+    pagination_params: PaginationParams = Depends(),
+    filter_params: WebhookDeadLetterFilter = Depends(),
+    dead_letter_service: DeadLetterService = Depends(get_dead_letter_service),
+) -> dict:
+    """Retrieve paginated permanently failed webhook events based on filters."""
+    filter_params.validate_timestamp()
+    dead_letter_events = await dead_letter_service.get_dead_letter_events(
+        pagination_params=pagination_params, filter_params=filter_params
+    )
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_200_OK,
+        message="Dead-lettered webhook events retrieved successfully!",
+        data=WebhookDeadLetterPaginatedSchema(
+            total_count=pagination_params.total_count, results=dead_letter_events
         ),
     )
+
+
+@webhook_router.post(
+    path="/dead-letters/replay",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=WebhookReplayJobResponseSchema,
+    responses=WEBHOOK_DEAD_LETTER_REPLAY_RESPONSES,
+)
+async def replay_dead_letter_webhook_events(
+    replay_request: WebhookReplayRequestSchema = Body(...),
+    dead_letter_service: DeadLetterService = Depends(get_dead_letter_service),
+) -> dict:
+    """Start a background job re-enqueueing the selected dead letters at a capped rate."""
+    job, filter_dict = await dead_letter_service.create_replay_job(
+        replay_request=replay_request
+    )
+    start_dead_letter_replay(
+        dead_letter_service=dead_letter_service, job=job, filter_dict=filter_dict
+    )
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_202_ACCEPTED,
+        message="Dead-letter replay started!",
+        data=WebhookReplayJobSchema(**{**job, "_id": str(job["_id"])}),
+    )
+
+
+@webhook_router.get(
+    path="/dead-letters/replay/{job_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=WebhookReplayJobResponseSchema,
+    responses=WEBHOOK_REPLAY_JOB_RESPONSES,
+)
+async def get_dead_letter_replay_job(
+    job_id: str = Path(..., description="Replay job id"),
+    dead_letter_service: DeadLetterService = Depends(get_dead_letter_service),
+) -> dict:
+    """Retrieve the status and progress of a dead-letter replay job."""
+    try:
+        job_object_id = ObjectId(job_id)
+    except InvalidId:
+        raise WebhookEventException(message="Invalid job id!", error="bad-request")
+    job = await dead_letter_service.get_replay_job(job_id=job_object_id)
+    if not job:
+        raise WebhookEventException(
+            message="Replay job not found!", error="resource-not-found"
+        )
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_200_OK,
+        message="Replay job retrieved successfully!",
+        data=WebhookReplayJobSchema(**job),
+    )
+
+
+@webhook_router.get(
+    path="/events/{event_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=WebhookEventStatusResponseSchema,
+    responses=WEBHOOK_EVENT_STATUS_RESPONSES,
+)
+async def get_webhook_event_status(
+    event_id: str = Path(..., description="Webhook event id"),
+    webhook_event_service: WebhookEventService = Depends(get_webhook_event_service),
+) -> dict:
+    """Retrieve the delivery status of a webhook event, served from the status cache."""
+    try:
+        event_object_id = ObjectId(event_id)
+    except InvalidId:
+        raise WebhookEventException(message="Invalid event id!", error="bad-request")
+    event_status = await webhook_event_service.get_webhook_event_status(
+        event_id=event_object_id
+    )
+    if not event_status:
+        raise WebhookEventException(
+            message="Webhook event not found!", error="resource-not-found"
+        )
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_200_OK,
+        message="Webhook event status retrieved successfully!",
+        data=WebhookEventStatusSchema(**event_status),
+    )
+
+
+@webhook_router.get(
+    path="/events/idempotency-key/{idempotency_key}",
+    status_code=status.HTTP_200_OK,
+    response_model=WebhookEventStatusResponseSchema,
+    responses=WEBHOOK_EVENT_STATUS_RESPONSES,
+)
+async def get_webhook_event_status_by_idempotency_key(
+    idempotency_key: str = Path(..., description="Idempotency key of the event"),
+    webhook_event_service: WebhookEventService = Depends(get_webhook_event_service),
+) -> dict:
+    """Retrieve the delivery status of the webhook event ingested with a key."""
+    event_status = (
+        await webhook_event_service.get_webhook_event_status_by_idempotency_key(
+            idempotency_key=idempotency_key
+        )
+    )
+    if not event_status:
+        raise WebhookEventException(
+            message="Webhook event not found!", error="resource-not-found"
+        )
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_200_OK,
+        message="Webhook event status retrieved successfully!",
+        data=WebhookEventStatusSchema(**event_status),
+    )
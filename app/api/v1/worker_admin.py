@@ -0,0 +1,92 @@
+from fastapi import APIRouter, Body, status
+
+from app.api.openapi_schemas.worker_admin import (
+    WORKER_CONTROL_RESPONSES,
+    WORKER_STATS_RESPONSES,
+)
+from app.schemas.worker_admin import (
+    WorkerConcurrencyRequestSchema,
+    WorkerStatsResponseSchema,
+    WorkerStatsSchema,
+)
+from app.services.worker_runtime import delivery_worker_runtime
+from app.utils.custom_responses import CustomAPIResponse
+from app.utils.exceptions.core import UtilsException
+
+worker_admin_router = APIRouter(prefix="/admin", tags=["Worker Admin"])
+
+
+def ensure_delivery_loop_running() -> None:
+    """Reject changes while no delivery loop runs in this process."""
+    if not delivery_worker_runtime.is_running():
+        raise UtilsException(
+            message="Delivery loop is not running!", error="service-unavailable"
+        )
+
+
+@worker_admin_router.get(
+    path="/stats",
+    status_code=status.HTTP_200_OK,
+    response_model=WorkerStatsResponseSchema,
+    responses=WORKER_STATS_RESPONSES,
+)
+async def get_worker_stats() -> dict:
+    """Retrieve the live runtime state of the delivery worker."""
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_200_OK,
+        message="Worker stats retrieved successfully!",
+        data=WorkerStatsSchema(**delivery_worker_runtime.get_stats()),
+    )
+
+
+@worker_admin_router.put(
+    path="/concurrency",
+    status_code=status.HTTP_200_OK,
+    response_model=WorkerStatsResponseSchema,
+    responses=WORKER_CONTROL_RESPONSES,
+)
+async def set_worker_concurrency(
+    concurrency: WorkerConcurrencyRequestSchema = Body(...),
+) -> dict:
+    """Change how many deliveries run at once, without restarting the worker."""
+    ensure_delivery_loop_running()
+    await delivery_worker_runtime.limiter.set_limit(limit=concurrency.limit)
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_200_OK,
+        message="Worker concurrency updated successfully!",
+        data=WorkerStatsSchema(**delivery_worker_runtime.get_stats()),
+    )
+
+
+@worker_admin_router.post(
+    path="/dequeue/pause",
+    status_code=status.HTTP_200_OK,
+    response_model=WorkerStatsResponseSchema,
+    responses=WORKER_CONTROL_RESPONSES,
+)
+async def pause_worker_dequeue() -> dict:
+    """Stop taking events off the queue. Deliveries already claimed keep running."""
+    ensure_delivery_loop_running()
+    delivery_worker_runtime.set_dequeue_enabled(enabled=False)
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_200_OK,
+        message="Worker dequeue paused successfully!",
+        data=WorkerStatsSchema(**delivery_worker_runtime.get_stats()),
+    )
+
+
+@worker_admin_router.post(
+    path="/dequeue/resume",
+    status_code=status.HTTP_200_OK,
+    response_model=WorkerStatsResponseSchema,
+    responses=WORKER_CONTROL_RESPONSES,
+)
+async def resume_worker_dequeue() -> dict:
+    """Resume taking events off the queue."""
+    ensure_delivery_loop_running()
+    delivery_worker_runtime.set_dequeue_enabled(enabled=True)
+    return CustomAPIResponse().get_success_response(
+        code=status.HTTP_200_OK,
+        message="Worker dequeue resumed successfully!",
+        data=WorkerStatsSchema(**delivery_worker_runtime.get_stats()),
+    )
@@ -0,0 +1,356 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+
+from bson import ObjectId
+
+from app.utils.dtos.webhooks import (
+    LatencyRollupDTO,
+    QueueStatsDTO,
+    RateLimitDecisionDTO,
+    TokenLeaseDTO,
+)
+from app.utils.enums.webhooks import WebhookStatusEnum
+
+
+class WebhookEventStore(ABC):
+    """
+    Event store contract. Filters are expressed in the MongoDB query language, which every
+    implementation accepts for the subset produced by WebhookEventFilter.
+    """
+
+    @abstractmethod
+    async def insert_event(self, document: dict) -> dict:
+        """
+        Persist a new event document and return it with its `_id` set.
+
+        Raises DuplicateWebhookEventException when the idempotency key already exists.
+        """
+        pass
+
+    @abstractmethod
+    async def insert_events(self, documents: List[dict]) -> List[Optional[Exception]]:
+        """
+        Persist new event documents in one write, setting their `_id`. A failing document
+        does not stop the others, so the result holds None for every inserted document and
+        the error of every other one, e.g. a DuplicateWebhookEventException.
+        """
+        pass
+
+    @abstractmethod
+    async def get_event_by_idempotency_key(
+        self, idempotency_key: str
+    ) -> Optional[dict]:
+        """Retrieve an event by its idempotency key."""
+        pass
+
+    @abstractmethod
+    async def get_event_by_id(self, event_id: ObjectId) -> Optional[dict]:
+        """Retrieve an event by its id."""
+        pass
+
+    @abstractmethod
+    async def claim_event(
+        self, event_id: ObjectId, current_time: datetime, locked_until: datetime
+    ) -> Optional[dict]:
+        """
+        Lock an event that is pending delivery, due and not locked by another worker.
+
+        Returns the claimed event or None when the event is not eligible.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_delivery_status(
+        self,
+        event_id: ObjectId,
+        log_entry: dict,
+        status: WebhookStatusEnum,
+        next_retry_at: Optional[datetime],
+        attempt_count: int,
+        finished_at: Optional[datetime] = None,
+    ) -> None:
+        """Update an event's delivery status, release its lock and append a log entry."""
+        pass
+
+    @abstractmethod
+    async def set_enqueued_timestamp(
+        self, event_ids: List[ObjectId], enqueued: float
+    ) -> None:
+        """Record when the events were pushed to the queue, in one write."""
+        pass
+
+    @abstractmethod
+    async def expire_events(self, current_time: datetime, limit: int) -> List[dict]:
+        """
+        Mark up to `limit` pending, unlocked events whose `expires_at` has passed as
+        expired. Returns `_id` and `ordering_key` of every event it expired.
+        """
+        pass
+
+    @abstractmethod
+    async def release_event_locks(self, event_ids: List[ObjectId]) -> int:
+        """
+        Unlock the pending events among `event_ids` in one write, so they can be claimed
+        again right away. Returns the number of events released.
+        """
+        pass
+
+    @abstractmethod
+    async def find_event_ids(
+        self, filter_dict: dict, after_id: Optional[ObjectId], limit: int
+    ) -> List[ObjectId]:
+        """Retrieve up to `limit` ids of matching events greater than `after_id`, in order."""
+        pass
+
+    @abstractmethod
+    async def reset_events_for_redelivery(
+        self, event_ids: List[ObjectId], current_time: datetime
+    ) -> List[dict]:
+        """
+        Reset permanently failed events among `event_ids` to a fresh, due delivery in one
+        write. Returns `_id` and `ordering_key` of every event it reset.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_events(self, filter_dict: dict) -> int:
+        """Delete events matching the filter, returning the number deleted."""
+        pass
+
+    @abstractmethod
+    async def count_events(self, filter_dict: dict) -> int:
+        """Count events matching the filter."""
+        pass
+
+    @abstractmethod
+    async def estimate_events_count(self) -> int:
+        """Return the approximate number of stored events, without scanning them."""
+        pass
+
+    @abstractmethod
+    async def find_events(
+        self, filter_dict: dict, offset: int = 0, limit: Optional[int] = None
+    ) -> List[dict]:
+        """Retrieve events matching the filter."""
+        pass
+
+    @abstractmethod
+    def iterate_events(self, filter_dict: dict, batch_size: int) -> AsyncIterator[dict]:
+        """
+        Stream events matching the filter, fetching `batch_size` documents per round trip
+        so memory stays bounded regardless of the number of matches.
+        """
+        pass
+
+    @abstractmethod
+    async def get_aggregates(self, filter_dict: dict) -> dict:
+        """Compute counts by status, by event type and an hourly histogram."""
+        pass
+
+
+class WebhookQueue(ABC):
+    """Delivery queue contract holding event ids pending delivery and scheduled retries."""
+
+    @abstractmethod
+    async def enqueue(self, event_ids: List[str]) -> None:
+        """Push event ids to the tail of the delivery queue."""
+        pass
+
+    @abstractmethod
+    async def dequeue(self, timeout: float = 0) -> Optional[str]:
+        """Block until an event id is available (0 waits forever) and pop it."""
+        pass
+
+    @abstractmethod
+    async def requeue(self, event_ids: List[str]) -> None:
+        """Push event ids back to the head of the delivery queue, so they are popped next."""
+        pass
+
+    @abstractmethod
+    async def schedule_retry(self, event_id: str, due_timestamp: float) -> None:
+        """Schedule an event id to be moved back to the delivery queue when due."""
+        pass
+
+    @abstractmethod
+    async def promote_due_retries(self, now: float, limit: int) -> List[str]:
+        """Atomically move up to `limit` retries due by `now` to the delivery queue."""
+        pass
+
+    @abstractmethod
+    async def enqueue_ordered(self, ordering_key: str, event_id: str) -> None:
+        """
+        Append an event id to the FIFO lane of its ordering key, pushing it to the
+        delivery queue only when the lane has no earlier unresolved event.
+        """
+        pass
+
+    @abstractmethod
+    async def release_ordering_key(
+        self, ordering_key: str, event_id: str
+    ) -> Optional[str]:
+        """
+        Remove a resolved event from the head of its lane and push the next event of the
+        lane to the delivery queue, returning it. An event waiting behind the head, e.g.
+        one that expired, is only removed from the lane.
+        """
+        pass
+
+    @abstractmethod
+    async def enqueue_batch(
+        self, event_ids: List[str], ordered_event_ids: List[Tuple[str, str]]
+    ) -> None:
+        """
+        Push event ids to the delivery queue and (ordering key, event id) pairs to their
+        ordering lanes in one round trip, keeping the order of the pairs within a lane.
+        """
+        pass
+
+    @abstractmethod
+    async def get_queue_stats(self) -> QueueStatsDTO:
+        """Return depth and oldest entries of the delivery and retry queues."""
+        pass
+
+
+class TokenBucketStore(ABC):
+    """Token bucket state contract used by the rate limiters."""
+
+    @abstractmethod
+    async def take_tokens(
+        self, key: str, rate: float, capacity: float, requested: float, now: float
+    ) -> bool:
+        """Refill the bucket for `key` and take `requested` tokens if available."""
+        pass
+
+    @abstractmethod
+    async def lease_tokens(
+        self, key: str, rate: float, capacity: float, requested: int, now: float
+    ) -> TokenLeaseDTO:
+        """
+        Refill the bucket for `key` and take up to `requested` whole tokens for local use.
+
+        When no token is available, the lease carries the seconds until one will be.
+        """
+        pass
+
+    @abstractmethod
+    async def take_token_within_quota(
+        self,
+        bucket_key: str,
+        quota_key: str,
+        rate: float,
+        capacity: float,
+        daily_quota: int,
+        now: float,
+        quota_ttl: int,
+    ) -> RateLimitDecisionDTO:
+        """
+        Atomically take one token from `bucket_key` and count one request against the
+        quota counter `quota_key`, which expires after `quota_ttl` seconds. A rate or quota
+        of 0 disables that check.
+        """
+        pass
+
+
+class ReplayJobStore(ABC):
+    """Persistent state and progress of dead-letter replay jobs."""
+
+    @abstractmethod
+    async def insert_job(self, document: dict) -> dict:
+        """Persist a new replay job and return it with its `_id` set."""
+        pass
+
+    @abstractmethod
+    async def update_job(self, job_id: ObjectId, fields: dict) -> None:
+        """Set the given fields on a replay job."""
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: ObjectId) -> Optional[dict]:
+        """Retrieve a replay job by its id."""
+        pass
+
+    @abstractmethod
+    async def claim_stale_job(
+        self, stale_before: datetime, current_time: datetime
+    ) -> Optional[dict]:
+        """
+        Take over one running job whose progress was last recorded before
+        `stale_before`, recording progress at `current_time` so no other process takes
+        it as well. Returns the job or None when no running job is stale.
+        """
+        pass
+
+
+class SigningKeyStore(ABC):
+    """Producer signing keys, each key id holding one or more secrets with validity windows."""
+
+    @abstractmethod
+    async def insert_signing_key(self, document: dict) -> dict:
+        """Persist a signing key and return it with its `_id` set."""
+        pass
+
+    @abstractmethod
+    async def find_signing_keys(self, key_id: str) -> List[dict]:
+        """Retrieve all secrets of a key id, including expired and not yet valid ones."""
+        pass
+
+
+class LatencyRollupStore(ABC):
+    """Pre-aggregated per-minute stage latency histograms read by the latency breakdown."""
+
+    @abstractmethod
+    async def increment_rollups(self, rollups: List[LatencyRollupDTO]) -> None:
+        """Merge the given counts into the stored rollups, creating missing ones."""
+        pass
+
+    @abstractmethod
+    async def find_rollups(
+        self, bucket_from: datetime, bucket_to: datetime, event_type: Optional[str]
+    ) -> List[dict]:
+        """
+        Retrieve rollups with `bucket_from <= bucket_start < bucket_to`, optionally for one
+        event type. Bucket counts are keyed by the bucket index as a string.
+        """
+        pass
+
+
+class EventStatusCache(ABC):
+    """
+    Short-lived cache of event status views, keyed by event id, with the idempotency key
+    mapping to the event id. Entries expire after the TTL given to the implementation.
+    """
+
+    @abstractmethod
+    async def get_status(self, event_id: str) -> Optional[dict]:
+        """Retrieve the cached status view of an event."""
+        pass
+
+    @abstractmethod
+    async def get_event_id(self, idempotency_key: str) -> Optional[str]:
+        """Retrieve the cached event id of an idempotency key."""
+        pass
+
+    @abstractmethod
+    async def set_status(self, status_view: dict) -> None:
+        """Cache a status view under its `_id` and its `idempotency_key`."""
+        pass
+
+    @abstractmethod
+    async def delete_statuses(self, event_ids: List[str]) -> None:
+        """Drop the cached status views of events whose status changed in bulk."""
+        pass
+
+
+class SearchCountCache(ABC):
+    """Short-lived cache of search totals keyed by the hash of the normalized filter."""
+
+    @abstractmethod
+    async def get_count(self, filter_hash: str) -> Optional[int]:
+        """Retrieve the cached total of a filter."""
+        pass
+
+    @abstractmethod
+    async def set_count(self, filter_hash: str, count: int) -> None:
+        """Cache the total of a filter for the TTL given to the implementation."""
+        pass
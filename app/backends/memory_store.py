@@ -0,0 +1,748 @@
+import asyncio
+import copy
+import heapq
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+
+from app.backends.base import (
+    EventStatusCache,
+    LatencyRollupStore,
+    ReplayJobStore,
+    SearchCountCache,
+    SigningKeyStore,
+    TokenBucketStore,
+    WebhookEventStore,
+    WebhookQueue,
+)
+from app.utils.datetime_utils import get_utc_timestamp
+from app.utils.dtos.webhooks import (
+    LatencyRollupDTO,
+    QueueStatsDTO,
+    RateLimitDecisionDTO,
+    TokenLeaseDTO,
+)
+from app.utils.enums.webhooks import ReplayJobStatusEnum, WebhookStatusEnum
+from app.utils.exceptions.webhooks import DuplicateWebhookEventException
+from app.utils.serializers import get_json_compatible_value
+
+PENDING_STATUSES: tuple = (
+    WebhookStatusEnum.RECEIVED,
+    WebhookStatusEnum.FAILED_TEMPORARILY,
+)
+
+
+def normalize_value(value: Any) -> Any:
+    """Treat naive datetimes as UTC, matching how MongoDB stores and compares them."""
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def get_field_value(document: dict, path: str) -> Any:
+    """Resolve a dotted field path against a document, returning None when missing."""
+    value: Any = document
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _compare(operator: str, field_value: Any, operand: Any) -> bool:
+    """Apply a single MongoDB comparison operator to a field value."""
+    field_value = normalize_value(field_value)
+    if operator == "$eq":
+        return _equals(field_value, operand)
+    if operator == "$ne":
+        return not _equals(field_value, operand)
+    if operator == "$in":
+        return any(_equals(field_value, candidate) for candidate in operand)
+    if operator == "$nin":
+        return not any(_equals(field_value, candidate) for candidate in operand)
+    if operator == "$exists":
+        return (field_value is not None) == bool(operand)
+    if operator == "$elemMatch":
+        return isinstance(field_value, list) and any(
+            isinstance(item, dict) and match_document(item, operand)
+            for item in field_value
+        )
+    if field_value is None:
+        return False
+    operand = normalize_value(operand)
+    try:
+        if operator == "$gt":
+            return field_value > operand
+        if operator == "$gte":
+            return field_value >= operand
+        if operator == "$lt":
+            return field_value < operand
+        if operator == "$lte":
+            return field_value <= operand
+    except TypeError:
+        return False
+    raise ValueError(f"Unsupported query operator: {operator}")
+
+
+def _equals(field_value: Any, operand: Any) -> bool:
+    """Equality with MongoDB's array semantics: arrays match any contained element."""
+    operand = normalize_value(operand)
+    if isinstance(field_value, list) and not isinstance(operand, list):
+        return operand in field_value
+    return normalize_value(field_value) == operand
+
+
+def match_document(document: dict, filter_dict: dict) -> bool:
+    """Evaluate the subset of the MongoDB query language used by the services."""
+    for key, condition in filter_dict.items():
+        if key == "$or":
+            if not any(
+                match_document(document, sub_filter) for sub_filter in condition
+            ):
+                return False
+        elif key == "$and":
+            if not all(
+                match_document(document, sub_filter) for sub_filter in condition
+            ):
+                return False
+        else:
+            field_value = get_field_value(document, key)
+            if isinstance(condition, dict) and any(
+                operator.startswith("$") for operator in condition
+            ):
+                if not all(
+                    _compare(operator, field_value, operand)
+                    for operator, operand in condition.items()
+                ):
+                    return False
+            elif not _equals(field_value, condition):
+                return False
+    return True
+
+
+class InMemoryWebhookEventStore(WebhookEventStore):
+    """
+    Process-local event store with the same idempotency, claim and lock semantics as the
+    MongoDB store. Intended for single-process deployments, tests and profiling.
+    """
+
+    def __init__(self):
+        self.documents: Dict[ObjectId, dict] = {}
+        self.idempotency_index: Dict[str, ObjectId] = {}
+
+    async def insert_event(self, document: dict) -> dict:
+        """Insert an event enforcing idempotency key uniqueness."""
+        if document["idempotency_key"] in self.idempotency_index:
+            raise DuplicateWebhookEventException(
+                message="Idempotency key already exists",
+                error=document["idempotency_key"],
+            )
+        document.setdefault("_id", ObjectId())
+        self.documents[document["_id"]] = copy.deepcopy(document)
+        self.idempotency_index[document["idempotency_key"]] = document["_id"]
+        return document
+
+    async def insert_events(self, documents: List[dict]) -> List[Optional[Exception]]:
+        """Insert events one by one, collecting duplicate key errors per document."""
+        errors: List[Optional[Exception]] = []
+        for document in documents:
+            try:
+                await self.insert_event(document=document)
+                errors.append(None)
+            except DuplicateWebhookEventException as exc:
+                errors.append(exc)
+        return errors
+
+    async def get_event_by_idempotency_key(
+        self, idempotency_key: str
+    ) -> Optional[dict]:
+        """Retrieve a webhook event by its idempotency key."""
+        event_id = self.idempotency_index.get(idempotency_key)
+        return await self.get_event_by_id(event_id) if event_id else None
+
+    async def get_event_by_id(self, event_id: ObjectId) -> Optional[dict]:
+        """Retrieve a webhook event by its id."""
+        document = self.documents.get(event_id)
+        return copy.deepcopy(document) if document else None
+
+    async def claim_event(
+        self, event_id: ObjectId, current_time: datetime, locked_until: datetime
+    ) -> Optional[dict]:
+        """Lock the event when it is pending, due and not locked by another worker."""
+        document = self.documents.get(event_id)
+        if not document or document["status"] not in PENDING_STATUSES:
+            return None
+        next_retry_at = normalize_value(document.get("next_retry_at"))
+        if next_retry_at is None or next_retry_at > current_time:
+            return None
+        current_lock = normalize_value(document.get("locked_until"))
+        if current_lock is not None and current_lock > current_time:
+            return None
+        expires_at = normalize_value(document.get("expires_at"))
+        if expires_at is not None and expires_at <= current_time:
+            return None
+        document["locked_until"] = locked_until
+        return copy.deepcopy(document)
+
+    async def mark_delivery_status(
+        self,
+        event_id: ObjectId,
+        log_entry: dict,
+        status: WebhookStatusEnum,
+        next_retry_at: Optional[datetime],
+        attempt_count: int,
+        finished_at: Optional[datetime] = None,
+    ) -> None:
+        """Update a webhook's delivery status and append a delivery log."""
+        document = self.documents.get(event_id)
+        if not document:
+            return
+        document.update(
+            {
+                "status": status,
+                "locked_until": None,
+                "next_retry_at": next_retry_at,
+                "attempt_count": attempt_count,
+                "last_status_code": log_entry["status_code"],
+                "finished_at": finished_at,
+            }
+        )
+        document["delivery_logs"] = [
+            *document.get("delivery_logs", []),
+            copy.deepcopy(log_entry),
+        ]
+
+    async def set_enqueued_timestamp(
+        self, event_ids: List[ObjectId], enqueued: float
+    ) -> None:
+        """Record the enqueue time of the events."""
+        for event_id in event_ids:
+            document = self.documents.get(event_id)
+            if document:
+                document.setdefault("stage_timestamps", {})["enqueued"] = enqueued
+
+    async def find_event_ids(
+        self, filter_dict: dict, after_id: Optional[ObjectId], limit: int
+    ) -> List[ObjectId]:
+        """Retrieve the next page of matching event ids in _id order."""
+        event_ids = sorted(
+            event_id
+            for event_id, document in self.documents.items()
+            if (after_id is None or event_id > after_id)
+            and match_document(document, filter_dict)
+        )
+        return event_ids[:limit]
+
+    async def expire_events(self, current_time: datetime, limit: int) -> List[dict]:
+        """Mark pending, unlocked events past their expiry as expired."""
+        expired = []
+        for event_id, document in self.documents.items():
+            if len(expired) >= limit:
+                break
+            expires_at = normalize_value(document.get("expires_at"))
+            current_lock = normalize_value(document.get("locked_until"))
+            if (
+                document["status"] not in PENDING_STATUSES
+                or expires_at is None
+                or expires_at > current_time
+                or (current_lock is not None and current_lock > current_time)
+            ):
+                continue
+            document.update(
+                {
+                    "status": WebhookStatusEnum.EXPIRED,
+                    "locked_until": None,
+                    "next_retry_at": None,
+                    "finished_at": current_time,
+                }
+            )
+            expired.append(
+                {"_id": event_id, "ordering_key": document.get("ordering_key")}
+            )
+        return expired
+
+    async def release_event_locks(self, event_ids: List[ObjectId]) -> int:
+        """Unlock the pending events among `event_ids`."""
+        released_count = 0
+        for event_id in event_ids:
+            document = self.documents.get(event_id)
+            if (
+                document
+                and document["status"] in PENDING_STATUSES
+                and document.get("locked_until") is not None
+            ):
+                document["locked_until"] = None
+                released_count += 1
+        return released_count
+
+    async def reset_events_for_redelivery(
+        self, event_ids: List[ObjectId], current_time: datetime
+    ) -> List[dict]:
+        """Reset the permanently failed events among `event_ids`."""
+        reset_events = []
+        for event_id in event_ids:
+            document = self.documents.get(event_id)
+            if (
+                not document
+                or document["status"] != WebhookStatusEnum.FAILED_PERMANENTLY
+            ):
+                continue
+            document.update(
+                {
+                    "status": WebhookStatusEnum.RECEIVED,
+                    "attempt_count": 0,
+                    "next_retry_at": current_time,
+                    "locked_until": None,
+                    "finished_at": None,
+                    "expires_at": None,
+                    "replay_count": document.get("replay_count", 0) + 1,
+                    "stage_timestamps": {
+                        **document.get("stage_timestamps", {}),
+                        "replayed": get_utc_timestamp(current_time),
+                    },
+                }
+            )
+            reset_events.append(
+                {"_id": event_id, "ordering_key": document.get("ordering_key")}
+            )
+        return reset_events
+
+    async def delete_events(self, filter_dict: dict) -> int:
+        """Delete webhook events matching the filter."""
+        event_ids = [
+            event_id
+            for event_id, document in self.documents.items()
+            if match_document(document, filter_dict)
+        ]
+        for event_id in event_ids:
+            document = self.documents.pop(event_id)
+            self.idempotency_index.pop(document["idempotency_key"], None)
+        return len(event_ids)
+
+    async def count_events(self, filter_dict: dict) -> int:
+        """Count webhook events matching the filter."""
+        return sum(
+            1
+            for document in self.documents.values()
+            if match_document(document, filter_dict)
+        )
+
+    async def estimate_events_count(self) -> int:
+        """Return the number of stored events."""
+        return len(self.documents)
+
+    async def find_events(
+        self, filter_dict: dict, offset: int = 0, limit: Optional[int] = None
+    ) -> List[dict]:
+        """Retrieve webhook events matching the filter in insertion order."""
+        matches = (
+            document
+            for document in self.documents.values()
+            if match_document(document, filter_dict)
+        )
+        results = []
+        for index, document in enumerate(matches):
+            if index < offset:
+                continue
+            if limit and len(results) >= limit:
+                break
+            results.append(copy.deepcopy(document))
+        return results
+
+    async def iterate_events(
+        self, filter_dict: dict, batch_size: int
+    ) -> AsyncIterator[dict]:
+        """Stream matching events, yielding control to the event loop every batch."""
+        for index, document in enumerate(list(self.documents.values()), start=1):
+            if match_document(document, filter_dict):
+                yield copy.deepcopy(document)
+            if index % batch_size == 0:
+                await asyncio.sleep(0)
+
+    async def get_aggregates(self, filter_dict: dict) -> dict:
+        """Compute aggregated counts and hourly histogram for filtered events."""
+        count_by_status: Dict[Any, int] = {}
+        count_by_event_type: Dict[Any, int] = {}
+        hourly_histogram: Dict[datetime, int] = {}
+        for document in self.documents.values():
+            if not match_document(document, filter_dict):
+                continue
+            status = document.get("status")
+            event_type = document.get("event_type")
+            count_by_status[status] = count_by_status.get(status, 0) + 1
+            count_by_event_type[event_type] = count_by_event_type.get(event_type, 0) + 1
+            received_at = normalize_value(document.get("received_at"))
+            if received_at is not None:
+                hour = received_at.astimezone(timezone.utc).replace(
+                    minute=0, second=0, microsecond=0, tzinfo=None
+                )
+                hourly_histogram[hour] = hourly_histogram.get(hour, 0) + 1
+
+        return {
+            "count_by_status": [
+                {"_id": key, "count": count} for key, count in count_by_status.items()
+            ],
+            "count_by_event_type": [
+                {"_id": key, "count": count}
+                for key, count in count_by_event_type.items()
+            ],
+            "hourly_histogram": [
+                {"_id": hour.isoformat(), "count": hourly_histogram[hour]}
+                for hour in sorted(hourly_histogram)
+            ],
+        }
+
+
+class InMemoryWebhookQueue(WebhookQueue):
+    """Process-local delivery queue with Redis list (LPUSH/BRPOP) and sorted set semantics."""
+
+    def __init__(self):
+        self.queue: Deque[str] = deque()
+        self.retry_scores: Dict[str, float] = {}
+        self._retry_heap: List[Tuple[float, str]] = []
+        self.ordering_lanes: Dict[str, Deque[str]] = {}
+        self._items_available = asyncio.Event()
+
+    async def enqueue(self, event_ids: List[str]) -> None:
+        """Push event ids to the delivery queue and wake waiting consumers."""
+        self.queue.extendleft(event_ids)
+        if event_ids:
+            self._items_available.set()
+
+    async def dequeue(self, timeout: float = 0) -> Optional[str]:
+        """Wait until an event id is available (0 waits forever) and pop the oldest."""
+        deadline = time.monotonic() + timeout if timeout else None
+        while not self.queue:
+            self._items_available.clear()
+            remaining = deadline - time.monotonic() if deadline else None
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._items_available.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+        return self.queue.pop()
+
+    async def requeue(self, event_ids: List[str]) -> None:
+        """Push event ids to the popping end of the queue and wake waiting consumers."""
+        self.queue.extend(event_ids)
+        if event_ids:
+            self._items_available.set()
+
+    async def schedule_retry(self, event_id: str, due_timestamp: float) -> None:
+        """Schedule or reschedule an event id, replacing any previous due time."""
+        self.retry_scores[event_id] = due_timestamp
+        heapq.heappush(self._retry_heap, (due_timestamp, event_id))
+
+    def _discard_stale_retries(self) -> None:
+        """Drop heap entries superseded by a reschedule or already promoted."""
+        while self._retry_heap:
+            score, event_id = self._retry_heap[0]
+            if self.retry_scores.get(event_id) == score:
+                return
+            heapq.heappop(self._retry_heap)
+
+    async def promote_due_retries(self, now: float, limit: int) -> List[str]:
+        """Move up to `limit` due retries to the delivery queue."""
+        promoted: List[str] = []
+        self._discard_stale_retries()
+        while self._retry_heap and len(promoted) < limit:
+            score, event_id = self._retry_heap[0]
+            if score > now:
+                break
+            heapq.heappop(self._retry_heap)
+            del self.retry_scores[event_id]
+            promoted.append(event_id)
+            self._discard_stale_retries()
+        await self.enqueue(promoted)
+        return promoted
+
+    async def enqueue_ordered(self, ordering_key: str, event_id: str) -> None:
+        """Append the event id to its lane, queueing it when the lane was idle."""
+        lane = self.ordering_lanes.setdefault(ordering_key, deque())
+        lane.append(event_id)
+        if len(lane) == 1:
+            await self.enqueue(event_ids=[event_id])
+
+    async def enqueue_batch(
+        self, event_ids: List[str], ordered_event_ids: List[Tuple[str, str]]
+    ) -> None:
+        """Queue the event ids and append the ordered ones to their lanes in order."""
+        await self.enqueue(event_ids=event_ids)
+        for ordering_key, event_id in ordered_event_ids:
+            await self.enqueue_ordered(ordering_key=ordering_key, event_id=event_id)
+
+    async def release_ordering_key(
+        self, ordering_key: str, event_id: str
+    ) -> Optional[str]:
+        """Pop the resolved head of the lane and queue the next event of the lane."""
+        lane = self.ordering_lanes.get(ordering_key)
+        if not lane:
+            return None
+        if lane[0] != event_id:
+            # An event expired while waiting behind the head just leaves the lane
+            if event_id in lane:
+                lane.remove(event_id)
+            return None
+        lane.popleft()
+        if not lane:
+            del self.ordering_lanes[ordering_key]
+            return None
+        await self.enqueue(event_ids=[lane[0]])
+        return lane[0]
+
+    async def get_queue_stats(self) -> QueueStatsDTO:
+        """Return depth and oldest entries of the delivery and retry queues."""
+        self._discard_stale_retries()
+        return QueueStatsDTO(
+            queue_depth=len(self.queue),
+            oldest_queue_item=self.queue[-1] if self.queue else None,
+            retry_depth=len(self.retry_scores),
+            oldest_retry_score=self._retry_heap[0][0] if self._retry_heap else None,
+        )
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    """Process-local token buckets implementing the same algorithm as token_bucket.lua."""
+
+    def __init__(self):
+        self.buckets: Dict[str, Tuple[float, float]] = {}
+        self.quota_counters: Dict[str, Tuple[int, float]] = {}
+
+    async def take_tokens(
+        self, key: str, rate: float, capacity: float, requested: float, now: float
+    ) -> bool:
+        """Refill the bucket for `key` and take `requested` tokens if available."""
+        tokens, last_refill = self.buckets.get(key, (capacity, now))
+        elapsed = max(0.0, now - last_refill)
+        tokens = min(capacity, tokens + elapsed * rate)
+        if tokens < requested:
+            return False
+        self.buckets[key] = (tokens - requested, now)
+        return True
+
+    async def lease_tokens(
+        self, key: str, rate: float, capacity: float, requested: int, now: float
+    ) -> TokenLeaseDTO:
+        """Refill the bucket for `key` and take up to `requested` whole tokens."""
+        tokens, last_refill = self.buckets.get(key, (capacity, now))
+        elapsed = max(0.0, now - last_refill)
+        tokens = min(capacity, tokens + elapsed * rate)
+        granted = min(requested, math.floor(tokens))
+        self.buckets[key] = (tokens - granted, now)
+        return TokenLeaseDTO(
+            granted=granted,
+            retry_after=(1 - (tokens - granted)) / rate if not granted else 0.0,
+        )
+
+    async def take_token_within_quota(
+        self,
+        bucket_key: str,
+        quota_key: str,
+        rate: float,
+        capacity: float,
+        daily_quota: int,
+        now: float,
+        quota_ttl: int,
+    ) -> RateLimitDecisionDTO:
+        """Take one token and count one request against the quota, as ingest_allowance.lua."""
+        used, expires_at = self.quota_counters.get(quota_key, (0, now + quota_ttl))
+        if expires_at <= now:
+            used = 0
+        if daily_quota > 0 and used >= daily_quota:
+            return RateLimitDecisionDTO(
+                allowed=False, retry_after=float(quota_ttl), reason="quota"
+            )
+        if rate > 0:
+            tokens, last_refill = self.buckets.get(bucket_key, (capacity, now))
+            elapsed = max(0.0, now - last_refill)
+            tokens = min(capacity, tokens + elapsed * rate)
+            if tokens < 1:
+                return RateLimitDecisionDTO(
+                    allowed=False, retry_after=(1 - tokens) / rate, reason="rate"
+                )
+            self.buckets[bucket_key] = (tokens - 1, now)
+        if daily_quota > 0:
+            self.quota_counters[quota_key] = (used + 1, now + quota_ttl)
+        return RateLimitDecisionDTO(allowed=True, retry_after=0.0, reason=None)
+
+
+class InMemoryReplayJobStore(ReplayJobStore):
+    """Process-local replay jobs."""
+
+    def __init__(self):
+        self.jobs: Dict[ObjectId, dict] = {}
+
+    async def insert_job(self, document: dict) -> dict:
+        """Persist a new replay job."""
+        document.setdefault("_id", ObjectId())
+        self.jobs[document["_id"]] = copy.deepcopy(document)
+        return document
+
+    async def update_job(self, job_id: ObjectId, fields: dict) -> None:
+        """Set the given fields on a replay job."""
+        if job_id in self.jobs:
+            self.jobs[job_id].update(copy.deepcopy(fields))
+
+    async def get_job(self, job_id: ObjectId) -> Optional[dict]:
+        """Retrieve a replay job by its id."""
+        job = self.jobs.get(job_id)
+        return copy.deepcopy(job) if job else None
+
+    async def claim_stale_job(
+        self, stale_before: datetime, current_time: datetime
+    ) -> Optional[dict]:
+        """Take over a stale running job."""
+        for job in self.jobs.values():
+            if (
+                job["status"] == ReplayJobStatusEnum.RUNNING
+                and normalize_value(job["updated_at"]) < stale_before
+            ):
+                job["updated_at"] = current_time
+                return copy.deepcopy(job)
+        return None
+
+
+class InMemorySigningKeyStore(SigningKeyStore):
+    """Process-local signing keys grouped by key id."""
+
+    def __init__(self):
+        self.keys: Dict[str, List[dict]] = {}
+
+    async def insert_signing_key(self, document: dict) -> dict:
+        """Persist a signing key."""
+        document.setdefault("_id", ObjectId())
+        self.keys.setdefault(document["key_id"], []).append(copy.deepcopy(document))
+        return document
+
+    async def find_signing_keys(self, key_id: str) -> List[dict]:
+        """Retrieve all secrets of a key id."""
+        return copy.deepcopy(self.keys.get(key_id, []))
+
+
+class InMemoryLatencyRollupStore(LatencyRollupStore):
+    """Process-local latency rollups keyed by bucket start, event type and stage."""
+
+    def __init__(self):
+        self.rollups: Dict[Tuple[datetime, Optional[str], str], dict] = {}
+
+    async def increment_rollups(self, rollups: List[LatencyRollupDTO]) -> None:
+        """Merge the given counts into the stored rollups, creating missing ones."""
+        for rollup in rollups:
+            key = (rollup.bucket_start, rollup.event_type, rollup.stage)
+            stored = self.rollups.setdefault(
+                key,
+                {
+                    "bucket_start": rollup.bucket_start,
+                    "event_type": rollup.event_type,
+                    "stage": rollup.stage,
+                    "count": 0,
+                    "total_seconds": 0.0,
+                    "bucket_counts": {},
+                },
+            )
+            stored["count"] += rollup.count
+            stored["total_seconds"] += rollup.total_seconds
+            for index, count in rollup.bucket_counts.items():
+                bucket_counts = stored["bucket_counts"]
+                bucket_counts[str(index)] = bucket_counts.get(str(index), 0) + count
+
+    async def find_rollups(
+        self, bucket_from: datetime, bucket_to: datetime, event_type: Optional[str]
+    ) -> List[dict]:
+        """Retrieve rollups within the bucket range."""
+        return [
+            copy.deepcopy(rollup)
+            for rollup in self.rollups.values()
+            if bucket_from <= rollup["bucket_start"] < bucket_to
+            and (not event_type or rollup["event_type"] == event_type)
+        ]
+
+
+def get_live_cache_value(entries: OrderedDict, key: str) -> Optional[Any]:
+    """Return the value of a (monotonic expiry, value) cache entry unless it has expired."""
+    entry = entries.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
+
+
+def set_cache_value(
+    entries: OrderedDict, key: str, value: Any, expires_at: float
+) -> None:
+    """
+    Set a value as the newest cache entry and drop the expired entries in front of it.
+    Entries of one cache share a TTL, so they expire in insertion order.
+    """
+    entries.pop(key, None)
+    entries[key] = (expires_at, value)
+    now = time.monotonic()
+    while entries:
+        oldest_key, (oldest_expires_at, _) = next(iter(entries.items()))
+        if oldest_expires_at > now:
+            break
+        del entries[oldest_key]
+
+
+class InMemoryEventStatusCache(EventStatusCache):
+    """Process-local status views, JSON encoded like in Redis and expiring after the TTL."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        # Per event id and per idempotency key: (monotonic expiry, value), oldest first
+        self.statuses: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.event_ids: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    async def get_status(self, event_id: str) -> Optional[dict]:
+        """Return the cached status view of an event."""
+        value = get_live_cache_value(self.statuses, event_id)
+        return json.loads(value) if value else None
+
+    async def get_event_id(self, idempotency_key: str) -> Optional[str]:
+        """Return the cached event id of an idempotency key."""
+        return get_live_cache_value(self.event_ids, idempotency_key)
+
+    async def set_status(self, status_view: dict) -> None:
+        """Cache the status view and the idempotency key mapping."""
+        expires_at = time.monotonic() + self.ttl_seconds
+        set_cache_value(
+            self.statuses,
+            status_view["_id"],
+            json.dumps(status_view, default=get_json_compatible_value),
+            expires_at,
+        )
+        set_cache_value(
+            self.event_ids,
+            status_view["idempotency_key"],
+            status_view["_id"],
+            expires_at,
+        )
+
+    async def delete_statuses(self, event_ids: List[str]) -> None:
+        """Drop the cached status views."""
+        for event_id in event_ids:
+            self.statuses.pop(event_id, None)
+
+
+class InMemorySearchCountCache(SearchCountCache):
+    """Process-local search totals expiring after the TTL."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        # Per filter hash: (monotonic expiry, count), oldest first
+        self.counts: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+
+    async def get_count(self, filter_hash: str) -> Optional[int]:
+        """Return the cached total of a filter."""
+        return get_live_cache_value(self.counts, filter_hash)
+
+    async def set_count(self, filter_hash: str, count: int) -> None:
+        """Cache the total of a filter."""
+        set_cache_value(
+            self.counts, filter_hash, count, time.monotonic() + self.ttl_seconds
+        )
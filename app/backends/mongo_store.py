@@ -0,0 +1,435 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
+from pymongo.read_preferences import _ServerMode
+
+from app.backends.base import (
+    LatencyRollupStore,
+    ReplayJobStore,
+    SigningKeyStore,
+    WebhookEventStore,
+)
+from app.utils.datetime_utils import get_utc_timestamp
+from app.utils.dtos.webhooks import LatencyRollupDTO
+from app.utils.enums.webhooks import ReplayJobStatusEnum, WebhookStatusEnum
+from app.utils.exceptions.webhooks import (
+    DuplicateWebhookEventException,
+    WebhookEventException,
+)
+
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
+class MongoWebhookEventStore(WebhookEventStore):
+    """
+    Event store backed by the `webhook_events` MongoDB collection.
+
+    A store created with a secondary read preference serves analytics queries from
+    replica set secondaries, so long scans stay off the primary handling claims.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        read_preference: Optional[_ServerMode] = None,
+        write_concern: Optional[WriteConcern] = None,
+    ):
+        self.db = db
+        self.collection = self.db.get_collection(
+            name="webhook_events",
+            read_preference=read_preference,
+            write_concern=write_concern,
+        )
+
+    async def insert_event(self, document: dict) -> dict:
+        """Insert an event, translating unique index violations on the idempotency key."""
+        try:
+            result = await self.collection.insert_one(document)
+        except DuplicateKeyError as exc:
+            raise DuplicateWebhookEventException(
+                message="Idempotency key already exists", error=str(exc)
+            )
+        except PyMongoError as exc:
+            raise WebhookEventException(message="Database write failed", error=exc)
+        document["_id"] = result.inserted_id
+        return document
+
+    async def insert_events(self, documents: List[dict]) -> List[Optional[Exception]]:
+        """Insert events with one unordered insert_many, mapping write errors per document."""
+        errors: List[Optional[Exception]] = [None] * len(documents)
+        try:
+            await self.collection.insert_many(documents, ordered=False)
+        except BulkWriteError as exc:
+            for write_error in exc.details.get("writeErrors", []):
+                if write_error["code"] == DUPLICATE_KEY_ERROR_CODE:
+                    errors[write_error["index"]] = DuplicateWebhookEventException(
+                        message="Idempotency key already exists",
+                        error=write_error["errmsg"],
+                    )
+                else:
+                    errors[write_error["index"]] = WebhookEventException(
+                        message="Database write failed", error=write_error["errmsg"]
+                    )
+            # Written but not acknowledged with the requested write concern
+            if exc.details.get("writeConcernErrors"):
+                write_concern_error = WebhookEventException(
+                    message="Database write not acknowledged",
+                    error=str(exc.details["writeConcernErrors"]),
+                )
+                errors = [error or write_concern_error for error in errors]
+        except PyMongoError as exc:
+            errors = [
+                WebhookEventException(message="Database write failed", error=exc)
+            ] * len(documents)
+        return errors
+
+    async def get_event_by_idempotency_key(
+        self, idempotency_key: str
+    ) -> Optional[dict]:
+        """Retrieve a webhook event by its idempotency key."""
+        return await self.collection.find_one({"idempotency_key": idempotency_key})
+
+    async def get_event_by_id(self, event_id: ObjectId) -> Optional[dict]:
+        """Retrieve a webhook event by its id."""
+        return await self.collection.find_one({"_id": event_id})
+
+    async def claim_event(
+        self, event_id: ObjectId, current_time: datetime, locked_until: datetime
+    ) -> Optional[dict]:
+        """Lock the eligible webhook event for processing."""
+        filter_query = {
+            "_id": event_id,
+            "status": {
+                "$in": [
+                    WebhookStatusEnum.RECEIVED,
+                    WebhookStatusEnum.FAILED_TEMPORARILY,
+                ]
+            },
+            "next_retry_at": {"$lte": current_time},
+            "$and": [
+                {
+                    "$or": [
+                        {"locked_until": None},
+                        {"locked_until": {"$lte": current_time}},
+                    ]
+                },
+                # Expired events are never sent, even before they are marked expired
+                {"$or": [{"expires_at": None}, {"expires_at": {"$gt": current_time}}]},
+            ],
+        }
+        update_query = {"$set": {"locked_until": locked_until}}
+        event = await self.collection.find_one_and_update(
+            filter=filter_query,
+            update=update_query,
+            sort=[("locked_until", 1), ("received_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+        return event
+
+    async def mark_delivery_status(
+        self,
+        event_id: ObjectId,
+        log_entry: dict,
+        status: WebhookStatusEnum,
+        next_retry_at: Optional[datetime],
+        attempt_count: int,
+        finished_at: Optional[datetime] = None,
+    ) -> None:
+        """Update a webhook's delivery status and append a delivery log."""
+        filter_query = {"_id": event_id}
+        update_query = {
+            "$set": {
+                "status": status,
+                "locked_until": None,
+                "next_retry_at": next_retry_at,
+                "attempt_count": attempt_count,
+                "last_status_code": log_entry["status_code"],
+                "finished_at": finished_at,
+            },
+            "$push": {"delivery_logs": log_entry},
+        }
+        await self.collection.update_one(filter=filter_query, update=update_query)
+
+    async def set_enqueued_timestamp(
+        self, event_ids: List[ObjectId], enqueued: float
+    ) -> None:
+        """Record the enqueue time of the events with one update_many."""
+        await self.collection.update_many(
+            filter={"_id": {"$in": event_ids}},
+            update={"$set": {"stage_timestamps.enqueued": enqueued}},
+        )
+
+    async def expire_events(self, current_time: datetime, limit: int) -> List[dict]:
+        """Expire a batch of due events with one update_many over their selected ids."""
+        filter_query = {
+            "status": {
+                "$in": [
+                    WebhookStatusEnum.RECEIVED,
+                    WebhookStatusEnum.FAILED_TEMPORARILY,
+                ]
+            },
+            "expires_at": {"$lte": current_time},
+            "$or": [{"locked_until": None}, {"locked_until": {"$lte": current_time}}],
+        }
+        cursor = self.collection.find(filter_query, {"_id": 1}).limit(limit)
+        event_ids = [document["_id"] async for document in cursor]
+        if not event_ids:
+            return []
+        # The filter is repeated, so an event claimed in the meantime is left alone
+        await self.collection.update_many(
+            filter={**filter_query, "_id": {"$in": event_ids}},
+            update={
+                "$set": {
+                    "status": WebhookStatusEnum.EXPIRED,
+                    "locked_until": None,
+                    "next_retry_at": None,
+                    "finished_at": current_time,
+                }
+            },
+        )
+        cursor = self.collection.find(
+            {"_id": {"$in": event_ids}, "status": WebhookStatusEnum.EXPIRED},
+            {"_id": 1, "ordering_key": 1},
+        )
+        return await cursor.to_list(length=None)
+
+    async def find_event_ids(
+        self, filter_dict: dict, after_id: Optional[ObjectId], limit: int
+    ) -> List[ObjectId]:
+        """Retrieve the next page of matching event ids using keyset pagination on _id."""
+        if after_id is not None:
+            filter_dict = {**filter_dict, "_id": {"$gt": after_id}}
+        cursor = (
+            self.collection.find(filter_dict, {"_id": 1}).sort("_id", 1).limit(limit)
+        )
+        return [document["_id"] async for document in cursor]
+
+    async def release_event_locks(self, event_ids: List[ObjectId]) -> int:
+        """Unlock the pending events among `event_ids` with one update_many."""
+        result = await self.collection.update_many(
+            filter={
+                "_id": {"$in": event_ids},
+                "status": {
+                    "$in": [
+                        WebhookStatusEnum.RECEIVED,
+                        WebhookStatusEnum.FAILED_TEMPORARILY,
+                    ]
+                },
+                "locked_until": {"$ne": None},
+            },
+            update={"$set": {"locked_until": None}},
+        )
+        return result.modified_count
+
+    async def reset_events_for_redelivery(
+        self, event_ids: List[ObjectId], current_time: datetime
+    ) -> List[dict]:
+        """Reset the permanently failed events among `event_ids` with one update_many."""
+        replayed = get_utc_timestamp(current_time)
+        await self.collection.update_many(
+            filter={
+                "_id": {"$in": event_ids},
+                "status": WebhookStatusEnum.FAILED_PERMANENTLY,
+            },
+            update={
+                "$set": {
+                    "status": WebhookStatusEnum.RECEIVED,
+                    "attempt_count": 0,
+                    "next_retry_at": current_time,
+                    "locked_until": None,
+                    "finished_at": None,
+                    # A replay is an explicit request to deliver, however late
+                    "expires_at": None,
+                    # Replayed attempts are measured from the replay, not the receipt
+                    "stage_timestamps.replayed": replayed,
+                },
+                "$inc": {"replay_count": 1},
+            },
+        )
+        # The replay timestamp tells the events this reset apart from ones that left
+        # the dead letters between the id query and the update
+        cursor = self.collection.find(
+            {"_id": {"$in": event_ids}, "stage_timestamps.replayed": replayed},
+            {"_id": 1, "ordering_key": 1},
+        )
+        return await cursor.to_list(length=None)
+
+    async def delete_events(self, filter_dict: dict) -> int:
+        """Delete webhook events matching the filter."""
+        result = await self.collection.delete_many(filter=filter_dict)
+        return result.deleted_count
+
+    async def count_events(self, filter_dict: dict) -> int:
+        """Count webhook events matching the filter."""
+        return await self.collection.count_documents(filter=filter_dict)
+
+    async def estimate_events_count(self) -> int:
+        """Return the event count from the collection metadata."""
+        return await self.collection.estimated_document_count()
+
+    async def find_events(
+        self, filter_dict: dict, offset: int = 0, limit: Optional[int] = None
+    ) -> List[dict]:
+        """Retrieve webhook events matching the filter."""
+        cursor = self.collection.find(filter_dict)
+        if offset:
+            cursor = cursor.skip(offset)
+        if limit:
+            cursor = cursor.limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def iterate_events(
+        self, filter_dict: dict, batch_size: int
+    ) -> AsyncIterator[dict]:
+        """Stream matching events from a cursor fetching `batch_size` documents at a time."""
+        cursor = self.collection.find(filter_dict).batch_size(batch_size)
+        try:
+            async for document in cursor:
+                yield document
+        finally:
+            await cursor.close()
+
+    async def get_aggregates(self, filter_dict: dict) -> dict:
+        """Compute aggregated counts and hourly histogram for filtered events."""
+        pipeline = [
+            {"$match": filter_dict},
+            {
+                "$facet": {
+                    "count_by_status": [
+                        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+                    ],
+                    "count_by_event_type": [
+                        {"$group": {"_id": "$event_type", "count": {"$sum": 1}}}
+                    ],
+                    "hourly_histogram": [
+                        {
+                            "$group": {
+                                "_id": {
+                                    "$dateTrunc": {
+                                        "date": "$received_at",
+                                        "unit": "hour",
+                                    }
+                                },
+                                "count": {"$sum": 1},
+                            }
+                        },
+                        {"$sort": {"_id": 1}},
+                    ],
+                }
+            },
+        ]
+
+        agg_cursor = self.collection.aggregate(pipeline)
+        agg_result = await agg_cursor.to_list(length=1)
+        agg_data = agg_result[0] if agg_result else {}
+
+        for doc in agg_data.get("hourly_histogram", []):
+            doc["_id"] = doc["_id"].isoformat()
+        return agg_data
+
+
+class MongoReplayJobStore(ReplayJobStore):
+    """Replay jobs backed by the `webhook_replay_jobs` MongoDB collection."""
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = self.db.get_collection(name="webhook_replay_jobs")
+
+    async def insert_job(self, document: dict) -> dict:
+        """Persist a new replay job."""
+        result = await self.collection.insert_one(document)
+        document["_id"] = result.inserted_id
+        return document
+
+    async def update_job(self, job_id: ObjectId, fields: dict) -> None:
+        """Set the given fields on a replay job."""
+        await self.collection.update_one(
+            filter={"_id": job_id}, update={"$set": fields}
+        )
+
+    async def get_job(self, job_id: ObjectId) -> Optional[dict]:
+        """Retrieve a replay job by its id."""
+        return await self.collection.find_one({"_id": job_id})
+
+    async def claim_stale_job(
+        self, stale_before: datetime, current_time: datetime
+    ) -> Optional[dict]:
+        """Take over a stale running job with one find_one_and_update."""
+        return await self.collection.find_one_and_update(
+            filter={
+                "status": ReplayJobStatusEnum.RUNNING,
+                "updated_at": {"$lt": stale_before},
+            },
+            update={"$set": {"updated_at": current_time}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+
+class MongoSigningKeyStore(SigningKeyStore):
+    """Signing keys backed by the `webhook_signing_keys` MongoDB collection."""
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = self.db.get_collection(name="webhook_signing_keys")
+
+    async def insert_signing_key(self, document: dict) -> dict:
+        """Persist a signing key."""
+        result = await self.collection.insert_one(document)
+        document["_id"] = result.inserted_id
+        return document
+
+    async def find_signing_keys(self, key_id: str) -> List[dict]:
+        """Retrieve all secrets of a key id."""
+        return await self.collection.find({"key_id": key_id}).to_list(length=None)
+
+
+class MongoLatencyRollupStore(LatencyRollupStore):
+    """Latency rollups backed by the `webhook_latency_rollups` MongoDB collection."""
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = self.db.get_collection(name="webhook_latency_rollups")
+
+    async def increment_rollups(self, rollups: List[LatencyRollupDTO]) -> None:
+        """Upsert every rollup with $inc in a single unordered bulk write."""
+        if not rollups:
+            return
+        operations = [
+            UpdateOne(
+                filter={
+                    "bucket_start": rollup.bucket_start,
+                    "event_type": rollup.event_type,
+                    "stage": rollup.stage,
+                },
+                update={
+                    "$inc": {
+                        "count": rollup.count,
+                        "total_seconds": rollup.total_seconds,
+                        **{
+                            f"bucket_counts.{index}": count
+                            for index, count in rollup.bucket_counts.items()
+                        },
+                    }
+                },
+                upsert=True,
+            )
+            for rollup in rollups
+        ]
+        await self.collection.bulk_write(operations, ordered=False)
+
+    async def find_rollups(
+        self, bucket_from: datetime, bucket_to: datetime, event_type: Optional[str]
+    ) -> List[dict]:
+        """Retrieve rollups within the bucket range."""
+        filter_query = {"bucket_start": {"$gte": bucket_from, "$lt": bucket_to}}
+        if event_type:
+            filter_query["event_type"] = event_type
+        cursor = self.collection.find(
+            filter_query,
+            {"_id": 0, "stage": 1, "count": 1, "total_seconds": 1, "bucket_counts": 1},
+        )
+        return await cursor.to_list(length=None)
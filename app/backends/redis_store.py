@@ -0,0 +1,260 @@
+import json
+from typing import List, Optional, Tuple
+
+from redis.exceptions import ConnectionError, ResponseError
+
+from app.backends.base import (
+    EventStatusCache,
+    SearchCountCache,
+    TokenBucketStore,
+    WebhookQueue,
+)
+from app.integrations.redis_client import RedisService
+from app.scripts import load_lua_script
+from app.utils.constants.webhooks import (
+    WEBHOOK_EVENT_IDEMPOTENCY_KEY_PREFIX,
+    WEBHOOK_EVENT_STATUS_KEY_PREFIX,
+    WEBHOOK_ORDERING_LANE_KEY_PREFIX,
+    WEBHOOK_QUEUE_KEY,
+    WEBHOOK_RETRY_KEY,
+    WEBHOOK_SEARCH_COUNT_KEY_PREFIX,
+)
+from app.utils.dtos.webhooks import QueueStatsDTO, RateLimitDecisionDTO, TokenLeaseDTO
+from app.utils.exceptions.core import UtilsException
+from app.utils.serializers import get_json_compatible_value
+
+
+class RedisWebhookQueue(WebhookQueue):
+    """Delivery queue backed by a Redis list and a Redis sorted set of retries."""
+
+    def __init__(self, redis_service: RedisService):
+        self.redis_service = redis_service
+
+    async def enqueue(self, event_ids: List[str]) -> None:
+        """Push event ids to the delivery queue in one round trip."""
+        if event_ids:
+            await self.redis_service.left_push_event_to_queue(
+                WEBHOOK_QUEUE_KEY, *event_ids
+            )
+
+    async def dequeue(self, timeout: float = 0) -> Optional[str]:
+        """Block until an event id is available and pop it."""
+        result = await self.redis_service.brpop_event_from_queue(
+            key=WEBHOOK_QUEUE_KEY, timeout=timeout
+        )
+        if not result:
+            return None
+        _, event_id = result
+        return event_id.decode() if isinstance(event_id, bytes) else event_id
+
+    async def requeue(self, event_ids: List[str]) -> None:
+        """Push event ids to the popping end of the queue in one round trip."""
+        if event_ids:
+            await self.redis_service.right_push_event_to_queue(
+                WEBHOOK_QUEUE_KEY, *event_ids
+            )
+
+    async def schedule_retry(self, event_id: str, due_timestamp: float) -> None:
+        """Add the event id to the retry sorted set scored by its due time."""
+        await self.redis_service.zadd_event_to_queue(
+            name=WEBHOOK_RETRY_KEY, mapping={event_id: due_timestamp}
+        )
+
+    async def promote_due_retries(self, now: float, limit: int) -> List[str]:
+        """Move due retries to the delivery queue atomically."""
+        event_ids = await self.redis_service.move_due_events_to_queue(
+            zset_key=WEBHOOK_RETRY_KEY,
+            queue_key=WEBHOOK_QUEUE_KEY,
+            now=now,
+            limit=limit,
+        )
+        return [
+            event_id.decode() if isinstance(event_id, bytes) else event_id
+            for event_id in event_ids
+        ]
+
+    async def enqueue_ordered(self, ordering_key: str, event_id: str) -> None:
+        """Append the event id to its ordering lane in one atomic round trip."""
+        await self.redis_service.push_event_to_ordering_lane(
+            lane_key=f"{WEBHOOK_ORDERING_LANE_KEY_PREFIX}{ordering_key}",
+            queue_key=WEBHOOK_QUEUE_KEY,
+            event_id=event_id,
+        )
+
+    async def enqueue_batch(
+        self, event_ids: List[str], ordered_event_ids: List[Tuple[str, str]]
+    ) -> None:
+        """Push to the queue and the ordering lanes in one pipelined round trip."""
+        await self.redis_service.push_events_to_queue_and_lanes(
+            queue_key=WEBHOOK_QUEUE_KEY,
+            event_ids=event_ids,
+            lane_event_ids=[
+                (f"{WEBHOOK_ORDERING_LANE_KEY_PREFIX}{ordering_key}", event_id)
+                for ordering_key, event_id in ordered_event_ids
+            ],
+        )
+
+    async def release_ordering_key(
+        self, ordering_key: str, event_id: str
+    ) -> Optional[str]:
+        """Release the next event of the lane in one atomic round trip."""
+        next_event_id = await self.redis_service.pop_event_from_ordering_lane(
+            lane_key=f"{WEBHOOK_ORDERING_LANE_KEY_PREFIX}{ordering_key}",
+            queue_key=WEBHOOK_QUEUE_KEY,
+            event_id=event_id,
+        )
+        if isinstance(next_event_id, bytes):
+            return next_event_id.decode()
+        return next_event_id or None
+
+    async def get_queue_stats(self) -> QueueStatsDTO:
+        """Return depth and oldest entries of the delivery and retry queues."""
+        return await self.redis_service.get_queue_stats(
+            queue_key=WEBHOOK_QUEUE_KEY, retry_key=WEBHOOK_RETRY_KEY
+        )
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """Token bucket state kept in Redis hashes and updated by the token bucket Lua script."""
+
+    def __init__(self, redis_service: RedisService):
+        self.redis_service = redis_service
+
+        self._script = self.redis_service.redis_client.register_script(
+            script=load_lua_script(file_name="token_bucket.lua")
+        )
+        self._lease_script = self.redis_service.redis_client.register_script(
+            script=load_lua_script(file_name="token_bucket_lease.lua")
+        )
+        self._ingest_allowance_script = self.redis_service.redis_client.register_script(
+            script=load_lua_script(file_name="ingest_allowance.lua")
+        )
+
+    async def take_tokens(
+        self, key: str, rate: float, capacity: float, requested: float, now: float
+    ) -> bool:
+        """Run the token bucket script for `key`."""
+        try:
+            result = await self._script(
+                keys=[key],
+                args=[rate, capacity, requested, now],
+            )
+            return bool(result)
+        except ConnectionError:
+            raise UtilsException(
+                message="Rate limiting service unavailable due to connection error",
+                error="service-unavailable",
+            )
+        except ResponseError as exc:
+            raise UtilsException(message="Error reading script.", error=str(exc))
+
+    async def lease_tokens(
+        self, key: str, rate: float, capacity: float, requested: int, now: float
+    ) -> TokenLeaseDTO:
+        """Run the token lease script for `key`."""
+        try:
+            granted, retry_after = await self._lease_script(
+                keys=[key],
+                args=[rate, capacity, requested, now],
+            )
+            return TokenLeaseDTO(granted=int(granted), retry_after=float(retry_after))
+        except ConnectionError:
+            raise UtilsException(
+                message="Rate limiting service unavailable due to connection error",
+                error="service-unavailable",
+            )
+        except ResponseError as exc:
+            raise UtilsException(message="Error reading script.", error=str(exc))
+
+    async def take_token_within_quota(
+        self,
+        bucket_key: str,
+        quota_key: str,
+        rate: float,
+        capacity: float,
+        daily_quota: int,
+        now: float,
+        quota_ttl: int,
+    ) -> RateLimitDecisionDTO:
+        """Run the ingest allowance script, checking rate and quota in one round trip."""
+        try:
+            allowed, retry_after, reason = await self._ingest_allowance_script(
+                keys=[bucket_key, quota_key],
+                args=[rate, capacity, now, daily_quota, quota_ttl],
+            )
+        except ConnectionError:
+            raise UtilsException(
+                message="Rate limiting service unavailable due to connection error",
+                error="service-unavailable",
+            )
+        except ResponseError as exc:
+            raise UtilsException(message="Error reading script.", error=str(exc))
+        reason = reason.decode() if isinstance(reason, bytes) else reason
+        return RateLimitDecisionDTO(
+            allowed=int(allowed) == 1,
+            retry_after=float(retry_after),
+            reason=reason or None,
+        )
+
+
+class RedisEventStatusCache(EventStatusCache):
+    """Event status views cached as JSON strings under keys expiring after the TTL."""
+
+    def __init__(self, redis_service: RedisService, ttl_seconds: float):
+        self.redis_service = redis_service
+        self.ttl_seconds = ttl_seconds
+
+    async def get_status(self, event_id: str) -> Optional[dict]:
+        """Fetch and decode the cached status view of an event."""
+        value = await self.redis_service.get_value(
+            key=f"{WEBHOOK_EVENT_STATUS_KEY_PREFIX}{event_id}"
+        )
+        return json.loads(value) if value else None
+
+    async def get_event_id(self, idempotency_key: str) -> Optional[str]:
+        """Fetch the cached event id of an idempotency key."""
+        return await self.redis_service.get_value(
+            key=f"{WEBHOOK_EVENT_IDEMPOTENCY_KEY_PREFIX}{idempotency_key}"
+        )
+
+    async def set_status(self, status_view: dict) -> None:
+        """Write the status view and the idempotency key mapping in one round trip."""
+        await self.redis_service.set_values_with_ttl(
+            mapping={
+                f"{WEBHOOK_EVENT_STATUS_KEY_PREFIX}{status_view['_id']}": json.dumps(
+                    status_view, default=get_json_compatible_value
+                ),
+                f"{WEBHOOK_EVENT_IDEMPOTENCY_KEY_PREFIX}{status_view['idempotency_key']}": (
+                    status_view["_id"]
+                ),
+            },
+            ttl_seconds=self.ttl_seconds,
+        )
+
+    async def delete_statuses(self, event_ids: List[str]) -> None:
+        """Delete the status views, leaving idempotency key mappings to expire."""
+        await self.redis_service.delete_keys(
+            *(f"{WEBHOOK_EVENT_STATUS_KEY_PREFIX}{event_id}" for event_id in event_ids)
+        )
+
+
+class RedisSearchCountCache(SearchCountCache):
+    """Search totals shared by all API processes, under keys expiring after the TTL."""
+
+    def __init__(self, redis_service: RedisService, ttl_seconds: float):
+        self.redis_service = redis_service
+        self.ttl_seconds = ttl_seconds
+
+    async def get_count(self, filter_hash: str) -> Optional[int]:
+        """Fetch the cached total of a filter."""
+        value = await self.redis_service.get_value(
+            key=f"{WEBHOOK_SEARCH_COUNT_KEY_PREFIX}{filter_hash}"
+        )
+        return int(value) if value is not None else None
+
+    async def set_count(self, filter_hash: str, count: int) -> None:
+        """Cache the total of a filter."""
+        await self.redis_service.set_values_with_ttl(
+            mapping={f"{WEBHOOK_SEARCH_COUNT_KEY_PREFIX}{filter_hash}": str(count)},
+            ttl_seconds=self.ttl_seconds,
+        )
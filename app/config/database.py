@@ -2,9 +2,19 @@ import logging
 from typing import Optional
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import WriteConcern
 from pymongo.errors import PyMongoError
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+    _ServerMode,
+)
 
 from app.config.settings import settings
+from app.utils.enums.core import MongoReadPreferenceEnum
 
 logger = logging.getLogger(__name__)
 
@@ -38,3 +48,25 @@ async def close_db_client() -> None:
         client = None
         db = None
         logger.info("MongoDB client closed successfully")
+
+
+def get_analytics_read_preference() -> _ServerMode:
+    """Return the read preference of analytics queries, bounded by the max staleness."""
+    if settings.ANALYTICS_READ_PREFERENCE == MongoReadPreferenceEnum.PRIMARY:
+        return Primary()
+    read_preference_class = {
+        MongoReadPreferenceEnum.PRIMARY_PREFERRED: PrimaryPreferred,
+        MongoReadPreferenceEnum.SECONDARY: Secondary,
+        MongoReadPreferenceEnum.SECONDARY_PREFERRED: SecondaryPreferred,
+        MongoReadPreferenceEnum.NEAREST: Nearest,
+    }[settings.ANALYTICS_READ_PREFERENCE]
+    return read_preference_class(max_staleness=settings.ANALYTICS_MAX_STALENESS_SECONDS)
+
+
+def get_event_write_concern() -> WriteConcern:
+    """Return the write concern of event writes, e.g. w=1 or w=majority with j=true."""
+    write_concern = settings.MONGO_WRITE_CONCERN
+    return WriteConcern(
+        w=int(write_concern) if write_concern.isdigit() else write_concern,
+        j=settings.MONGO_WRITE_JOURNAL,
+    )
@@ -1,4 +1,62 @@
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
 from app.dependencies.db import get_db
+from app.utils.constants.webhooks import LATENCY_ROLLUP_RETENTION_DAYS
+
+logger = logging.getLogger(__name__)
+
+# Required indexes per collection as (keys, options). Any change here changes the spec
+# fingerprint, which makes the next startup or migrate run create the indexes again.
+INDEX_SPECS: Dict[str, List[Tuple[List[Tuple[str, int]], dict]]] = {
+    "webhook_events": [
+        ([("idempotency_key", 1)], {"unique": True}),
+        (
+            [
+                ("status", 1),
+                ("next_retry_at", 1),
+                ("locked_until", 1),
+                ("received_at", 1),
+            ],
+            {},
+        ),
+        # Dead-letter listing and keyset-paginated replay batches
+        ([("status", 1), ("_id", 1)], {}),
+        # Selecting finished events past retention for archival
+        ([("finished_at", 1)], {}),
+        # Selecting pending events past their expiry
+        ([("expires_at", 1)], {}),
+        # Search by promoted payload attributes, whatever their names
+        ([("attrs.$**", 1)], {}),
+    ],
+    "webhook_latency_rollups": [
+        # Rollup identity, expired past the rollup retention
+        ([("bucket_start", 1), ("event_type", 1), ("stage", 1)], {"unique": True}),
+        (
+            [("bucket_start", 1)],
+            {"expireAfterSeconds": LATENCY_ROLLUP_RETENTION_DAYS * 24 * 60 * 60},
+        ),
+    ],
+    "webhook_replay_jobs": [
+        # Selecting running jobs that stopped recording progress, to resume them
+        ([("status", 1), ("updated_at", 1)], {}),
+    ],
+    "webhook_signing_keys": [
+        # Signing keys by the key id producers send with each request
+        ([("key_id", 1)], {}),
+    ],
+}
+
+SCHEMA_STATE_COLLECTION = "webhook_schema_state"
+INDEX_STATE_ID = "indexes"
+
+
+def get_index_spec_fingerprint() -> str:
+    """Return a stable hash of the index specs."""
+    return hashlib.sha256(json.dumps(INDEX_SPECS, sort_keys=True).encode()).hexdigest()
 
 
 class CreateDbCollectionIndexes:
@@ -6,23 +64,33 @@ class CreateDbCollectionIndexes:
     def __init__(self):
         self.db = get_db()
 
-    async def create_webhook_events_index(self):
-        """Createing required MongoDB indexes for specific collection by retrieving it."""
-        collection = self.db.get_collection(name="webhook_events")
-        await collection.create_index(
-            "idempotency_key",
-            unique=True,
+    async def create_all_collections_indexes(self):
+        """Create required MongoDB indexes for all collections and record their fingerprint."""
+        for collection_name, index_specs in INDEX_SPECS.items():
+            collection = self.db.get_collection(name=collection_name)
+            for keys, options in index_specs:
+                await collection.create_index(keys, **options)
+        await self.db.get_collection(name=SCHEMA_STATE_COLLECTION).update_one(
+            filter={"_id": INDEX_STATE_ID},
+            update={
+                "$set": {
+                    "fingerprint": get_index_spec_fingerprint(),
+                    "updated_at": datetime.now(tz=timezone.utc),
+                }
+            },
+            upsert=True,
         )
 
-        await collection.create_index(
-            [
-                ("status", 1),
-                ("next_retry_at", 1),
-                ("locked_until", 1),
-                ("received_at", 1),
-            ]
+    async def ensure_collections_indexes(self) -> bool:
+        """
+        Create the indexes only when the spec changed since they were last created, so a
+        regular boot costs one read. Returns whether indexes were created.
+        """
+        state = await self.db.get_collection(name=SCHEMA_STATE_COLLECTION).find_one(
+            {"_id": INDEX_STATE_ID}
         )
-
-    async def create_all_collections_indexes(self):
-        """Create required MongoDB indexes for all collections."""
-        await self.create_webhook_events_index()
+        if state and state.get("fingerprint") == get_index_spec_fingerprint():
+            return False
+        logger.info("Index spec changed, creating MongoDB indexes")
+        await self.create_all_collections_indexes()
+        return True
@@ -1,8 +1,10 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.utils.dtos.core import CorsAllowedSettingsDTO
+from app.utils.enums.core import MongoReadPreferenceEnum, StorageBackendEnum
+from app.utils.enums.webhooks import RetryJitterEnum, SearchCountStrategyEnum
 
 
 class Settings(BaseSettings):
@@ -30,23 +32,130 @@ class Settings(BaseSettings):
     MONGO_URL: str
     MONGO_DB_NAME: str
 
+    # Whether the API checks the index spec on startup and creates changed indexes. With
+    # false, indexes are only created by the `python -m app.migrate` deploy step.
+    CREATE_INDEXES_ON_STARTUP: bool = True
+
+    # Read preference of the search, export, aggregate and dead-letter listing queries.
+    # Claims and status writes always use the primary. A max staleness of -1 accepts any
+    # replication lag, MongoDB requires at least 90 seconds otherwise.
+    ANALYTICS_READ_PREFERENCE: MongoReadPreferenceEnum = (
+        MongoReadPreferenceEnum.SECONDARY_PREFERRED
+    )
+    ANALYTICS_MAX_STALENESS_SECONDS: int = -1
+
+    # Write concern of event writes, "1" or "majority", optionally waiting for the journal
+    MONGO_WRITE_CONCERN: str = "1"
+    MONGO_WRITE_JOURNAL: Optional[bool] = None
+
     # HMAC auth settings
     SECRET_KEY: str
     TIMESTAMP_TOLERANCE_SECONDS: int
 
+    # Per-producer ingest limits keyed by signing key id, 0 disables a limit. Overrides
+    # per key id, e.g. {"acme": {"rate": 50, "burst": 100, "daily_quota": 1000000}}
+    INGEST_RATE_LIMIT: float = 0
+    INGEST_BURST_CAPACITY: int = 0
+    INGEST_DAILY_QUOTA: int = 0
+    INGEST_PRODUCER_LIMITS: Dict[str, Dict[str, float]] = {}
+
+    # Dotted payload path of the ordering key, e.g. "order.id". Events sharing an ordering
+    # key are delivered in order. An X-Ordering-Key header takes precedence.
+    ORDERING_KEY_PATH: Optional[str] = None
+
+    # Payload attributes promoted into the indexed `attrs` of events, per event type as
+    # attribute name -> dotted payload path, e.g. {"order_created": {"order_id": "order.id"}}.
+    # Search filters on them with `attr.<name>=value`.
+    EVENT_TYPE_ATTRIBUTE_PATHS: Dict[str, Dict[str, str]] = {}
+
+    # Event expiry, 0 never expires. Pending events past their expiry are marked expired
+    # without being sent. An X-Expires-At header takes precedence over the TTL of the
+    # event type, e.g. {"price_updated": 300}, which takes precedence over the default.
+    EVENT_TTL_SECONDS: float = 0
+    EVENT_TYPE_TTL_SECONDS: Dict[str, float] = {}
+
+    # Ingest load shedding, 0 disables a threshold. While the delivery queue is deeper or
+    # its oldest entry older than a threshold, ingest answers 503 with Retry-After, except
+    # for exempt signing key ids and event types.
+    INGEST_SHED_QUEUE_DEPTH: int = 0
+    INGEST_SHED_OLDEST_AGE_SECONDS: float = 0
+    INGEST_SHED_RETRY_AFTER_SECONDS: float = 5
+    INGEST_SHED_EXEMPT_KEY_IDS: List[str] = []
+    INGEST_SHED_EXEMPT_EVENT_TYPES: List[str] = []
+
+    # Group commit ingest. Concurrent requests are collected for up to the window and
+    # written with one insert_many and one pipelined enqueue, each still acknowledged
+    # on its own. Trades up to the window of latency for bulk insert throughput.
+    INGEST_GROUP_COMMIT: bool = False
+    INGEST_GROUP_COMMIT_WINDOW_MS: float = 2
+    INGEST_GROUP_COMMIT_MAX_EVENTS: int = 500
+
     # Redis configurations
     REDIS_HOST: str
     REDIS_PORT: int
 
+    # Storage backend config. The memory backend keeps events and queues in process and
+    # requires the delivery worker to run inside the API process.
+    STORAGE_BACKEND: StorageBackendEnum = StorageBackendEnum.MONGO_REDIS
+    RUN_DELIVERY_WORKER_IN_API: bool = False
+
     # URL configurations
     BE_BASE_URL: str
 
     # Concurrency config
     CONCURRENT_WORKERS: int
+    # On shutdown, in-flight deliveries get this long to finish. Claimed events that are
+    # still unfinished then are unlocked and pushed back to the head of the queue.
+    WORKER_DRAIN_TIMEOUT_SECONDS: float = 10
+
+    # Retry backoff policy. Delays grow exponentially from the base delay up to the max
+    # delay, randomized by the jitter strategy. A deadline of 0 retries until the max
+    # attempts are used up. Overrides per destination host[:port], e.g.
+    # {"partner.example.com": {"jitter": "decorrelated", "max_delay": 600}}
+    RETRY_BACKOFF_JITTER: RetryJitterEnum = RetryJitterEnum.FULL
+    RETRY_BASE_DELAY_SECONDS: float = 1
+    RETRY_MAX_DELAY_SECONDS: float = 300
+    RETRY_DELIVERY_DEADLINE_SECONDS: float = 0
+    DESTINATION_RETRY_POLICIES: Dict[str, Dict[str, Any]] = {}
+
+    # Destinations receiving events in batches, one JSON array per request, keyed by
+    # host[:port], e.g. {"partner.example.com": {"max_events": 50, "max_bytes": 524288,
+    # "linger_ms": 20}}. Omitted limits use the defaults.
+    DESTINATION_BATCH_DELIVERY: Dict[str, Dict[str, float]] = {}
+
+    # Adaptive delivery timeouts. Each worker derives the timeout of a destination from
+    # its recent latency, as the percentile times the factor clamped to the bounds. The
+    # upper bound is capped at 25 seconds, 5 below the 30 second claim lock of an event.
+    ADAPTIVE_DELIVERY_TIMEOUT: bool = False
+    DELIVERY_TIMEOUT_PERCENTILE: float = 99
+    DELIVERY_TIMEOUT_FACTOR: float = 3
+    DELIVERY_TIMEOUT_MIN_SECONDS: float = 0.5
+    DELIVERY_TIMEOUT_MAX_SECONDS: float = 20
+
+    # Metrics config
+    WORKER_METRICS_PORT: int = 9100
+
+    # Worker admin server, off unless a port or a Unix socket path is set. It can change
+    # the worker at runtime, so it listens on localhost unless told otherwise.
+    WORKER_ADMIN_PORT: int = 0
+    WORKER_ADMIN_HOST: str = "127.0.0.1"
+    WORKER_ADMIN_SOCKET: Optional[str] = None
+
+    # Retention config. Finished events older than the retention period are archived
+    # (when an archive directory is set) or deleted, but never while their idempotency
+    # key is still within the idempotency window. A retention of 0 keeps events forever.
+    FINISHED_EVENT_RETENTION_DAYS: int = 0
+    IDEMPOTENCY_WINDOW_DAYS: int = 7
+    EVENT_ARCHIVE_DIR: Optional[str] = None
+    RUN_EVENT_ARCHIVER: bool = False
 
     # Pagination settings
     PAGE_SIZE: int
     DEFAULT_PAGE: int
+    # How search totals are counted unless a request picks a strategy. Estimated counts
+    # use the collection metadata for unfiltered searches and fall back to cached counts.
+    SEARCH_COUNT_STRATEGY: SearchCountStrategyEnum = SearchCountStrategyEnum.EXACT
+    SEARCH_COUNT_CACHE_TTL_SECONDS: int = 30
 
     @property
     def get_cors_allowed_settings(self) -> CorsAllowedSettingsDTO:
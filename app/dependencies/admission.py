@@ -0,0 +1,156 @@
+import logging
+import math
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from bson import ObjectId
+from fastapi import Depends, status
+from fastapi.exceptions import HTTPException
+
+from app.config.settings import settings
+from app.dependencies.auth import verify_webhook_signature
+from app.dependencies.backends import get_webhook_queue
+from app.dependencies.payload import get_webhook_payload
+from app.integrations.metrics import RATE_LIMITER_DECISIONS
+from app.utils.constants.webhooks import INGEST_ADMISSION_STALE_AFTER_SECONDS
+from app.utils.dtos.webhooks import QueueStatsDTO
+
+logger = logging.getLogger(__name__)
+
+
+class IngestAdmissionController:
+    """
+    Sheds ingest load while the delivery queue is over its depth or lag thresholds.
+
+    Requests only read the queue pressure sampled in the background, so admission never
+    costs a Redis round trip. A sample older than the stale limit admits everything,
+    since shedding on outdated pressure would reject traffic for no reason.
+    """
+
+    def __init__(self, name: str = "ingest_admission"):
+        self.name = name
+        self.queue_depth = 0
+        self.oldest_item_age = 0.0
+        self.sampled_at: Optional[float] = None
+        self._admitted_counter = RATE_LIMITER_DECISIONS.labels(
+            limiter=name, decision="allowed"
+        )
+        self._shed_counter = RATE_LIMITER_DECISIONS.labels(
+            limiter=name, decision="denied"
+        )
+
+    @property
+    def is_enabled(self) -> bool:
+        """Return whether any shedding threshold is configured."""
+        return bool(
+            settings.INGEST_SHED_QUEUE_DEPTH or settings.INGEST_SHED_OLDEST_AGE_SECONDS
+        )
+
+    def update(self, queue_stats: QueueStatsDTO, now: float) -> None:
+        """Store a queue pressure sample."""
+        self.queue_depth = queue_stats.queue_depth
+        # Queue entries are ObjectIds, so the oldest entry's age is derived from the id's
+        # embedded creation time
+        self.oldest_item_age = (
+            max(
+                0.0,
+                now
+                - ObjectId(queue_stats.oldest_queue_item).generation_time.timestamp(),
+            )
+            if queue_stats.oldest_queue_item
+            else 0.0
+        )
+        self.sampled_at = time.monotonic()
+
+    async def refresh(self) -> None:
+        """Sample the delivery queue pressure."""
+        queue_stats = await get_webhook_queue().get_queue_stats()
+        self.update(
+            queue_stats=queue_stats, now=datetime.now(tz=timezone.utc).timestamp()
+        )
+
+    def is_overloaded(self) -> bool:
+        """Return whether the last fresh sample exceeds a configured threshold."""
+        if (
+            self.sampled_at is None
+            or time.monotonic() - self.sampled_at > INGEST_ADMISSION_STALE_AFTER_SECONDS
+        ):
+            return False
+        return bool(
+            settings.INGEST_SHED_QUEUE_DEPTH
+            and self.queue_depth >= settings.INGEST_SHED_QUEUE_DEPTH
+        ) or bool(
+            settings.INGEST_SHED_OLDEST_AGE_SECONDS
+            and self.oldest_item_age >= settings.INGEST_SHED_OLDEST_AGE_SECONDS
+        )
+
+    def is_shedding(self, producer_id: str) -> bool:
+        """Return whether the queue is overloaded and the producer's key id is not exempt."""
+        return (
+            self.is_overloaded()
+            and producer_id not in settings.INGEST_SHED_EXEMPT_KEY_IDS
+        )
+
+    def record_decision(self, admitted: bool) -> None:
+        """Count one admission decision."""
+        if admitted:
+            self._admitted_counter.inc()
+        else:
+            self._shed_counter.inc()
+
+
+def get_shed_exception() -> HTTPException:
+    """Build the 503 answered to shed ingest requests."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Webhook delivery is overloaded! Please try again later.",
+        headers={
+            "Retry-After": str(
+                max(1, math.ceil(settings.INGEST_SHED_RETRY_AFTER_SECONDS))
+            )
+        },
+    )
+
+
+class IngestAdmissionDependency:
+    """
+    FastAPI dependency rejecting non-exempt ingest requests while the queue is overloaded.
+    Declared before the producer limits and the payload, so shed requests neither consume
+    the producer's rate or quota nor get parsed.
+    """
+
+    def __init__(self, controller: IngestAdmissionController):
+        self.controller = controller
+
+    async def __call__(
+        self, producer_id: str = Depends(verify_webhook_signature)
+    ) -> bool:
+        """
+        Raise 503 with Retry-After when the request is shed. Returns whether admission
+        still depends on the event type, which is only known once the payload is parsed.
+        """
+        if not self.controller.is_shedding(producer_id=producer_id):
+            self.controller.record_decision(admitted=True)
+            return False
+        if settings.INGEST_SHED_EXEMPT_EVENT_TYPES:
+            return True
+        self.controller.record_decision(admitted=False)
+        raise get_shed_exception()
+
+
+ingest_admission_controller = IngestAdmissionController()
+ingest_admission = IngestAdmissionDependency(controller=ingest_admission_controller)
+
+
+async def admit_ingest_event_type(
+    awaiting_event_type: bool = Depends(ingest_admission),
+    payload: dict = Depends(get_webhook_payload),
+) -> None:
+    """Shed a request left undecided by `ingest_admission` unless its event type is exempt."""
+    if not awaiting_event_type:
+        return
+    admitted = payload.get("event_type") in settings.INGEST_SHED_EXEMPT_EVENT_TYPES
+    ingest_admission_controller.record_decision(admitted=admitted)
+    if not admitted:
+        raise get_shed_exception()
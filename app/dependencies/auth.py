@@ -1,19 +1,45 @@
+import time
 from datetime import datetime, timezone
+from typing import Optional
 
 from fastapi import Header, Request
 
 from app.config.settings import settings
+from app.dependencies.backends import get_signing_key_service
+from app.integrations.metrics import INGEST_HMAC_SECONDS
+from app.utils.constants.webhooks import DEFAULT_SIGNING_KEY_ID
 from app.utils.datetime_utils import get_timezone_aware_timestamp_from_string
 from app.utils.exceptions.core import AuthenticationException
 from app.utils.security.hmac_services import HMACServices
 
+# Keyed once per process for producers signing with the shared secret key
+_default_hmac_services: Optional[HMACServices] = None
+
+
+def get_default_hmac_services() -> HMACServices:
+    """Return the HMAC service keyed with the shared `SECRET_KEY`."""
+    global _default_hmac_services
+    if _default_hmac_services is None:
+        _default_hmac_services = HMACServices()
+    return _default_hmac_services
+
 
 async def verify_webhook_signature(
     request: Request,
     x_signature: str = Header(..., description="HMAC Webhook signature"),
     x_timestamp: str = Header(..., description="Request timestamp"),
-) -> bool:
-    """Verify webhook authenticity by validating timestamp and HMAC signature."""
+    x_key_id: Optional[str] = Header(
+        None, description="Signing key id of the producer"
+    ),
+) -> str:
+    """
+    Verify webhook authenticity by validating timestamp and HMAC signature.
+
+    Requests with an `X-Key-Id` are verified against the secrets of that key id valid
+    at the request time (several while keys overlap during a rotation), all others
+    against the shared `SECRET_KEY`. Returns the signing identity of the producer,
+    which keys per-producer limits.
+    """
 
     body = await request.body()
 
@@ -28,15 +54,36 @@ async def verify_webhook_signature(
             error="bad-request",
         )
 
-    hmac_services = HMACServices()
-    expected_signature = hmac_services.generate_hmac_signature(
-        signature_payload=body, x_timestamp=x_timestamp
+    if x_key_id is None:
+        hmac_services_list = [get_default_hmac_services()]
+    else:
+        signing_keys = await get_signing_key_service().get_valid_signing_keys(
+            key_id=x_key_id, now=current_time
+        )
+        if not signing_keys:
+            raise AuthenticationException(
+                message="Unknown or expired signing key",
+                error="unauthorized-request",
+            )
+        hmac_services_list = [
+            HMACServices(keyed_hmac=signing_key.keyed_hmac)
+            for signing_key in signing_keys
+        ]
+
+    hmac_start = time.perf_counter()
+    is_signature_valid = any(
+        hmac_services.compare_hmac_signatures(
+            received_signature=x_signature,
+            expected_signature=hmac_services.generate_hmac_signature(
+                signature_payload=body, x_timestamp=x_timestamp
+            ),
+        )
+        for hmac_services in hmac_services_list
     )
-    if not hmac_services.compare_hmac_signatures(
-        received_signature=x_signature, expected_signature=expected_signature
-    ):
+    INGEST_HMAC_SECONDS.observe(time.perf_counter() - hmac_start)
+    if not is_signature_valid:
         raise AuthenticationException(
             message="Invalid HMAC signature",
             error="unauthorized-request",
         )
-    return True
+    return x_key_id or DEFAULT_SIGNING_KEY_ID
@@ -0,0 +1,304 @@
+import logging
+from typing import Optional
+
+from app.backends.base import (
+    EventStatusCache,
+    LatencyRollupStore,
+    ReplayJobStore,
+    SearchCountCache,
+    SigningKeyStore,
+    TokenBucketStore,
+    WebhookEventStore,
+    WebhookQueue,
+)
+from app.config.settings import settings
+from app.dependencies.db import get_db
+from app.integrations.redis_client import RedisService
+from app.services.archival import EventArchivalService
+from app.services.dead_letters import DeadLetterService
+from app.services.group_commit import IngestGroupCommitter
+from app.services.latency import LatencyBreakdownService
+from app.services.signing_keys import SigningKeyService
+from app.services.webhooks import WebhookEventService
+from app.utils.constants.webhooks import (
+    EVENT_STATUS_CACHE_TTL_SECONDS,
+    SIGNING_KEY_CACHE_MAX_KEYS,
+    SIGNING_KEY_CACHE_TTL_SECONDS,
+    SIGNING_KEY_NEGATIVE_CACHE_MAX_KEYS,
+    SIGNING_KEY_NEGATIVE_CACHE_TTL_SECONDS,
+)
+from app.utils.enums.core import StorageBackendEnum
+
+logger = logging.getLogger(__name__)
+
+# Process-wide backend singletons, created lazily on first use
+_redis_service: Optional[RedisService] = None
+_event_store: Optional[WebhookEventStore] = None
+_analytics_event_store: Optional[WebhookEventStore] = None
+_webhook_queue: Optional[WebhookQueue] = None
+_token_bucket_store: Optional[TokenBucketStore] = None
+_latency_rollup_store: Optional[LatencyRollupStore] = None
+_replay_job_store: Optional[ReplayJobStore] = None
+_signing_key_store: Optional[SigningKeyStore] = None
+_signing_key_service: Optional[SigningKeyService] = None
+_ingest_group_committer: Optional[IngestGroupCommitter] = None
+_event_status_cache: Optional[EventStatusCache] = None
+_search_count_cache: Optional[SearchCountCache] = None
+
+
+def is_memory_backend() -> bool:
+    """Return whether the in-memory event store and queue are configured."""
+    return settings.STORAGE_BACKEND == StorageBackendEnum.MEMORY
+
+
+def get_redis_service() -> RedisService:
+    """Return the shared Redis service so all callers reuse one connection pool."""
+    global _redis_service
+    if _redis_service is None:
+        _redis_service = RedisService()
+    return _redis_service
+
+
+def get_event_store() -> WebhookEventStore:
+    """Return the configured webhook event store."""
+    global _event_store
+    if _event_store is None:
+        if is_memory_backend():
+            from app.backends.memory_store import InMemoryWebhookEventStore
+
+            _event_store = InMemoryWebhookEventStore()
+        else:
+            from app.backends.mongo_store import MongoWebhookEventStore
+            from app.config.database import get_event_write_concern
+
+            _event_store = MongoWebhookEventStore(
+                db=get_db(), write_concern=get_event_write_concern()
+            )
+        logger.info(f"Using {type(_event_store).__name__} as webhook event store")
+    return _event_store
+
+
+def get_analytics_event_store() -> WebhookEventStore:
+    """
+    Return the event store serving search, export, aggregate and dead-letter listing
+    queries, which reads with the analytics read preference.
+    """
+    global _analytics_event_store
+    if _analytics_event_store is None:
+        if is_memory_backend():
+            _analytics_event_store = get_event_store()
+        else:
+            from app.backends.mongo_store import MongoWebhookEventStore
+            from app.config.database import get_analytics_read_preference
+
+            _analytics_event_store = MongoWebhookEventStore(
+                db=get_db(), read_preference=get_analytics_read_preference()
+            )
+            logger.info(
+                f"Using read preference {settings.ANALYTICS_READ_PREFERENCE.value} "
+                "for analytics queries"
+            )
+    return _analytics_event_store
+
+
+def get_webhook_queue() -> WebhookQueue:
+    """Return the configured webhook delivery queue."""
+    global _webhook_queue
+    if _webhook_queue is None:
+        if is_memory_backend():
+            from app.backends.memory_store import InMemoryWebhookQueue
+
+            _webhook_queue = InMemoryWebhookQueue()
+        else:
+            from app.backends.redis_store import RedisWebhookQueue
+
+            _webhook_queue = RedisWebhookQueue(redis_service=get_redis_service())
+    return _webhook_queue
+
+
+def get_token_bucket_store() -> TokenBucketStore:
+    """Return the configured token bucket store used by rate limiters."""
+    global _token_bucket_store
+    if _token_bucket_store is None:
+        if is_memory_backend():
+            from app.backends.memory_store import InMemoryTokenBucketStore
+
+            _token_bucket_store = InMemoryTokenBucketStore()
+        else:
+            from app.backends.redis_store import RedisTokenBucketStore
+
+            _token_bucket_store = RedisTokenBucketStore(
+                redis_service=get_redis_service()
+            )
+    return _token_bucket_store
+
+
+def get_latency_rollup_store() -> LatencyRollupStore:
+    """Return the configured store of pre-aggregated stage latency histograms."""
+    global _latency_rollup_store
+    if _latency_rollup_store is None:
+        if is_memory_backend():
+            from app.backends.memory_store import InMemoryLatencyRollupStore
+
+            _latency_rollup_store = InMemoryLatencyRollupStore()
+        else:
+            from app.backends.mongo_store import MongoLatencyRollupStore
+
+            _latency_rollup_store = MongoLatencyRollupStore(db=get_db())
+    return _latency_rollup_store
+
+
+def get_replay_job_store() -> ReplayJobStore:
+    """Return the configured store of dead-letter replay jobs."""
+    global _replay_job_store
+    if _replay_job_store is None:
+        if is_memory_backend():
+            from app.backends.memory_store import InMemoryReplayJobStore
+
+            _replay_job_store = InMemoryReplayJobStore()
+        else:
+            from app.backends.mongo_store import MongoReplayJobStore
+
+            _replay_job_store = MongoReplayJobStore(db=get_db())
+    return _replay_job_store
+
+
+def get_signing_key_store() -> SigningKeyStore:
+    """Return the configured store of producer signing keys."""
+    global _signing_key_store
+    if _signing_key_store is None:
+        if is_memory_backend():
+            from app.backends.memory_store import InMemorySigningKeyStore
+
+            _signing_key_store = InMemorySigningKeyStore()
+        else:
+            from app.backends.mongo_store import MongoSigningKeyStore
+
+            _signing_key_store = MongoSigningKeyStore(db=get_db())
+    return _signing_key_store
+
+
+def get_signing_key_service() -> SigningKeyService:
+    """Return the shared signing key service, whose cache must outlive single requests."""
+    global _signing_key_service
+    if _signing_key_service is None:
+        _signing_key_service = SigningKeyService(
+            key_store=get_signing_key_store(),
+            cache_ttl_seconds=SIGNING_KEY_CACHE_TTL_SECONDS,
+            max_keys=SIGNING_KEY_CACHE_MAX_KEYS,
+            negative_cache_ttl_seconds=SIGNING_KEY_NEGATIVE_CACHE_TTL_SECONDS,
+            max_unknown_keys=SIGNING_KEY_NEGATIVE_CACHE_MAX_KEYS,
+        )
+    return _signing_key_service
+
+
+def get_ingest_group_committer() -> Optional[IngestGroupCommitter]:
+    """Return the shared ingest group committer, None unless group commit is enabled."""
+    global _ingest_group_committer
+    if _ingest_group_committer is None and settings.INGEST_GROUP_COMMIT:
+        _ingest_group_committer = IngestGroupCommitter(
+            event_store=get_event_store(),
+            webhook_queue=get_webhook_queue(),
+            window_seconds=settings.INGEST_GROUP_COMMIT_WINDOW_MS / 1000,
+            max_events=settings.INGEST_GROUP_COMMIT_MAX_EVENTS,
+        )
+    return _ingest_group_committer
+
+
+def get_event_status_cache() -> EventStatusCache:
+    """Return the configured cache of recent event status views."""
+    global _event_status_cache
+    if _event_status_cache is None:
+        if is_memory_backend():
+            from app.backends.memory_store import InMemoryEventStatusCache
+
+            _event_status_cache = InMemoryEventStatusCache(
+                ttl_seconds=EVENT_STATUS_CACHE_TTL_SECONDS
+            )
+        else:
+            from app.backends.redis_store import RedisEventStatusCache
+
+            _event_status_cache = RedisEventStatusCache(
+                redis_service=get_redis_service(),
+                ttl_seconds=EVENT_STATUS_CACHE_TTL_SECONDS,
+            )
+    return _event_status_cache
+
+
+def get_search_count_cache() -> SearchCountCache:
+    """Return the configured cache of search totals."""
+    global _search_count_cache
+    if _search_count_cache is None:
+        if is_memory_backend():
+            from app.backends.memory_store import InMemorySearchCountCache
+
+            _search_count_cache = InMemorySearchCountCache(
+                ttl_seconds=settings.SEARCH_COUNT_CACHE_TTL_SECONDS
+            )
+        else:
+            from app.backends.redis_store import RedisSearchCountCache
+
+            _search_count_cache = RedisSearchCountCache(
+                redis_service=get_redis_service(),
+                ttl_seconds=settings.SEARCH_COUNT_CACHE_TTL_SECONDS,
+            )
+    return _search_count_cache
+
+
+def get_webhook_event_service() -> WebhookEventService:
+    """Return a webhook event service bound to the configured store and queue."""
+    return WebhookEventService(
+        event_store=get_event_store(),
+        webhook_queue=get_webhook_queue(),
+        analytics_event_store=get_analytics_event_store(),
+        group_committer=get_ingest_group_committer(),
+        event_status_cache=get_event_status_cache(),
+        search_count_cache=get_search_count_cache(),
+    )
+
+
+def get_latency_breakdown_service() -> LatencyBreakdownService:
+    """Return a latency breakdown service bound to the configured rollup store."""
+    return LatencyBreakdownService(rollup_store=get_latency_rollup_store())
+
+
+def get_dead_letter_service() -> DeadLetterService:
+    """Return a dead-letter service bound to the configured stores and queue."""
+    return DeadLetterService(
+        event_store=get_event_store(),
+        webhook_queue=get_webhook_queue(),
+        replay_job_store=get_replay_job_store(),
+        analytics_event_store=get_analytics_event_store(),
+        event_status_cache=get_event_status_cache(),
+    )
+
+
+def get_event_archival_service() -> EventArchivalService:
+    """Return an archival service configured with the retention settings."""
+    return EventArchivalService(
+        event_store=get_event_store(),
+        retention_days=settings.FINISHED_EVENT_RETENTION_DAYS,
+        idempotency_window_days=settings.IDEMPOTENCY_WINDOW_DAYS,
+        archive_dir=settings.EVENT_ARCHIVE_DIR,
+    )
+
+
+def reset_backends() -> None:
+    """Drop backend singletons, e.g. after the database client has been closed."""
+    global _redis_service, _event_store, _analytics_event_store, _webhook_queue
+    global _token_bucket_store
+    global _latency_rollup_store, _replay_job_store
+    global _signing_key_store, _signing_key_service, _ingest_group_committer
+    global _event_status_cache, _search_count_cache
+    _redis_service = None
+    _event_store = None
+    _analytics_event_store = None
+    _webhook_queue = None
+    _token_bucket_store = None
+    _latency_rollup_store = None
+    _replay_job_store = None
+    _signing_key_store = None
+    _signing_key_service = None
+    _ingest_group_committer = None
+    _event_status_cache = None
+    _search_count_cache = None
@@ -1,14 +1,42 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
-from fastapi import Query
+from fastapi import Query, Request
 
+from app.config.settings import settings
+from app.utils.constants.webhooks import SEARCH_ATTRIBUTE_QUERY_PREFIX
 from app.utils.enums.webhooks import WebhookStatusEnum
 from app.utils.exceptions.core import UtilsException
 
 
+def get_attribute_filters(request: Request) -> Dict[str, List[str]]:
+    """
+    Collect the `attr.<name>=value` query parameters, which filter on promoted payload
+    attributes. Repeating a parameter matches any of its values.
+    """
+    known_names = {
+        name
+        for attribute_paths in settings.EVENT_TYPE_ATTRIBUTE_PATHS.values()
+        for name in attribute_paths
+    }
+    attr_filters = {}
+    for key in request.query_params:
+        if not key.startswith(SEARCH_ATTRIBUTE_QUERY_PREFIX):
+            continue
+        name = key[len(SEARCH_ATTRIBUTE_QUERY_PREFIX) :]
+        if name not in known_names:
+            raise UtilsException(
+                message=f"Unknown search attribute {name}!", error="bad-request"
+            )
+        attr_filters[name] = request.query_params.getlist(key)
+    return attr_filters
+
+
 class WebhookEventFilter:
-    """Filter and validate webhook query parameters."""
+    """
+    Filter and validate webhook query parameters. Besides the declared parameters, any
+    `attr.<name>=value` parameter filters on the promoted attribute `name`.
+    """
 
     def __init__(
         self,
@@ -20,11 +48,13 @@ class WebhookEventFilter:
         ),
         timestamp_to: Optional[datetime] = Query(None, description="Time range filter"),
         event_type: Optional[str] = Query(None, description="Event type filter"),
+        request: Request = None,
     ):
         self.status = status
         self.timestamp_from = timestamp_from
         self.timestamp_to = timestamp_to
         self.event_type = event_type
+        self.attr_filters = get_attribute_filters(request=request) if request else {}
 
     def validate_timestamp(self):
         """Ensure start timestamp is before end timestamp."""
@@ -48,4 +78,59 @@ class WebhookEventFilter:
                 filters_dict["received_at"]["$gte"] = self.timestamp_from
             if self.timestamp_to:
                 filters_dict["received_at"]["$lte"] = self.timestamp_to
+        for name, values in self.attr_filters.items():
+            filters_dict[f"attrs.{name}"] = (
+                values[0] if len(values) == 1 else {"$in": values}
+            )
+        return filters_dict
+
+
+class WebhookLatencyFilter(WebhookEventFilter):
+    """Filter and validate latency breakdown query parameters."""
+
+    def __init__(
+        self,
+        timestamp_from: Optional[datetime] = Query(
+            None, description="Window start, defaults to one hour before the end"
+        ),
+        timestamp_to: Optional[datetime] = Query(
+            None, description="Window end, defaults to now"
+        ),
+        event_type: Optional[str] = Query(None, description="Event type filter"),
+    ):
+        super().__init__(
+            status=None,
+            timestamp_from=timestamp_from,
+            timestamp_to=timestamp_to,
+            event_type=event_type,
+        )
+
+
+class WebhookDeadLetterFilter(WebhookEventFilter):
+    """Filter and validate dead-letter (permanently failed event) query parameters."""
+
+    def __init__(
+        self,
+        timestamp_from: Optional[datetime] = Query(
+            None, description="Time range filter"
+        ),
+        timestamp_to: Optional[datetime] = Query(None, description="Time range filter"),
+        event_type: Optional[str] = Query(None, description="Event type filter"),
+        status_code: Optional[int] = Query(
+            None, description="Status code of the last delivery attempt"
+        ),
+    ):
+        super().__init__(
+            status=WebhookStatusEnum.FAILED_PERMANENTLY,
+            timestamp_from=timestamp_from,
+            timestamp_to=timestamp_to,
+            event_type=event_type,
+        )
+        self.status_code = status_code
+
+    def _build_filters_dict(self) -> dict:
+        """Build a MongoDB-compatible filters dictionary for permanently failed events."""
+        filters_dict = super()._build_filters_dict()
+        if self.status_code:
+            filters_dict["last_status_code"] = self.status_code
         return filters_dict
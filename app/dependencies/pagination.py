@@ -3,6 +3,7 @@ from typing import Any, List, Optional
 from fastapi import Query
 
 from app.config.settings import settings
+from app.utils.enums.webhooks import SearchCountStrategyEnum
 
 
 class PaginationParams:
@@ -13,6 +14,8 @@ class PaginationParams:
         page (Optional[int]): The current page number from the query parameter.
         page_size (int): Number of items per page, pulled from settings.
         total_count (Optional[int]): Total number of items (to be set externally).
+        count_strategy (Optional[SearchCountStrategyEnum]): How the total count was
+            computed (to be set externally).
     """
 
     def __init__(
@@ -24,7 +27,8 @@ class PaginationParams:
     ):
         self.page = page or settings.DEFAULT_PAGE
         self.page_size = page_size or settings.PAGE_SIZE
-        self.total_count = None
+        self.total_count: Optional[int] = None
+        self.count_strategy: Optional[SearchCountStrategyEnum] = None
 
     @property
     def offset(self):
@@ -0,0 +1,85 @@
+import json
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from fastapi import Request
+
+from app.config.settings import settings
+from app.utils.constants.webhooks import EVENT_ATTRIBUTE_MAX_LENGTH
+from app.utils.datetime_utils import get_timezone_aware_timestamp_from_string
+from app.utils.exceptions.webhooks import WebhookEventException
+
+
+async def get_webhook_payload(request: Request) -> dict:
+    """
+    Parse the JSON webhook body. Declared after the signature and limit dependencies, so
+    rejected requests are never parsed.
+    """
+    try:
+        payload = json.loads(await request.body())
+    except ValueError:
+        raise WebhookEventException(
+            message="Webhook payload must be valid JSON!", error="bad-request"
+        )
+    if not isinstance(payload, dict):
+        raise WebhookEventException(
+            message="Webhook payload must be a JSON object!", error="bad-request"
+        )
+    return payload
+
+
+def get_payload_key_value(payload: dict, path: str) -> Optional[str]:
+    """
+    Return the value at a dotted payload path as a string. Only string and integer values
+    are returned, as identifiers are the only values worth keying or searching by.
+    """
+    value = payload
+    for field in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(field)
+    if isinstance(value, (str, int)) and not isinstance(value, bool):
+        return str(value)
+    return None
+
+
+def get_ordering_key(payload: dict, x_ordering_key: Optional[str]) -> Optional[str]:
+    """
+    Return the ordering key of an event from the X-Ordering-Key header, or else from the
+    configured payload path. Only scalar payload values are used as keys.
+    """
+    if x_ordering_key:
+        return x_ordering_key
+    if not settings.ORDERING_KEY_PATH:
+        return None
+    return get_payload_key_value(payload=payload, path=settings.ORDERING_KEY_PATH)
+
+
+def get_event_attrs(event_type: Optional[str], payload: dict) -> Dict[str, str]:
+    """
+    Return the promoted search attributes of an event, read from the payload paths
+    configured for its event type. Missing, non-scalar and overlong values are skipped.
+    """
+    attrs = {}
+    for name, path in settings.EVENT_TYPE_ATTRIBUTE_PATHS.get(event_type, {}).items():
+        value = get_payload_key_value(payload=payload, path=path)
+        if value is not None and len(value) <= EVENT_ATTRIBUTE_MAX_LENGTH:
+            attrs[name] = value
+    return attrs
+
+
+def get_expires_at(
+    event_type: Optional[str], received_at: datetime, x_expires_at: Optional[str]
+) -> Optional[datetime]:
+    """
+    Return when an event expires, from the X-Expires-At header (ISO 8601 with timezone),
+    or else from the TTL of its event type or the default TTL. None never expires.
+    """
+    if x_expires_at:
+        return get_timezone_aware_timestamp_from_string(timestamp=x_expires_at)
+    ttl_seconds = settings.EVENT_TYPE_TTL_SECONDS.get(
+        event_type, settings.EVENT_TTL_SECONDS
+    )
+    if ttl_seconds <= 0:
+        return None
+    return received_at + timedelta(seconds=ttl_seconds)
@@ -1,41 +1,158 @@
+import asyncio
+import logging
+import math
 import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
-from fastapi import status
+from fastapi import Depends, status
 from fastapi.exceptions import HTTPException
-from redis.exceptions import ConnectionError, ResponseError
 
-from app.integrations.redis_client import RedisService
-from app.utils.exceptions.core import UtilsException
+from app.config.settings import settings
+from app.dependencies.auth import verify_webhook_signature
+from app.dependencies.backends import get_token_bucket_store
+from app.integrations.metrics import RATE_LIMITER_DECISIONS
+from app.utils.constants.webhooks import (
+    TOKEN_LEASE_MAX_KEYS,
+    TOKEN_LEASE_REFILL_THRESHOLD,
+)
+from app.utils.dtos.webhooks import IngestLimitsDTO, RateLimitDecisionDTO
+
+logger = logging.getLogger(__name__)
+
+
+class TokenLease:
+    """Tokens leased from the shared bucket of one key and spent locally."""
+
+    __slots__ = ("tokens", "expires_at", "denied_until", "refill_task")
+
+    def __init__(self):
+        self.tokens = 0
+        self.expires_at = 0.0
+        self.denied_until = 0.0
+        self.refill_task: Optional[asyncio.Task] = None
 
 
 class TokenBucketRateLimiter:
-    """Rate limiter using a token bucket algorithm backed by Redis."""
+    """
+    Rate limiter using a token bucket algorithm backed by the configured token store.
+
+    With `lease_size` set, each process leases blocks of up to `lease_size` tokens per key
+    and spends them locally, so most requests never reach the store. A lease is topped up
+    in the background once it runs low and expires after the time the bucket needs to
+    refill it, which bounds over-admission to one lease per key and process.
+    """
 
-    def __init__(self, rate: int, capacity: int):
-        self.redis_client = RedisService().redis_client
+    def __init__(
+        self,
+        rate: int,
+        capacity: int,
+        name: str = "default",
+        lease_size: Optional[int] = None,
+    ):
         self.rate = rate  # Requests allowed per second
         self.capacity = capacity  # Max burst capacity of bucket
-
-        with open(file="app/scripts/token_bucket.lua", mode="r") as rl_file:
-            self._script = self.redis_client.register_script(script=rl_file.read())
+        self.name = name  # Low-cardinality limiter name used as metrics label
+        self.lease_size = lease_size  # Tokens leased per store call, None disables
+        self._leases: "OrderedDict[str, TokenLease]" = OrderedDict()
+        self._allowed_counter = RATE_LIMITER_DECISIONS.labels(
+            limiter=name, decision="allowed"
+        )
+        self._denied_counter = RATE_LIMITER_DECISIONS.labels(
+            limiter=name, decision="denied"
+        )
 
     async def is_request_allowed(self, key: str, requested_tokens: float = 1) -> bool:
         """Check if a request can proceed under current rate limits."""
-        try:
-            now = time.time()
+        if self.lease_size:
+            result = await self._take_leased_tokens(
+                key=key, requested_tokens=requested_tokens
+            )
+        else:
+            result = await get_token_bucket_store().take_tokens(
+                key=key,
+                rate=self.rate,
+                capacity=self.capacity,
+                requested=requested_tokens,
+                now=time.time(),
+            )
+        if result:
+            self._allowed_counter.inc()
+        else:
+            self._denied_counter.inc()
+        return result
+
+    def _get_lease(self, key: str) -> TokenLease:
+        """Return the local lease of a key, evicting the least recently used beyond the cap."""
+        lease = self._leases.get(key)
+        if lease is None:
+            lease = self._leases[key] = TokenLease()
+            if len(self._leases) > TOKEN_LEASE_MAX_KEYS:
+                self._leases.popitem(last=False)
+        else:
+            self._leases.move_to_end(key)
+        return lease
+
+    async def _take_leased_tokens(self, key: str, requested_tokens: float) -> bool:
+        """Spend locally leased tokens, leasing a new block when the current one is spent."""
+        lease = self._get_lease(key)
+        now = time.monotonic()
+        if lease.expires_at <= now:
+            lease.tokens = 0
 
-            result = await self._script(
-                keys=[key],
-                args=[self.rate, self.capacity, requested_tokens, now],
+        if lease.tokens < requested_tokens:
+            # Remembering an empty bucket avoids a store call per denied request
+            if lease.denied_until > now:
+                return False
+            await self._refill_lease(key=key, lease=lease)
+            if lease.tokens < requested_tokens:
+                return False
+
+        lease.tokens -= requested_tokens
+        if (
+            lease.tokens < self.lease_size * TOKEN_LEASE_REFILL_THRESHOLD
+            and lease.refill_task is None
+            and lease.denied_until <= now
+        ):
+            lease.refill_task = asyncio.create_task(self._lease_tokens(key, lease))
+            lease.refill_task.add_done_callback(self._log_refill_failure)
+        return True
+
+    async def _refill_lease(self, key: str, lease: TokenLease) -> None:
+        """Lease a new block, joining a refill already in flight for the same key."""
+        if lease.refill_task is None:
+            lease.refill_task = asyncio.create_task(self._lease_tokens(key, lease))
+        await asyncio.shield(lease.refill_task)
+
+    async def _lease_tokens(self, key: str, lease: TokenLease) -> None:
+        """Lease up to `lease_size` tokens from the shared bucket into the local lease."""
+        try:
+            token_lease = await get_token_bucket_store().lease_tokens(
+                key=key,
+                rate=self.rate,
+                capacity=self.capacity,
+                requested=self.lease_size,
+                now=time.time(),
             )
-            return bool(result)
-        except ConnectionError:
-            raise UtilsException(
-                message="Rate limiting service unavailable due to connection error",
-                error="service-unavailable",
+            now = time.monotonic()
+            if token_lease.granted:
+                if lease.expires_at <= now:
+                    lease.tokens = 0
+                lease.tokens += token_lease.granted
+                lease.expires_at = now + max(1.0, self.lease_size / self.rate)
+            else:
+                lease.denied_until = now + token_lease.retry_after
+        finally:
+            lease.refill_task = None
+
+    def _log_refill_failure(self, task: asyncio.Task) -> None:
+        """Report failed background refills, which are retried on the next request."""
+        if not task.cancelled() and task.exception():
+            logger.warning(
+                f"Background token lease refill failed for limiter {self.name}: "
+                f"{task.exception()}"
             )
-        except ResponseError as exc:
-            raise UtilsException(message="Error reading script.", error=str(exc))
 
 
 class RateLimiterDependency:
@@ -56,3 +173,83 @@ class RateLimiterDependency:
                 detail="Too many requests! Please try again after some time.",
                 headers={"Retry-After": "5"},
             )
+
+
+class ProducerIngestLimiter:
+    """
+    Per-producer ingest rate limit and daily quota, keyed by signing identity. Both are
+    checked and consumed by one atomic store call, i.e. one Redis round trip.
+    """
+
+    def __init__(self, name: str = "ingest"):
+        self.name = name
+        self._allowed_counter = RATE_LIMITER_DECISIONS.labels(
+            limiter=name, decision="allowed"
+        )
+        self._denied_counter = RATE_LIMITER_DECISIONS.labels(
+            limiter=name, decision="denied"
+        )
+
+    def get_limits(self, producer_id: str) -> IngestLimitsDTO:
+        """Resolve a producer's limits from its overrides and the defaults."""
+        overrides = settings.INGEST_PRODUCER_LIMITS.get(producer_id, {})
+        rate = overrides.get("rate", settings.INGEST_RATE_LIMIT)
+        return IngestLimitsDTO(
+            rate=rate,
+            burst=int(
+                overrides.get("burst", settings.INGEST_BURST_CAPACITY)
+                or math.ceil(rate)
+            ),
+            daily_quota=int(overrides.get("daily_quota", settings.INGEST_DAILY_QUOTA)),
+        )
+
+    async def check_request(self, producer_id: str) -> RateLimitDecisionDTO:
+        """Admit one ingest request of the producer or tell how long it must wait."""
+        limits = self.get_limits(producer_id=producer_id)
+        if not limits.rate and not limits.daily_quota:
+            return RateLimitDecisionDTO(allowed=True, retry_after=0.0, reason=None)
+
+        now = datetime.now(tz=timezone.utc)
+        next_day = (now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        # The hash tag keeps both keys of a producer on one Redis cluster slot
+        decision = await get_token_bucket_store().take_token_within_quota(
+            bucket_key=f"ingest:{{{producer_id}}}:rate",
+            quota_key=f"ingest:{{{producer_id}}}:quota:{now:%Y%m%d}",
+            rate=limits.rate,
+            capacity=limits.burst,
+            daily_quota=limits.daily_quota,
+            now=now.timestamp(),
+            quota_ttl=math.ceil((next_day - now).total_seconds()),
+        )
+        if decision.allowed:
+            self._allowed_counter.inc()
+        else:
+            self._denied_counter.inc()
+        return decision
+
+
+class ProducerIngestLimiterDependency:
+    """FastAPI dependency enforcing per-producer ingest limits after signature checks."""
+
+    def __init__(self, limiter: ProducerIngestLimiter):
+        self.limiter = limiter
+
+    async def __call__(
+        self, producer_id: str = Depends(verify_webhook_signature)
+    ) -> str:
+        """Raise 429 with the exact wait when the producer exceeds its limits."""
+        decision = await self.limiter.check_request(producer_id=producer_id)
+        if not decision.allowed:
+            message = (
+                "Daily ingest quota exhausted!"
+                if decision.reason == "quota"
+                else "Too many requests! Please try again after some time."
+            )
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=message,
+                headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+            )
+        return producer_id
@@ -0,0 +1,148 @@
+import time
+from functools import lru_cache
+from typing import Awaitable, Optional, TypeVar
+from urllib.parse import urlsplit
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Latency buckets (seconds) tuned for sub-millisecond to multi-second operations
+FAST_OPERATION_BUCKETS: tuple = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+DELIVERY_BUCKETS: tuple = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.0,
+    3.0,
+    5.0,
+    10.0,
+)
+ATTEMPT_BUCKETS: tuple = (1, 2, 3, 4, 5, 6, 8, 10)
+
+# Ingest metrics
+INGEST_STAGE_SECONDS = Histogram(
+    name="webhook_ingest_stage_seconds",
+    documentation="Time spent in each webhook ingest stage.",
+    labelnames=["stage"],
+    buckets=FAST_OPERATION_BUCKETS,
+)
+INGEST_HMAC_SECONDS = INGEST_STAGE_SECONDS.labels(stage="hmac")
+INGEST_INSERT_SECONDS = INGEST_STAGE_SECONDS.labels(stage="insert")
+INGEST_ENQUEUE_SECONDS = INGEST_STAGE_SECONDS.labels(stage="enqueue")
+
+# Queue metrics
+QUEUE_DEPTH = Gauge(
+    name="webhook_queue_depth",
+    documentation="Number of items currently held in a webhook queue.",
+    labelnames=["queue"],
+)
+QUEUE_OLDEST_ITEM_AGE_SECONDS = Gauge(
+    name="webhook_queue_oldest_item_age_seconds",
+    documentation="Age of the oldest item waiting in a webhook queue.",
+    labelnames=["queue"],
+)
+
+# Delivery worker metrics
+DELIVERY_SECONDS = Histogram(
+    name="webhook_delivery_seconds",
+    documentation="Downstream delivery request latency.",
+    labelnames=["destination", "status_class"],
+    buckets=DELIVERY_BUCKETS,
+)
+DELIVERY_ATTEMPTS = Histogram(
+    name="webhook_delivery_attempts",
+    documentation="Number of delivery attempts made per finished webhook event.",
+    labelnames=["final_status"],
+    buckets=ATTEMPT_BUCKETS,
+)
+DELIVERY_IN_FLIGHT = Gauge(
+    name="webhook_delivery_in_flight",
+    documentation="Number of deliveries currently holding a worker semaphore slot.",
+)
+DELIVERY_CONCURRENCY_LIMIT = Gauge(
+    name="webhook_delivery_concurrency_limit",
+    documentation="Configured number of worker semaphore slots.",
+)
+DELIVERY_TIMEOUTS = Counter(
+    name="webhook_delivery_timeouts_total",
+    documentation="Delivery requests that timed out, by the kind of timeout in effect.",
+    labelnames=["destination", "timeout"],
+)
+DELIVERY_TIMEOUT_SECONDS = Gauge(
+    name="webhook_delivery_timeout_seconds",
+    documentation="Request timeout currently applied to a destination.",
+    labelnames=["destination"],
+)
+EVENTS_EXPIRED = Counter(
+    name="webhook_events_expired_total",
+    documentation="Events marked expired instead of being sent, by where it was noticed.",
+    labelnames=["stage"],
+)
+EVENT_LOOP_LAG_SECONDS = Gauge(
+    name="webhook_worker_event_loop_lag_seconds",
+    documentation="How late the last event loop lag probe woke up.",
+)
+DELIVERY_SEMAPHORE_WAIT_SECONDS = Histogram(
+    name="webhook_delivery_semaphore_wait_seconds",
+    documentation="Time claimed events wait for a worker semaphore slot.",
+    buckets=DELIVERY_BUCKETS,
+)
+
+# Query metrics
+QUERY_SECONDS = Histogram(
+    name="webhook_query_seconds",
+    documentation="Latency of event store read queries per API route and operation.",
+    labelnames=["route", "operation"],
+    buckets=DELIVERY_BUCKETS,
+)
+
+# Rate limiter metrics
+RATE_LIMITER_DECISIONS = Counter(
+    name="webhook_rate_limiter_decisions_total",
+    documentation="Rate limiter allow/deny decisions.",
+    labelnames=["limiter", "decision"],
+)
+
+T = TypeVar("T")
+
+
+async def observe_query(route: str, operation: str, query: Awaitable[T]) -> T:
+    """Await an event store query and record its latency under the route and operation."""
+    start = time.perf_counter()
+    try:
+        return await query
+    finally:
+        QUERY_SECONDS.labels(route=route, operation=operation).observe(
+            time.perf_counter() - start
+        )
+
+
+@lru_cache(maxsize=1024)
+def get_destination_label(url: str) -> str:
+    """Return a low-cardinality destination label (host[:port]) for a delivery URL."""
+    return urlsplit(url).netloc or url
+
+
+def get_status_class(status_code: Optional[int]) -> str:
+    """Collapse an HTTP status code into its class label, e.g. 2xx or 5xx."""
+    if not status_code:
+        return "error"
+    return f"{status_code // 100}xx"
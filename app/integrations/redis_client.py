@@ -1,8 +1,10 @@
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 
 from redis.asyncio import Redis
 
 from app.config.settings import settings
+from app.scripts import load_lua_script
+from app.utils.dtos.webhooks import QueueStatsDTO
 
 
 class RedisService:
@@ -15,14 +17,27 @@ class RedisService:
         self.redis_client = Redis(
             host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0
         )
+        self._promote_due_script = self.redis_client.register_script(
+            script=load_lua_script(file_name="promote_due_retries.lua")
+        )
+        self._enqueue_ordered_script = self.redis_client.register_script(
+            script=load_lua_script(file_name="enqueue_ordered.lua")
+        )
+        self._release_ordering_key_script = self.redis_client.register_script(
+            script=load_lua_script(file_name="release_ordering_key.lua")
+        )
 
-    async def left_push_event_to_queue(self, key: str, value: str):
-        """Pushes an event to the left of the Redis queue."""
-        await self.redis_client.lpush(key, value)
+    async def left_push_event_to_queue(self, key: str, *values: str):
+        """Pushes one or more events to the left of the Redis queue."""
+        await self.redis_client.lpush(key, *values)
 
-    async def brpop_event_from_queue(self, key: str):
+    async def right_push_event_to_queue(self, key: str, *values: str):
+        """Pushes one or more events to the right of the Redis queue, next to be popped."""
+        await self.redis_client.rpush(key, *values)
+
+    async def brpop_event_from_queue(self, key: str, timeout: float = 0):
         """Blocks and pops an event from the Redis queue."""
-        return await self.redis_client.brpop(keys=key)
+        return await self.redis_client.brpop(keys=key, timeout=timeout)
 
     async def brpoplpush_event_from_queue(self, source: str, destination: str):
         """Atomically moves event from queue to processing list."""
@@ -39,3 +54,81 @@ class RedisService:
     async def remove_event_from_zset(self, key: str, value: str):
         """Removes an event from the Redis sorted set."""
         await self.redis_client.zrem(key, value)
+
+    async def move_due_events_to_queue(
+        self, zset_key: str, queue_key: str, now: float, limit: int
+    ) -> list:
+        """Atomically moves up to `limit` due events from a sorted set to a queue."""
+        return await self._promote_due_script(
+            keys=[zset_key, queue_key], args=[now, limit]
+        )
+
+    async def push_event_to_ordering_lane(
+        self, lane_key: str, queue_key: str, event_id: str
+    ) -> int:
+        """Appends an event to its ordering lane, queueing it when the lane was idle."""
+        return await self._enqueue_ordered_script(
+            keys=[lane_key, queue_key], args=[event_id]
+        )
+
+    async def push_events_to_queue_and_lanes(
+        self,
+        queue_key: str,
+        event_ids: List[str],
+        lane_event_ids: List[Tuple[str, str]],
+    ) -> None:
+        """Pushes events to the queue and to their ordering lanes in one round trip."""
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            if event_ids:
+                pipe.lpush(queue_key, *event_ids)
+            for lane_key, event_id in lane_event_ids:
+                await self._enqueue_ordered_script(
+                    keys=[lane_key, queue_key], args=[event_id], client=pipe
+                )
+            await pipe.execute()
+
+    async def pop_event_from_ordering_lane(
+        self, lane_key: str, queue_key: str, event_id: str
+    ) -> Any:
+        """Pops the resolved head of an ordering lane and queues the next event."""
+        return await self._release_ordering_key_script(
+            keys=[lane_key, queue_key], args=[event_id]
+        )
+
+    async def set_values_with_ttl(
+        self, mapping: Dict[str, str], ttl_seconds: float
+    ) -> None:
+        """Sets string values expiring after the TTL in one pipelined round trip."""
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(name=key, value=value, px=int(ttl_seconds * 1000))
+            await pipe.execute()
+
+    async def get_value(self, key: str) -> Optional[str]:
+        """Fetches a string value."""
+        value = await self.redis_client.get(name=key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def delete_keys(self, *keys: str) -> None:
+        """Deletes one or more keys."""
+        if keys:
+            await self.redis_client.delete(*keys)
+
+    async def get_queue_stats(self, queue_key: str, retry_key: str) -> QueueStatsDTO:
+        """Fetches depth and oldest entries of the main and retry queues in one round trip."""
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.llen(queue_key)
+            # Items are LPUSHed and popped from the right, so the oldest sits at -1
+            pipe.lindex(queue_key, -1)
+            pipe.zcard(retry_key)
+            pipe.zrange(retry_key, 0, 0, withscores=True)
+            queue_depth, oldest_item, retry_depth, oldest_retry = await pipe.execute()
+
+        if isinstance(oldest_item, bytes):
+            oldest_item = oldest_item.decode()
+        return QueueStatsDTO(
+            queue_depth=queue_depth,
+            oldest_queue_item=oldest_item,
+            retry_depth=retry_depth,
+            oldest_retry_score=oldest_retry[0][1] if oldest_retry else None,
+        )
@@ -1,15 +1,24 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Response, status
 from fastapi.exceptions import HTTPException, ResponseValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.api.v1.webhooks import webhook_router
 from app.config.database import close_db_client, init_db_client
 from app.config.indexes import CreateDbCollectionIndexes
 from app.config.settings import settings
+from app.dependencies.admission import ingest_admission_controller
+from app.dependencies.backends import is_memory_backend, reset_backends
 from app.schemas.base import HealthCheck
+from app.tasks.dead_letter_replay import (
+    cancel_dead_letter_replays,
+    dead_letter_replay_watchdog,
+)
+from app.tasks.ingest_admission import ingest_admission_sampler
 from app.utils.custom_exception_handlers import (
     authentication_exception_handler,
     global_exception_handler,
@@ -36,18 +45,42 @@ async def lifespan(app: FastAPI):
     """Manage application startup and shutdown lifecycle."""
 
     logger.info("Application startup initiated")
-    try:
-        await init_db_client()
-    except Exception:
-        logger.exception("MongoDB initialization failed during startup")
-        raise
-    # Creating db indexes for all db collections
-    index_creator = CreateDbCollectionIndexes()
-    await index_creator.create_all_collections_indexes()
+    if not is_memory_backend():
+        try:
+            await init_db_client()
+        except Exception:
+            logger.exception("MongoDB initialization failed during startup")
+            raise
+        # Creating db indexes only when their spec changed since they were last created
+        if settings.CREATE_INDEXES_ON_STARTUP:
+            index_creator = CreateDbCollectionIndexes()
+            await index_creator.ensure_collections_indexes()
+
+    # The in-memory backend is process-local, so delivery must run inside the API process
+    worker_tasks = []
+    if settings.RUN_DELIVERY_WORKER_IN_API or is_memory_backend():
+        from app.tasks.webhook_delivery import start_webhook_worker_tasks
+
+        worker_tasks = start_webhook_worker_tasks()
+        logger.info("Webhook delivery worker started inside the API process")
+    else:
+        from app.tasks.latency_rollups import stage_latency_rollup_flusher
+
+        # Flushing the ingest stage latencies recorded by this process
+        worker_tasks = [asyncio.create_task(stage_latency_rollup_flusher())]
+    if ingest_admission_controller.is_enabled:
+        worker_tasks.append(asyncio.create_task(ingest_admission_sampler()))
+    # Replays run in API processes, so these resume the ones a crashed process left
+    worker_tasks.append(asyncio.create_task(dead_letter_replay_watchdog()))
 
     yield
     # Shutdown
+    await cancel_dead_letter_replays()
+    for task in worker_tasks:
+        task.cancel()
+    await asyncio.gather(*worker_tasks, return_exceptions=True)
     await close_db_client()
+    reset_backends()
     logger.info("Application shutdown completed")
 
 
@@ -95,4 +128,10 @@ async def get_health() -> dict:
     return {"status": "OK"}
 
 
+@app.get("/metrics", tags=["Monitoring"], include_in_schema=False)
+async def get_metrics() -> Response:
+    """Expose Prometheus metrics collected by the API process."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 app.include_router(router=webhook_router)
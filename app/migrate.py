@@ -0,0 +1,25 @@
+import asyncio
+import logging
+
+from app.config.database import close_db_client, init_db_client
+from app.config.indexes import CreateDbCollectionIndexes
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """Create the MongoDB indexes, e.g. as a deploy step ahead of the API and workers."""
+    await init_db_client()
+    try:
+        await CreateDbCollectionIndexes().create_all_collections_indexes()
+        logger.info("MongoDB indexes created")
+    finally:
+        await close_db_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
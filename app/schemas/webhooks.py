@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -8,7 +8,16 @@ from app.schemas.base import (
     BasePaginatedResponseSchema,
     BaseResponseSchema,
 )
-from app.utils.enums.webhooks import WebhookStatusEnum
+from app.utils.constants.webhooks import (
+    DEAD_LETTER_REPLAY_DEFAULT_RATE,
+    DEAD_LETTER_REPLAY_MAX_RATE,
+)
+from app.utils.enums.webhooks import (
+    DeliveryStageEnum,
+    ReplayJobStatusEnum,
+    SearchCountStrategyEnum,
+    WebhookStatusEnum,
+)
 
 
 class WebhookBaseSchema(BaseModel):
@@ -17,12 +26,18 @@ class WebhookBaseSchema(BaseModel):
     data: Any
     idempotency_key: str
     status: WebhookStatusEnum = WebhookStatusEnum.RECEIVED
-    received_at: datetime = datetime.now(tz=timezone.utc)
+    received_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
     event_type: Optional[str] = None
+    ordering_key: Optional[str] = None
+    attrs: Dict[str, str] = {}
+    expires_at: Optional[datetime] = None
     attempt_count: int = 0
     delivery_logs: List[dict] = []
     locked_until: Optional[datetime] = None
-    next_retry_at: Optional[datetime] = datetime.now(tz=timezone.utc)
+    next_retry_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(tz=timezone.utc)
+    )
+    stage_timestamps: Dict[str, float] = {}
 
 
 class WebhookIngestSchema(WebhookBaseSchema):
@@ -38,6 +53,8 @@ class WebhookDeliveryLogsSchema(BaseModel):
     attempt_number: int
     status_code: int
     success: bool
+    retry_delay: Optional[float] = None
+    stage_timestamps: Dict[str, float] = {}
 
 
 class WebhookReadSchema(WebhookBaseSchema):
@@ -49,6 +66,27 @@ class WebhookReadSchema(WebhookBaseSchema):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
 
 
+class WebhookEventStatusSchema(BaseModel):
+    """Schema for the delivery status of a single webhook event, without its payload."""
+
+    id: str = Field(..., alias="_id")
+    idempotency_key: str
+    event_type: Optional[str] = None
+    status: WebhookStatusEnum
+    attempt_count: int = 0
+    last_status_code: Optional[int] = None
+    received_at: Optional[datetime] = None
+    next_retry_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+
+class WebhookEventStatusResponseSchema(BaseResponseSchema):
+    """Response schema for webhook event status lookup API endpoints."""
+
+    data: WebhookEventStatusSchema
+
+
 class WebhookAggregateSchema(BaseModel):
     """Schema for aggregated counts of webhook events."""
 
@@ -68,9 +106,85 @@ class WebhookListPaginatedSchema(BasePaginatedResponseSchema):
     """Paginated schema for a list of webhook search results."""
 
     results: WebhookSearchAggregateSchema
+    count_strategy: Optional[SearchCountStrategyEnum] = None
 
 
 class WebhookListResponseSchema(BaseResponseSchema):
     """Response schema for webhook list API endpoint."""
 
     data: WebhookListPaginatedSchema
+
+
+class WebhookStageLatencySchema(BaseModel):
+    """Schema for latency percentiles of a single delivery lifecycle stage."""
+
+    stage: DeliveryStageEnum
+    count: int
+    mean_ms: Optional[float]
+    p50_ms: Optional[float]
+    p95_ms: Optional[float]
+    p99_ms: Optional[float]
+
+
+class WebhookLatencyBreakdownSchema(BaseModel):
+    """Schema for per-stage latency percentiles within a time window."""
+
+    timestamp_from: datetime
+    timestamp_to: datetime
+    event_type: Optional[str]
+    stages: List[WebhookStageLatencySchema]
+
+
+class WebhookLatencyBreakdownResponseSchema(BaseResponseSchema):
+    """Response schema for webhook latency breakdown API endpoint."""
+
+    data: WebhookLatencyBreakdownSchema
+
+
+class WebhookDeadLetterPaginatedSchema(BasePaginatedResponseSchema):
+    """Paginated schema for a list of permanently failed webhook events."""
+
+    results: List[WebhookReadSchema]
+
+
+class WebhookDeadLetterListResponseSchema(BaseResponseSchema):
+    """Response schema for webhook dead-letter list API endpoint."""
+
+    data: WebhookDeadLetterPaginatedSchema
+
+
+class WebhookReplayRequestSchema(BaseModel):
+    """Schema selecting the dead-lettered events to replay and the replay pace."""
+
+    event_type: Optional[str] = None
+    timestamp_from: Optional[datetime] = None
+    timestamp_to: Optional[datetime] = None
+    status_code: Optional[int] = None
+    max_events_per_second: int = Field(
+        default=DEAD_LETTER_REPLAY_DEFAULT_RATE,
+        gt=0,
+        le=DEAD_LETTER_REPLAY_MAX_RATE,
+    )
+
+
+class WebhookReplayJobSchema(BaseModel):
+    """Schema for the state and progress of a dead-letter replay job."""
+
+    id: str = Field(..., alias="_id")
+    status: ReplayJobStatusEnum
+    filters: dict
+    max_events_per_second: int
+    total_count: int
+    replayed_count: int
+    reset_count: int
+    batch_count: int
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class WebhookReplayJobResponseSchema(BaseResponseSchema):
+    """Response schema for webhook dead-letter replay job API endpoints."""
+
+    data: WebhookReplayJobSchema
@@ -0,0 +1,51 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.base import BaseResponseSchema
+from app.utils.constants.webhooks import WORKER_ADMIN_MAX_CONCURRENCY
+
+
+class WorkerInFlightAttemptSchema(BaseModel):
+    """Schema for the longest running delivery attempt of the worker."""
+
+    description: str
+    destination: str
+    age_seconds: float
+
+
+class WorkerDestinationStatsSchema(BaseModel):
+    """Schema for the concurrency and recent latency of one delivery destination."""
+
+    destination: str
+    in_flight: int
+    latency_p50_seconds: Optional[float] = None
+    latency_p99_seconds: Optional[float] = None
+
+
+class WorkerStatsSchema(BaseModel):
+    """Schema for the live runtime state of the delivery worker."""
+
+    running: bool
+    dequeue_paused: bool
+    concurrency_limit: int
+    concurrency_in_use: int
+    concurrency_waiting: int
+    in_flight_tasks: int
+    queue_pops_per_second: float
+    claims_per_second: float
+    event_loop_lag_seconds: float
+    oldest_in_flight: Optional[WorkerInFlightAttemptSchema] = None
+    destinations: List[WorkerDestinationStatsSchema]
+
+
+class WorkerStatsResponseSchema(BaseResponseSchema):
+    """Response schema for worker admin API endpoints."""
+
+    data: WorkerStatsSchema
+
+
+class WorkerConcurrencyRequestSchema(BaseModel):
+    """Schema for changing the delivery concurrency of a running worker."""
+
+    limit: int = Field(..., gt=0, le=WORKER_ADMIN_MAX_CONCURRENCY)
@@ -0,0 +1,10 @@
+from functools import lru_cache
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+@lru_cache(maxsize=None)
+def load_lua_script(file_name: str) -> str:
+    """Read a Lua script shipped with the package, independent of the working directory."""
+    return (SCRIPTS_DIR / file_name).read_text()
@@ -0,0 +1,15 @@
+local lane_key = KEYS[1]
+local queue_key = KEYS[2]
+
+local event_id = ARGV[1]
+
+-- Appending the event to the lane of its ordering key
+local lane_length = redis.call("RPUSH", lane_key, event_id)
+
+-- Only the head of a lane is ever in the delivery queue, so an idle lane releases its
+-- new head right away while a busy lane holds it until the previous event resolves
+if lane_length == 1 then
+    redis.call("LPUSH", queue_key, event_id)
+end
+
+return lane_length
@@ -0,0 +1,50 @@
+local bucket_key = KEYS[1]
+local quota_key = KEYS[2]
+
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local daily_quota = tonumber(ARGV[4])
+local quota_ttl = tonumber(ARGV[5])
+
+-- Checking the daily quota first, so a request over quota does not spend a token
+if daily_quota > 0 then
+    local used = tonumber(redis.call("GET",quota_key) or "0")
+    if used >= daily_quota then
+        return {"0", tostring(quota_ttl), "quota"}
+    end
+end
+
+if rate > 0 then
+    -- Fetching the existing state of bucket, initializing it when missing
+    local data = redis.call("HMGET",bucket_key,"tokens","last_refill")
+    local tokens = tonumber(data[1])
+    local last_refill = tonumber(data[2])
+    if tokens == nil then
+        tokens = capacity
+        last_refill = now
+    end
+
+    -- Refilling tokens, handling skewed clocks
+    local elapsed = now - last_refill
+    if elapsed < 0 then
+        elapsed = 0
+    end
+    tokens = math.min(capacity, tokens + elapsed * rate)
+
+    if tokens < 1 then
+        -- Seconds until the next whole token is available
+        return {"0", tostring((1 - tokens) / rate), "rate"}
+    end
+
+    redis.call("HMSET",bucket_key,"tokens",tokens - 1,"last_refill",now)
+    redis.call("EXPIRE",bucket_key,math.ceil(capacity/rate) + 5)
+end
+
+-- Counting the request against today's quota, expiring the counter at day end
+if daily_quota > 0 then
+    redis.call("INCR",quota_key)
+    redis.call("EXPIRE",quota_key,quota_ttl)
+end
+
+return {"1", "0", ""}
@@ -0,0 +1,19 @@
+local zset_key = KEYS[1]
+local queue_key = KEYS[2]
+
+local now = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+
+-- Fetching the retries that are due
+local due = redis.call("ZRANGEBYSCORE", zset_key, "-inf", now, "LIMIT", 0, limit)
+
+if #due == 0 then
+    return due
+end
+
+-- Moving due retries to the delivery queue and removing them from the retry set atomically,
+-- so concurrent schedulers never push the same retry twice
+redis.call("LPUSH", queue_key, unpack(due))
+redis.call("ZREM", zset_key, unpack(due))
+
+return due
@@ -0,0 +1,22 @@
+local lane_key = KEYS[1]
+local queue_key = KEYS[2]
+
+local event_id = ARGV[1]
+
+-- Only the head may release its lane, e.g. a replayed dead letter that is no longer the
+-- head leaves the lane untouched. An event that expired while waiting behind the head
+-- is removed, so the lane does not queue it once it reaches the head.
+if redis.call("LINDEX", lane_key, 0) ~= event_id then
+    redis.call("LREM", lane_key, 1, event_id)
+    return false
+end
+
+redis.call("LPOP", lane_key)
+
+-- Releasing the next event of the lane to the delivery queue atomically with the pop
+local next_event_id = redis.call("LINDEX", lane_key, 0)
+if next_event_id then
+    redis.call("LPUSH", queue_key, next_event_id)
+end
+
+return next_event_id
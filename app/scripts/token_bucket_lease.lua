@@ -0,0 +1,47 @@
+local key = KEYS[1]
+
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+
+-- Fetching the existing state of bucket
+local data = redis.call("HMGET",key,"tokens","last_refill")
+
+local tokens = tonumber(data[1])
+local last_refill = tonumber(data[2])
+
+-- Initializing the token key bucket if it doesn't exist
+if tokens == nil then
+    tokens = capacity
+    last_refill = now
+end
+
+-- Calculating the elapsed time, handling skewed clocks
+local elapsed = now - last_refill
+if elapsed < 0 then
+    elapsed = 0
+end
+
+-- Refilling tokens
+tokens = math.min(capacity, tokens + elapsed * rate)
+
+-- Granting as many whole tokens as available, up to the requested lease
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+
+-- Seconds until the next whole token is available when nothing could be granted
+local retry_after = 0
+if granted == 0 then
+    retry_after = (1 - tokens) / rate
+end
+
+-- Saving updated state
+redis.call("HMSET",key,"tokens",tokens,"last_refill",now)
+
+-- Autocleaning up of resources
+local ttl = math.ceil(capacity/rate) + 5
+redis.call("EXPIRE",key,ttl)
+
+-- Returning strings, since Lua numbers are truncated to integers in replies
+return {tostring(granted), tostring(retry_after)}
@@ -0,0 +1,96 @@
+import asyncio
+import gzip
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from bson import json_util
+
+from app.backends.base import WebhookEventStore
+from app.utils.constants.webhooks import (
+    EVENT_ARCHIVE_BATCH_PAUSE_SECONDS,
+    EVENT_ARCHIVE_BATCH_SIZE,
+    FINISHED_WEBHOOK_STATUSES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def write_archive_batch(archive_path: str, documents: List[dict]) -> None:
+    """Append documents as NDJSON to a gzip file, one gzip member per batch."""
+    lines = "".join(
+        json_util.dumps(document, json_options=json_util.RELAXED_JSON_OPTIONS) + "\n"
+        for document in documents
+    )
+    with gzip.open(archive_path, mode="ab") as archive_file:
+        archive_file.write(lines.encode())
+
+
+class EventArchivalService:
+    """Moves finished webhook events past their retention out of the hot event store."""
+
+    def __init__(
+        self,
+        event_store: WebhookEventStore,
+        retention_days: int,
+        idempotency_window_days: int,
+        archive_dir: Optional[str] = None,
+    ):
+        self.event_store = event_store
+        self.retention_days = retention_days
+        self.idempotency_window_days = idempotency_window_days
+        self.archive_dir = archive_dir
+
+    def _build_expired_filter_dict(self, now: datetime) -> dict:
+        """
+        Match finished events past retention whose idempotency key has also left the
+        idempotency window, so a late duplicate can never be ingested as a new event.
+        """
+        return {
+            "status": {"$in": list(FINISHED_WEBHOOK_STATUSES)},
+            "finished_at": {"$lt": now - timedelta(days=self.retention_days)},
+            "received_at": {"$lt": now - timedelta(days=self.idempotency_window_days)},
+        }
+
+    async def archive_finished_events(self) -> int:
+        """
+        Archive (when an archive directory is configured) and delete expired events in
+        bounded batches, returning the number of events removed.
+        """
+        now = datetime.now(tz=timezone.utc)
+        filter_dict = self._build_expired_filter_dict(now=now)
+        archive_path = None
+        if self.archive_dir:
+            os.makedirs(self.archive_dir, exist_ok=True)
+            archive_path = os.path.join(
+                self.archive_dir, f"webhook_events-{now:%Y-%m-%d}.ndjson.gz"
+            )
+
+        removed_count = 0
+        while True:
+            documents = await self.event_store.find_events(
+                filter_dict=filter_dict, limit=EVENT_ARCHIVE_BATCH_SIZE
+            )
+            if not documents:
+                break
+            if archive_path:
+                # Compression and file I/O stay off the event loop
+                await asyncio.to_thread(write_archive_batch, archive_path, documents)
+            # Re-checking the filter so events replayed since the read are kept
+            removed_count += await self.event_store.delete_events(
+                filter_dict={
+                    **filter_dict,
+                    "_id": {"$in": [document["_id"] for document in documents]},
+                }
+            )
+            if len(documents) < EVENT_ARCHIVE_BATCH_SIZE:
+                break
+            await asyncio.sleep(EVENT_ARCHIVE_BATCH_PAUSE_SECONDS)
+
+        if removed_count:
+            logger.info(
+                f"Removed {removed_count} finished webhook events"
+                + (f", archived to {archive_path}" if archive_path else "")
+            )
+        return removed_count
@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from bson import ObjectId
+
+from app.backends.base import (
+    EventStatusCache,
+    ReplayJobStore,
+    WebhookEventStore,
+    WebhookQueue,
+)
+from app.dependencies.filtering import WebhookDeadLetterFilter
+from app.dependencies.pagination import PaginationParams
+from app.integrations.metrics import observe_query
+from app.schemas.webhooks import WebhookReplayRequestSchema
+from app.utils.constants.webhooks import (
+    DEAD_LETTER_REPLAY_BATCH_SIZE,
+    DEAD_LETTER_REPLAY_STALE_SECONDS,
+)
+from app.utils.enums.webhooks import ReplayJobStatusEnum
+
+logger = logging.getLogger(__name__)
+
+
+def get_replay_filter_dict(replay_request: WebhookReplayRequestSchema) -> dict:
+    """Build the dead-letter filter a replay request selects its events with."""
+    filter_params = WebhookDeadLetterFilter(
+        timestamp_from=replay_request.timestamp_from,
+        timestamp_to=replay_request.timestamp_to,
+        event_type=replay_request.event_type,
+        status_code=replay_request.status_code,
+    )
+    filter_params.validate_timestamp()
+    return filter_params._build_filters_dict()
+
+
+class DeadLetterService:
+    """Handles listing and throttled replay of permanently failed webhook events."""
+
+    def __init__(
+        self,
+        event_store: WebhookEventStore,
+        webhook_queue: WebhookQueue,
+        replay_job_store: ReplayJobStore,
+        analytics_event_store: Optional[WebhookEventStore] = None,
+        event_status_cache: Optional[EventStatusCache] = None,
+    ):
+        self.event_store = event_store
+        self.webhook_queue = webhook_queue
+        self.replay_job_store = replay_job_store
+        # Listing may read from secondaries, replay selects and resets on the primary
+        self.analytics_event_store = analytics_event_store or event_store
+        self.event_status_cache = event_status_cache
+
+    async def get_dead_letter_events(
+        self,
+        pagination_params: PaginationParams,
+        filter_params: WebhookDeadLetterFilter,
+    ) -> list:
+        """Retrieve a page of permanently failed events matching the filters."""
+        filter_dict = filter_params._build_filters_dict()
+        pagination_params.total_count = await observe_query(
+            route="dead_letters",
+            operation="count",
+            query=self.analytics_event_store.count_events(filter_dict=filter_dict),
+        )
+        items = await observe_query(
+            route="dead_letters",
+            operation="find",
+            query=self.analytics_event_store.find_events(
+                filter_dict=filter_dict,
+                offset=pagination_params.offset,
+                limit=pagination_params.page_size,
+            ),
+        )
+        for item in items:
+            item["_id"] = str(item["_id"])
+        return items
+
+    async def create_replay_job(
+        self, replay_request: WebhookReplayRequestSchema
+    ) -> Tuple[dict, dict]:
+        """
+        Persist a replay job for the selected dead letters.
+
+        Returns the job document and the filter the replay runs with.
+        """
+        filter_dict = get_replay_filter_dict(replay_request=replay_request)
+
+        now = datetime.now(tz=timezone.utc)
+        job = await self.replay_job_store.insert_job(
+            document={
+                "status": ReplayJobStatusEnum.RUNNING,
+                "filters": replay_request.model_dump(
+                    exclude={"max_events_per_second"}, mode="json"
+                ),
+                "max_events_per_second": replay_request.max_events_per_second,
+                "total_count": await self.event_store.count_events(
+                    filter_dict=filter_dict
+                ),
+                "replayed_count": 0,
+                "reset_count": 0,
+                "batch_count": 0,
+                "created_at": now,
+                "updated_at": now,
+                "finished_at": None,
+                "error": None,
+            }
+        )
+        return job, filter_dict
+
+    async def run_replay_job(self, job: dict, filter_dict: dict) -> None:
+        """
+        Replay matching dead letters in batches paced to the job's rate cap.
+
+        Each batch costs one id query, one update_many resetting the events, one query
+        reading back the reset events and one queue push. Batches are selected by ascending _id, so events that fail permanently again
+        during the replay are not picked up a second time.
+        """
+        job_id = job["_id"]
+        max_events_per_second = job["max_events_per_second"]
+        batch_size = min(DEAD_LETTER_REPLAY_BATCH_SIZE, max_events_per_second)
+        # A resumed job continues from the progress and cursor it recorded last
+        progress = {
+            "replayed_count": job.get("replayed_count", 0),
+            "reset_count": job.get("reset_count", 0),
+            "batch_count": job.get("batch_count", 0),
+        }
+        after_id: Optional[ObjectId] = job.get("after_id")
+
+        try:
+            while True:
+                batch_start = time.monotonic()
+                event_ids = await self.event_store.find_event_ids(
+                    filter_dict=filter_dict, after_id=after_id, limit=batch_size
+                )
+                if not event_ids:
+                    break
+                reset_events = await self.event_store.reset_events_for_redelivery(
+                    event_ids=event_ids, current_time=datetime.now(tz=timezone.utc)
+                )
+                # Only the reset events are queued, one that left the dead letters since
+                # the id query is not delivered again. Keyed events wait in their lane.
+                await self.webhook_queue.enqueue_batch(
+                    event_ids=[
+                        str(event["_id"])
+                        for event in reset_events
+                        if not event.get("ordering_key")
+                    ],
+                    ordered_event_ids=[
+                        (event["ordering_key"], str(event["_id"]))
+                        for event in reset_events
+                        if event.get("ordering_key")
+                    ],
+                )
+                await self._invalidate_event_statuses(
+                    event_ids=[event["_id"] for event in reset_events]
+                )
+                after_id = event_ids[-1]
+                progress["reset_count"] += len(reset_events)
+                progress["replayed_count"] += len(reset_events)
+                progress["batch_count"] += 1
+                await self.replay_job_store.update_job(
+                    job_id=job_id,
+                    fields={
+                        **progress,
+                        "after_id": after_id,
+                        "updated_at": datetime.now(tz=timezone.utc),
+                    },
+                )
+                # Pacing batches so the replay never exceeds the configured rate
+                await asyncio.sleep(
+                    max(
+                        0.0,
+                        len(event_ids) / max_events_per_second
+                        - (time.monotonic() - batch_start),
+                    )
+                )
+            await self._finish_replay_job(job_id, ReplayJobStatusEnum.COMPLETED)
+            logger.info(
+                f"Replay job {job_id} completed, replayed {progress['replayed_count']} events"
+            )
+        except asyncio.CancelledError:
+            await self._finish_replay_job(job_id, ReplayJobStatusEnum.CANCELLED)
+            raise
+        except Exception as exc:
+            logger.exception(f"Replay job {job_id} failed: {exc}")
+            await self._finish_replay_job(
+                job_id, ReplayJobStatusEnum.FAILED, error=str(exc)
+            )
+
+    async def claim_stale_replay_jobs(self) -> List[Tuple[dict, dict]]:
+        """
+        Take over running jobs that stopped recording progress, e.g. because their
+        process crashed. Returns each job with the filter to resume it with.
+        """
+        now = datetime.now(tz=timezone.utc)
+        stale_before = now - timedelta(seconds=DEAD_LETTER_REPLAY_STALE_SECONDS)
+        stale_jobs = []
+        while True:
+            job = await self.replay_job_store.claim_stale_job(
+                stale_before=stale_before, current_time=now
+            )
+            if job is None:
+                return stale_jobs
+            replay_request = WebhookReplayRequestSchema(
+                **job["filters"], max_events_per_second=job["max_events_per_second"]
+            )
+            stale_jobs.append(
+                (job, get_replay_filter_dict(replay_request=replay_request))
+            )
+
+    async def _invalidate_event_statuses(self, event_ids: List[ObjectId]) -> None:
+        """Drop cached status views of replayed events, which are pending again."""
+        if self.event_status_cache is None:
+            return
+        try:
+            await self.event_status_cache.delete_statuses(
+                event_ids=[str(event_id) for event_id in event_ids]
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to invalidate cached event statuses: {exc}")
+
+    async def _finish_replay_job(
+        self,
+        job_id: ObjectId,
+        status: ReplayJobStatusEnum,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record the final status of a replay job."""
+        now = datetime.now(tz=timezone.utc)
+        await self.replay_job_store.update_job(
+            job_id=job_id,
+            fields={
+                "status": status,
+                "updated_at": now,
+                "finished_at": now,
+                "error": error,
+            },
+        )
+
+    async def get_replay_job(self, job_id: ObjectId) -> Optional[dict]:
+        """Retrieve a replay job with its progress."""
+        job = await self.replay_job_store.get_job(job_id=job_id)
+        if job:
+            job["_id"] = str(job["_id"])
+        return job
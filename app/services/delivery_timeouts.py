@@ -0,0 +1,122 @@
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.config.settings import settings
+from app.integrations.metrics import DELIVERY_TIMEOUT_SECONDS
+from app.utils.constants.webhooks import (
+    ADAPTIVE_TIMEOUT_LOCK_MARGIN_SECONDS,
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+    ADAPTIVE_TIMEOUT_REFRESH_SECONDS,
+    ADAPTIVE_TIMEOUT_SLICE_SECONDS,
+    ADAPTIVE_TIMEOUT_WINDOW_SECONDS,
+    DELIVERY_TIMEOUT,
+    TASK_LOCKED_SECONDS,
+)
+from app.utils.dtos.webhooks import DeliveryTimeoutDTO
+from app.utils.histograms import get_latency_bucket_index, get_percentile_from_buckets
+
+
+def get_max_delivery_timeout() -> float:
+    """Return the upper bound of adaptive timeouts, kept clear of the claim lock."""
+    return min(
+        settings.DELIVERY_TIMEOUT_MAX_SECONDS,
+        TASK_LOCKED_SECONDS - ADAPTIVE_TIMEOUT_LOCK_MARGIN_SECONDS,
+    )
+
+
+class DeliveryTimeoutTracker:
+    """
+    Keeps a rolling latency histogram per destination and derives its delivery timeout
+    from it, as the configured percentile times a factor clamped to the bounds. The upper
+    bound never exceeds the claim lock minus ADAPTIVE_TIMEOUT_LOCK_MARGIN_SECONDS, so an
+    attempt is finalized before another worker can claim its event.
+
+    Histograms are kept in time slices, the oldest slice dropping out once it leaves the
+    window, so the timeout follows a receiver whose latency changes. Timed out requests
+    are recorded with their timeout, which lets the timeout of a receiver that is slower
+    than its current timeout grow towards the upper bound.
+    """
+
+    def __init__(self):
+        # Per destination: slice number -> histogram bucket counts
+        self._slices: Dict[str, Dict[int, Dict[int, int]]] = {}
+        # Per destination: (monotonic time computed, timeout)
+        self._timeouts: Dict[str, Tuple[float, DeliveryTimeoutDTO]] = {}
+
+    def record(self, destination: str, seconds: float) -> None:
+        """Add the latency of one request to the current slice of the destination."""
+        current_slice = int(time.monotonic() // ADAPTIVE_TIMEOUT_SLICE_SECONDS)
+        slices = self._slices.setdefault(destination, {})
+        bucket_counts = slices.setdefault(current_slice, {})
+        index = get_latency_bucket_index(seconds)
+        bucket_counts[index] = bucket_counts.get(index, 0) + 1
+
+    def get_timeout(self, destination: str) -> DeliveryTimeoutDTO:
+        """Return the timeout of the next request, the default until enough samples exist."""
+        if not settings.ADAPTIVE_DELIVERY_TIMEOUT:
+            return DeliveryTimeoutDTO(seconds=DELIVERY_TIMEOUT, adaptive=False)
+        now = time.monotonic()
+        cached = self._timeouts.get(destination)
+        if cached is not None and now - cached[0] < ADAPTIVE_TIMEOUT_REFRESH_SECONDS:
+            return cached[1]
+        timeout = self._compute_timeout(destination=destination, now=now)
+        self._timeouts[destination] = (now, timeout)
+        DELIVERY_TIMEOUT_SECONDS.labels(destination=destination).set(timeout.seconds)
+        return timeout
+
+    def get_destinations(self) -> Iterable[str]:
+        """Return the destinations with recorded latencies."""
+        return list(self._slices)
+
+    def get_latency_percentiles(
+        self, destination: str, percentiles: Iterable[float]
+    ) -> Dict[float, Optional[float]]:
+        """Estimate latency percentiles of a destination over the window."""
+        merged = self._merge_window_slices(
+            destination=destination, now=time.monotonic()
+        )
+        return {
+            percentile: get_percentile_from_buckets(
+                bucket_counts=merged, percentile=percentile
+            )
+            for percentile in percentiles
+        }
+
+    def _merge_window_slices(self, destination: str, now: float) -> Dict[int, int]:
+        """Drop the slices that left the window and merge the remaining ones."""
+        oldest_slice = int(
+            (now - ADAPTIVE_TIMEOUT_WINDOW_SECONDS) // ADAPTIVE_TIMEOUT_SLICE_SECONDS
+        )
+        slices = self._slices.get(destination, {})
+        for slice_number in [number for number in slices if number <= oldest_slice]:
+            del slices[slice_number]
+
+        merged: Dict[int, int] = {}
+        for bucket_counts in slices.values():
+            for index, count in bucket_counts.items():
+                merged[index] = merged.get(index, 0) + count
+        return merged
+
+    def _compute_timeout(self, destination: str, now: float) -> DeliveryTimeoutDTO:
+        """Merge the slices within the window and derive the timeout from them."""
+        merged = self._merge_window_slices(destination=destination, now=now)
+        if sum(merged.values()) < ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return DeliveryTimeoutDTO(seconds=DELIVERY_TIMEOUT, adaptive=False)
+
+        latency = get_percentile_from_buckets(
+            bucket_counts=merged, percentile=settings.DELIVERY_TIMEOUT_PERCENTILE
+        )
+        return DeliveryTimeoutDTO(
+            seconds=min(
+                get_max_delivery_timeout(),
+                max(
+                    settings.DELIVERY_TIMEOUT_MIN_SECONDS,
+                    latency * settings.DELIVERY_TIMEOUT_FACTOR,
+                ),
+            ),
+            adaptive=True,
+        )
+
+
+# Process-wide tracker shared by the deliveries of the worker
+delivery_timeout_tracker = DeliveryTimeoutTracker()
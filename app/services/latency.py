@@ -0,0 +1,203 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from app.backends.base import LatencyRollupStore
+from app.dependencies.filtering import WebhookLatencyFilter
+from app.utils.constants.webhooks import (
+    LATENCY_BREAKDOWN_DEFAULT_WINDOW_HOURS,
+    LATENCY_ROLLUP_BUCKET_SECONDS,
+)
+from app.utils.datetime_utils import get_utc_timestamp
+from app.utils.dtos.webhooks import LatencyRollupDTO
+from app.utils.enums.webhooks import DeliveryStageEnum, WebhookStatusEnum
+from app.utils.histograms import get_latency_bucket_index, get_percentile_from_buckets
+
+
+def get_rollup_bucket_start(timestamp: float) -> datetime:
+    """Return the start of the rollup bucket containing an epoch timestamp."""
+    return datetime.fromtimestamp(
+        timestamp - timestamp % LATENCY_ROLLUP_BUCKET_SECONDS, tz=timezone.utc
+    )
+
+
+class StageLatencyRecorder:
+    """
+    Accumulates stage durations in process as per-minute histograms per event type, so the
+    rollup store receives one increment per (minute, event type, stage) on each flush
+    instead of a write per event.
+    """
+
+    def __init__(self):
+        self._rollups: Dict[Tuple[datetime, Optional[str], str], list] = {}
+
+    def record(
+        self,
+        stage: DeliveryStageEnum,
+        event_type: Optional[str],
+        seconds: float,
+        at: float,
+    ) -> None:
+        """Add one duration to the histogram of the minute containing `at`."""
+        # Stages spanning processes compare wall clocks of different hosts
+        seconds = max(0.0, seconds)
+        key = (get_rollup_bucket_start(at), event_type, stage.value)
+        rollup = self._rollups.get(key)
+        if rollup is None:
+            rollup = self._rollups[key] = [0, 0.0, {}]
+        rollup[0] += 1
+        rollup[1] += seconds
+        index = get_latency_bucket_index(seconds)
+        rollup[2][index] = rollup[2].get(index, 0) + 1
+
+    def record_delivery_attempt(
+        self,
+        event: dict,
+        stage_timestamps: Dict[str, float],
+        final_status: WebhookStatusEnum,
+        retry_delay: Optional[float],
+        finalize_seconds: float,
+    ) -> None:
+        """Record the stage durations of one delivery attempt from its stage timestamps."""
+        event_type = event.get("event_type")
+        finalized = stage_timestamps["finalized"]
+        event_stage_timestamps = event.get("stage_timestamps", {})
+        # A replayed event starts over at its replay, so its dead-lettered history does
+        # not count as queue wait or end-to-end latency
+        received = event_stage_timestamps.get(
+            "replayed", event_stage_timestamps.get("received")
+        )
+        # The first attempt becomes ready on ingest, later ones when their retry is due
+        ready = received
+        if event["attempt_count"] and event.get("next_retry_at"):
+            ready = get_utc_timestamp(event["next_retry_at"])
+
+        stage_bounds = (
+            (DeliveryStageEnum.QUEUE_WAIT, ready, "dequeued"),
+            (DeliveryStageEnum.CLAIM, stage_timestamps.get("dequeued"), "claimed"),
+            (
+                DeliveryStageEnum.DISPATCH,
+                stage_timestamps.get("claimed"),
+                "request_sent",
+            ),
+            (
+                DeliveryStageEnum.RECEIVER,
+                stage_timestamps.get("request_sent"),
+                "response_received",
+            ),
+        )
+        for stage, start, end_key in stage_bounds:
+            end = stage_timestamps.get(end_key)
+            if start is not None and end is not None:
+                self.record(stage, event_type, end - start, at=finalized)
+
+        self.record(DeliveryStageEnum.FINALIZE, event_type, finalize_seconds, finalized)
+        if final_status == WebhookStatusEnum.FAILED_TEMPORARILY:
+            self.record(
+                DeliveryStageEnum.RETRY_BACKOFF, event_type, retry_delay, finalized
+            )
+        elif received is not None:
+            self.record(
+                DeliveryStageEnum.END_TO_END,
+                event_type,
+                finalized - received,
+                finalized,
+            )
+
+    def drain(self) -> List[LatencyRollupDTO]:
+        """Return and clear the rollups accumulated since the previous drain."""
+        rollups, self._rollups = self._rollups, {}
+        return [
+            LatencyRollupDTO(
+                bucket_start=bucket_start,
+                event_type=event_type,
+                stage=stage,
+                count=count,
+                total_seconds=total_seconds,
+                bucket_counts=bucket_counts,
+            )
+            for (bucket_start, event_type, stage), (
+                count,
+                total_seconds,
+                bucket_counts,
+            ) in rollups.items()
+        ]
+
+    def restore(self, rollups: List[LatencyRollupDTO]) -> None:
+        """Merge drained rollups back, e.g. after a failed flush."""
+        for rollup in rollups:
+            key = (rollup.bucket_start, rollup.event_type, rollup.stage)
+            stored = self._rollups.setdefault(key, [0, 0.0, {}])
+            stored[0] += rollup.count
+            stored[1] += rollup.total_seconds
+            for index, count in rollup.bucket_counts.items():
+                stored[2][index] = stored[2].get(index, 0) + count
+
+
+# Process-wide recorder shared by the ingest path and the delivery worker
+stage_latency_recorder = StageLatencyRecorder()
+
+
+class LatencyBreakdownService:
+    """Flushes recorded stage latencies and serves percentiles from the rollup store."""
+
+    def __init__(self, rollup_store: LatencyRollupStore):
+        self.rollup_store = rollup_store
+
+    async def flush_recorded_latencies(self, recorder: StageLatencyRecorder) -> int:
+        """Write the recorder's pending rollups to the store, keeping them on failure."""
+        rollups = recorder.drain()
+        try:
+            await self.rollup_store.increment_rollups(rollups=rollups)
+        except Exception:
+            recorder.restore(rollups)
+            raise
+        return len(rollups)
+
+    async def get_latency_breakdown(self, filter_params: WebhookLatencyFilter) -> dict:
+        """Compute count, mean and p50/p95/p99 per stage for the filtered window."""
+        timestamp_to = filter_params.timestamp_to or datetime.now(tz=timezone.utc)
+        timestamp_from = filter_params.timestamp_from or timestamp_to - timedelta(
+            hours=LATENCY_BREAKDOWN_DEFAULT_WINDOW_HOURS
+        )
+        rollups = await self.rollup_store.find_rollups(
+            # Whole minutes overlapping the window are included
+            bucket_from=get_rollup_bucket_start(get_utc_timestamp(timestamp_from)),
+            bucket_to=datetime.fromtimestamp(
+                get_utc_timestamp(timestamp_to), tz=timezone.utc
+            ),
+            event_type=filter_params.event_type,
+        )
+
+        merged: Dict[str, list] = {}
+        for rollup in rollups:
+            stage = merged.setdefault(rollup["stage"], [0, 0.0, {}])
+            stage[0] += rollup["count"]
+            stage[1] += rollup["total_seconds"]
+            for index, count in rollup["bucket_counts"].items():
+                stage[2][int(index)] = stage[2].get(int(index), 0) + count
+
+        stages = []
+        for stage in DeliveryStageEnum:
+            if stage.value not in merged:
+                continue
+            count, total_seconds, bucket_counts = merged[stage.value]
+            stages.append(
+                {
+                    "stage": stage,
+                    "count": count,
+                    "mean_ms": total_seconds / count * 1000 if count else None,
+                    **{
+                        f"p{percentile}_ms": get_percentile_from_buckets(
+                            bucket_counts, percentile
+                        )
+                        * 1000
+                        for percentile in (50, 95, 99)
+                    },
+                }
+            )
+        return {
+            "timestamp_from": timestamp_from,
+            "timestamp_to": timestamp_to,
+            "event_type": filter_params.event_type,
+            "stages": stages,
+        }
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from app.backends.base import SigningKeyStore
+from app.utils.constants.webhooks import SIGNING_KEY_ID_PATTERN
+from app.utils.datetime_utils import get_utc_datetime
+from app.utils.dtos.webhooks import SigningKeyDTO
+from app.utils.security.hmac_services import HMACServices
+
+logger = logging.getLogger(__name__)
+
+
+class SigningKeyService:
+    """
+    Resolves producer key ids to pre-keyed HMAC objects.
+
+    Resolved keys are cached per process in an LRU with a TTL, so signature checks only
+    reach the key store once per key id and TTL. Unknown key ids are remembered in a
+    separate, smaller LRU with a shorter TTL, so made-up key ids can neither evict real
+    keys nor keep a newly inserted key rejected for long. Key ids of an unexpected format
+    are rejected without a lookup.
+    """
+
+    def __init__(
+        self,
+        key_store: SigningKeyStore,
+        cache_ttl_seconds: float,
+        max_keys: int,
+        negative_cache_ttl_seconds: float,
+        max_unknown_keys: int,
+    ):
+        self.key_store = key_store
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.max_keys = max_keys
+        self.negative_cache_ttl_seconds = negative_cache_ttl_seconds
+        self.max_unknown_keys = max_unknown_keys
+        self._cache: "OrderedDict[str, Tuple[float, List[SigningKeyDTO]]]" = (
+            OrderedDict()
+        )
+        self._unknown_cache: "OrderedDict[str, Tuple[float, List[SigningKeyDTO]]]" = (
+            OrderedDict()
+        )
+        self._pending_loads: Dict[str, asyncio.Task] = {}
+        self._key_id_pattern = re.compile(SIGNING_KEY_ID_PATTERN)
+
+    async def get_valid_signing_keys(
+        self, key_id: str, now: datetime
+    ) -> List[SigningKeyDTO]:
+        """Return the keys of a key id valid at `now`, several while keys overlap."""
+        if not self._key_id_pattern.fullmatch(key_id):
+            return []
+        return [
+            signing_key
+            for signing_key in await self._get_signing_keys(key_id=key_id)
+            if (signing_key.valid_from is None or signing_key.valid_from <= now)
+            and (signing_key.valid_until is None or now < signing_key.valid_until)
+        ]
+
+    async def _get_signing_keys(self, key_id: str) -> List[SigningKeyDTO]:
+        """Return the cached keys of a key id, loading them once the entry has expired."""
+        cache = self._cache if key_id in self._cache else self._unknown_cache
+        cached = cache.get(key_id)
+        if cached is not None and cached[0] > time.monotonic():
+            cache.move_to_end(key_id)
+            return cached[1]
+
+        # Concurrent misses of one key id share a single store query
+        task = self._pending_loads.get(key_id)
+        if task is None:
+            task = asyncio.create_task(self._load_signing_keys(key_id=key_id))
+            self._pending_loads[key_id] = task
+            task.add_done_callback(lambda _: self._pending_loads.pop(key_id, None))
+        try:
+            return await asyncio.shield(task)
+        except Exception as exc:
+            if cached is None:
+                raise
+            # Serving the expired entry keeps producers verifiable while the store is down
+            logger.warning(f"Failed to refresh signing key {key_id}: {exc}")
+            return cached[1]
+
+    async def _load_signing_keys(self, key_id: str) -> List[SigningKeyDTO]:
+        """Load the keys of a key id from the store into the cache."""
+        documents = await self.key_store.find_signing_keys(key_id=key_id)
+        signing_keys = [
+            SigningKeyDTO(
+                keyed_hmac=HMACServices.get_keyed_hmac(secret=document["secret"]),
+                valid_from=(
+                    get_utc_datetime(value=document["valid_from"])
+                    if document.get("valid_from")
+                    else None
+                ),
+                valid_until=(
+                    get_utc_datetime(value=document["valid_until"])
+                    if document.get("valid_until")
+                    else None
+                ),
+            )
+            for document in documents
+        ]
+        if signing_keys:
+            self._unknown_cache.pop(key_id, None)
+            self._set_cached(
+                self._cache, key_id, signing_keys, self.cache_ttl_seconds, self.max_keys
+            )
+        else:
+            self._cache.pop(key_id, None)
+            self._set_cached(
+                self._unknown_cache,
+                key_id,
+                signing_keys,
+                self.negative_cache_ttl_seconds,
+                self.max_unknown_keys,
+            )
+        return signing_keys
+
+    @staticmethod
+    def _set_cached(
+        cache: "OrderedDict[str, Tuple[float, List[SigningKeyDTO]]]",
+        key_id: str,
+        signing_keys: List[SigningKeyDTO],
+        ttl_seconds: float,
+        max_keys: int,
+    ) -> None:
+        """Cache the keys of a key id, evicting the least recently used beyond the cap."""
+        cache[key_id] = (time.monotonic() + ttl_seconds, signing_keys)
+        cache.move_to_end(key_id)
+        if len(cache) > max_keys:
+            cache.popitem(last=False)
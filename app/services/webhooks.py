@@ -1,168 +1,418 @@
-from datetime import datetime, timedelta
-from typing import Optional
+import hashlib
+import json
+import logging
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import ReturnDocument
-from pymongo.errors import DuplicateKeyError, PyMongoError
 
+from app.backends.base import (
+    EventStatusCache,
+    SearchCountCache,
+    WebhookEventStore,
+    WebhookQueue,
+)
 from app.dependencies.filtering import WebhookEventFilter
 from app.dependencies.pagination import PaginationParams
-from app.integrations.redis_client import RedisService
+from app.integrations.metrics import (
+    EVENTS_EXPIRED,
+    INGEST_ENQUEUE_SECONDS,
+    INGEST_INSERT_SECONDS,
+    QUERY_SECONDS,
+    observe_query,
+)
 from app.schemas.webhooks import WebhookIngestSchema
-from app.utils.constants.webhooks import TASK_LOCKED_SECONDS
-from app.utils.enums.webhooks import WebhookStatusEnum
-from app.utils.exceptions.webhooks import WebhookEventException
+from app.services.group_commit import IngestGroupCommitter
+from app.services.latency import stage_latency_recorder
+from app.utils.constants.webhooks import (
+    EXPORT_CHUNK_BYTES,
+    EXPORT_CURSOR_BATCH_SIZE,
+    FINISHED_WEBHOOK_STATUSES,
+    TASK_LOCKED_SECONDS,
+)
+from app.utils.dtos.webhooks import SearchCountDTO
+from app.utils.enums.webhooks import (
+    DeliveryStageEnum,
+    SearchCountStrategyEnum,
+    WebhookStatusEnum,
+)
+from app.utils.exceptions.webhooks import (
+    DuplicateWebhookEventException,
+    WebhookEventException,
+)
+from app.utils.serializers import get_json_compatible_value
+
+logger = logging.getLogger(__name__)
+
+
+def get_event_status_view(event: dict) -> dict:
+    """Return the fields of an event answering status lookups, without payload and logs."""
+    return {
+        "_id": str(event["_id"]),
+        "idempotency_key": event["idempotency_key"],
+        "event_type": event.get("event_type"),
+        "status": event["status"],
+        "attempt_count": event.get("attempt_count", 0),
+        "last_status_code": event.get("last_status_code"),
+        "received_at": event.get("received_at"),
+        "next_retry_at": event.get("next_retry_at"),
+        "finished_at": event.get("finished_at"),
+        "expires_at": event.get("expires_at"),
+    }
+
+
+def get_filter_hash(filter_dict: dict) -> str:
+    """
+    Return a stable hash of a search filter. Keys are sorted and datetimes converted to
+    UTC, so equal filters written differently share their cached total.
+    """
+
+    def normalize(value):
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return get_json_compatible_value(value)
+
+    return hashlib.sha256(
+        json.dumps(filter_dict, sort_keys=True, default=normalize).encode()
+    ).hexdigest()
 
 
 class WebhookEventService:
-    """Handles database operations related to storing webhook events."""
+    """
+    Handles storage and queue operations related to webhook events.
 
-    def __init__(self, db: AsyncIOMotorDatabase):
-        self.db = db
-        self.collection = self.db.get_collection(name="webhook_events")
-        self.redis_service = RedisService()
+    Search, export and aggregate queries go to the analytics event store, which may
+    read from replica set secondaries, while claims and status writes use the primary.
+    Status views are cached on ingest and on every status change, so status lookups of
+    recent events are answered without reaching the event store.
+    """
+
+    def __init__(
+        self,
+        event_store: WebhookEventStore,
+        webhook_queue: WebhookQueue,
+        analytics_event_store: Optional[WebhookEventStore] = None,
+        group_committer: Optional[IngestGroupCommitter] = None,
+        event_status_cache: Optional[EventStatusCache] = None,
+        search_count_cache: Optional[SearchCountCache] = None,
+    ):
+        self.event_store = event_store
+        self.webhook_queue = webhook_queue
+        self.analytics_event_store = analytics_event_store or event_store
+        self.group_committer = group_committer
+        self.event_status_cache = event_status_cache
+        self.search_count_cache = search_count_cache
 
     async def get_event_by_idempotency_key(
         self, idempotency_key: str
     ) -> Optional[dict]:
         """Retrieve a webhook event by its idempotency key."""
-        event = await self.collection.find_one({"idempotency_key": idempotency_key})
-        return event
+        return await self.event_store.get_event_by_idempotency_key(
+            idempotency_key=idempotency_key
+        )
 
     async def insert_webhook_event(
         self, webhook_ingest_schema: WebhookIngestSchema
     ) -> dict:
         """Insert a webhook event into the DB, handling idempotency."""
         document = webhook_ingest_schema.model_dump()
+        received = webhook_ingest_schema.received_at.timestamp()
+        document["stage_timestamps"] = {"received": received}
 
         try:
-            result = await self.collection.insert_one(document)
-            document["_id"] = result.inserted_id
-            # If document inserted nto DB then pushing the event to redis queue
-            await self.redis_service.left_push_event_to_queue(
-                key="webhook:queue", value=str(document["_id"])
-            )
-            return document
-        except DuplicateKeyError:
+            if self.group_committer is not None:
+                document = await self.group_committer.commit(document=document)
+            else:
+                document = await self.insert_and_enqueue_webhook_event(
+                    document=document
+                )
+        except DuplicateWebhookEventException:
             existing_event = await self.get_event_by_idempotency_key(
                 webhook_ingest_schema.idempotency_key
             )
+            # The original was archived or deleted since the insert hit its key
+            if existing_event is None:
+                raise WebhookEventException(
+                    message="Idempotency key belongs to an event that is no longer stored!",
+                    error="duplicate-entity",
+                )
             if existing_event["data"] != webhook_ingest_schema.data:
                 raise WebhookEventException(
                     message="Idempotency key reused with different payload!",
                     error="bad-request",
                 )
             return existing_event
-        except PyMongoError as exc:
-            raise WebhookEventException(message="Database write failed", error=exc)
+
+        enqueued = document["stage_timestamps"].get("enqueued", time.time())
+        stage_latency_recorder.record(
+            DeliveryStageEnum.INGEST,
+            event_type=document.get("event_type"),
+            seconds=enqueued - received,
+            at=enqueued,
+        )
+        # Producers tend to poll the status right after ingest
+        await self.cache_webhook_event_status(event=document)
+        return document
+
+    async def insert_and_enqueue_webhook_event(self, document: dict) -> dict:
+        """Insert a single event document and push it to the delivery queue."""
+        insert_start = time.perf_counter()
+        document = await self.event_store.insert_event(document=document)
+        enqueue_start = time.perf_counter()
+        INGEST_INSERT_SECONDS.observe(enqueue_start - insert_start)
+        # If document inserted into DB then pushing the event to the delivery queue, or
+        # to the lane of its ordering key when it must wait for earlier events
+        if document.get("ordering_key"):
+            await self.webhook_queue.enqueue_ordered(
+                ordering_key=document["ordering_key"], event_id=str(document["_id"])
+            )
+        else:
+            await self.webhook_queue.enqueue(event_ids=[str(document["_id"])])
+        INGEST_ENQUEUE_SECONDS.observe(time.perf_counter() - enqueue_start)
+        enqueued = time.time()
+        document.setdefault("stage_timestamps", {})["enqueued"] = enqueued
+        try:
+            await self.event_store.set_enqueued_timestamp(
+                event_ids=[document["_id"]], enqueued=enqueued
+            )
+        except Exception as exc:
+            # The event is stored and queued, only its lifecycle record misses a stage
+            logger.warning(f"Failed to record enqueue time of {document['_id']}: {exc}")
+        return document
 
     async def claim_webhook_event(
         self, current_time: datetime, event_id: ObjectId
     ) -> Optional[dict]:
         """Lock the eligible webhook event for processing."""
-        filter_query = {
-            "_id": event_id,
-            "status": {
-                "$in": [
-                    WebhookStatusEnum.RECEIVED,
-                    WebhookStatusEnum.FAILED_TEMPORARILY,
-                ]
-            },
-            "next_retry_at": {"$lte": current_time},
-            "$or": [{"locked_until": None}, {"locked_until": {"$lte": current_time}}],
-        }
-        update_query = {
-            "$set": {
-                "locked_until": current_time + timedelta(seconds=TASK_LOCKED_SECONDS)
-            }
-        }
-        event = await self.collection.find_one_and_update(
-            filter=filter_query,
-            update=update_query,
-            sort=[("locked_until", 1), ("received_at", 1)],
-            return_document=ReturnDocument.AFTER,
+        return await self.event_store.claim_event(
+            event_id=event_id,
+            current_time=current_time,
+            locked_until=current_time + timedelta(seconds=TASK_LOCKED_SECONDS),
         )
-        return event
 
     async def mark_webhook_event_delivery_status(
         self,
-        event_id: ObjectId,
+        event: dict,
         log_entry: dict,
         status: WebhookStatusEnum,
         next_retry_at: Optional[datetime],
         attempt_count: int,
     ) -> None:
-        """Update a webhook's delivery status and append a delivery log."""
-        filter_query = {"_id": event_id}
-        update_query = {
-            "$set": {
+        """
+        Update a webhook's delivery status and append a delivery log, then refresh its
+        cached status view.
+        """
+        finished_at = (
+            datetime.now(tz=timezone.utc)
+            if status in FINISHED_WEBHOOK_STATUSES
+            else None
+        )
+        await self.event_store.mark_delivery_status(
+            event_id=event["_id"],
+            log_entry=log_entry,
+            status=status,
+            next_retry_at=next_retry_at,
+            attempt_count=attempt_count,
+            finished_at=finished_at,
+        )
+        await self.cache_webhook_event_status(
+            event={
+                **event,
                 "status": status,
-                "locked_until": None,
-                "next_retry_at": next_retry_at,
                 "attempt_count": attempt_count,
-            },
-            "$push": {"delivery_logs": log_entry},
-        }
-        await self.collection.update_one(filter=filter_query, update=update_query)
-        return
+                "last_status_code": log_entry["status_code"],
+                "next_retry_at": next_retry_at,
+                "finished_at": finished_at,
+            }
+        )
+
+    async def cache_webhook_event_status(self, event: dict) -> None:
+        """Cache the status view of an event. Lookups fall back to the store on errors."""
+        if self.event_status_cache is None:
+            return
+        try:
+            await self.event_status_cache.set_status(
+                status_view=get_event_status_view(event=event)
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to cache status of event {event['_id']}: {exc}")
+
+    async def invalidate_webhook_event_statuses(self, event_ids: List[str]) -> None:
+        """Drop cached status views after a bulk status change."""
+        if self.event_status_cache is None or not event_ids:
+            return
+        try:
+            await self.event_status_cache.delete_statuses(event_ids=event_ids)
+        except Exception as exc:
+            logger.warning(f"Failed to invalidate cached event statuses: {exc}")
+
+    async def get_webhook_event_status(self, event_id: ObjectId) -> Optional[dict]:
+        """Return the status view of an event, from the cache when it is there."""
+        if self.event_status_cache is not None:
+            try:
+                cached = await self.event_status_cache.get_status(
+                    event_id=str(event_id)
+                )
+                if cached is not None:
+                    return cached
+            except Exception as exc:
+                logger.warning(f"Failed to read cached status of {event_id}: {exc}")
+        event = await self.event_store.get_event_by_id(event_id=event_id)
+        if event is None:
+            return None
+        await self.cache_webhook_event_status(event=event)
+        return get_event_status_view(event=event)
+
+    async def get_webhook_event_status_by_idempotency_key(
+        self, idempotency_key: str
+    ) -> Optional[dict]:
+        """Return the status view of the event of an idempotency key, cached if possible."""
+        if self.event_status_cache is not None:
+            try:
+                event_id = await self.event_status_cache.get_event_id(
+                    idempotency_key=idempotency_key
+                )
+                cached = (
+                    await self.event_status_cache.get_status(event_id=event_id)
+                    if event_id
+                    else None
+                )
+                if cached is not None:
+                    return cached
+            except Exception as exc:
+                logger.warning(
+                    f"Failed to read cached status of {idempotency_key}: {exc}"
+                )
+        event = await self.get_event_by_idempotency_key(idempotency_key=idempotency_key)
+        if event is None:
+            return None
+        await self.cache_webhook_event_status(event=event)
+        return get_event_status_view(event=event)
+
+    async def release_claimed_webhook_events(self, event_ids: List[ObjectId]) -> int:
+        """
+        Unlock claimed events that will not be finished, e.g. at shutdown, and push them
+        to the head of the queue so another worker claims them right away. Returns the
+        number of events released.
+        """
+        if not event_ids:
+            return 0
+        released_count = await self.event_store.release_event_locks(event_ids=event_ids)
+        # Ids of events finished or rescheduled meanwhile are dropped by the claim
+        await self.webhook_queue.requeue(
+            event_ids=[str(event_id) for event_id in event_ids]
+        )
+        return released_count
+
+    async def release_webhook_event_ordering_key(self, event: dict) -> None:
+        """Let the next event of a resolved event's ordering key proceed to delivery."""
+        if event.get("ordering_key"):
+            await self.webhook_queue.release_ordering_key(
+                ordering_key=event["ordering_key"], event_id=str(event["_id"])
+            )
+
+    async def expire_webhook_events(self, current_time: datetime, limit: int) -> int:
+        """
+        Mark a batch of pending events past their expiry as expired and let their ordering
+        lanes proceed. Returns the number of expired events.
+        """
+        expired_events = await self.event_store.expire_events(
+            current_time=current_time, limit=limit
+        )
+        for event in expired_events:
+            await self.release_webhook_event_ordering_key(event=event)
+        await self.invalidate_webhook_event_statuses(
+            event_ids=[str(event["_id"]) for event in expired_events]
+        )
+        EVENTS_EXPIRED.labels(stage="pending").inc(len(expired_events))
+        return len(expired_events)
+
+    async def schedule_webhook_event_retry(
+        self, event_id: ObjectId, next_retry_at: datetime
+    ) -> None:
+        """Schedule a temporarily failed webhook event for redelivery."""
+        await self.webhook_queue.schedule_retry(
+            event_id=str(event_id), due_timestamp=next_retry_at.timestamp()
+        )
 
     async def get_aggregates_by_filtered_dict(self, filter_dict: dict) -> dict:
         """Compute aggregated counts and hourly histogram for filtered events."""
-        pipeline = [
-            {"$match": filter_dict},
-            {
-                "$facet": {
-                    "count_by_status": [
-                        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
-                    ],
-                    "count_by_event_type": [
-                        {"$group": {"_id": "$event_type", "count": {"$sum": 1}}}
-                    ],
-                    "hourly_histogram": [
-                        {
-                            "$group": {
-                                "_id": {
-                                    "$dateTrunc": {
-                                        "date": "$received_at",
-                                        "unit": "hour",
-                                    }
-                                },
-                                "count": {"$sum": 1},
-                            }
-                        },
-                        {"$sort": {"_id": 1}},
-                    ],
-                }
-            },
-        ]
-
-        agg_cursor = self.collection.aggregate(pipeline)
-        agg_result = await agg_cursor.to_list(length=1)
-        agg_data = agg_result[0] if agg_result else {}
-
-        for doc in agg_data.get("hourly_histogram", []):
-            doc["_id"] = doc["_id"].isoformat()
-        return agg_data
+        return await observe_query(
+            route="search",
+            operation="aggregate",
+            query=self.analytics_event_store.get_aggregates(filter_dict=filter_dict),
+        )
+
+    async def get_search_total_count(
+        self, filter_dict: dict, strategy: SearchCountStrategyEnum
+    ) -> SearchCountDTO:
+        """
+        Count the events matching a search with the requested strategy. Estimated counts
+        only exist for unfiltered searches, filtered ones fall back to the cached count.
+        Without a count cache, cached counts are exact.
+        """
+        if strategy == SearchCountStrategyEnum.ESTIMATED and not filter_dict:
+            count = await observe_query(
+                route="search",
+                operation="estimated_count",
+                query=self.analytics_event_store.estimate_events_count(),
+            )
+            return SearchCountDTO(
+                count=count, strategy=SearchCountStrategyEnum.ESTIMATED
+            )
+
+        filter_hash = None
+        if strategy != SearchCountStrategyEnum.EXACT and self.search_count_cache:
+            filter_hash = get_filter_hash(filter_dict=filter_dict)
+            try:
+                count = await self.search_count_cache.get_count(filter_hash=filter_hash)
+                if count is not None:
+                    return SearchCountDTO(
+                        count=count, strategy=SearchCountStrategyEnum.CACHED
+                    )
+            except Exception as exc:
+                logger.warning(f"Failed to read cached search count: {exc}")
+
+        count = await observe_query(
+            route="search",
+            operation="count",
+            query=self.analytics_event_store.count_events(filter_dict=filter_dict),
+        )
+        if filter_hash is not None:
+            try:
+                await self.search_count_cache.set_count(
+                    filter_hash=filter_hash, count=count
+                )
+            except Exception as exc:
+                logger.warning(f"Failed to cache search count: {exc}")
+        return SearchCountDTO(count=count, strategy=SearchCountStrategyEnum.EXACT)
 
     async def get_filtered_search_webhook_events(
         self,
         pagination_params: Optional[PaginationParams] = None,
         filter_params: Optional[WebhookEventFilter] = None,
+        count_strategy: SearchCountStrategyEnum = SearchCountStrategyEnum.EXACT,
     ) -> dict:
         """Retrieve filtered webhook events with pagination and aggregates."""
         filter_dict = {}
         if filter_params:
             filter_dict = filter_params._build_filters_dict()
-        cursor = self.collection.find(filter_dict)
+        offset, limit = 0, None
         if pagination_params:
-            total = await self.collection.count_documents(filter=filter_dict)
-            pagination_params.total_count = total
-            cursor = cursor.skip(pagination_params.offset).limit(
-                pagination_params.page_size
+            total = await self.get_search_total_count(
+                filter_dict=filter_dict, strategy=count_strategy
             )
-        items = await cursor.to_list(
-            length=pagination_params.page_size if pagination_params else None
+            pagination_params.total_count = total.count
+            pagination_params.count_strategy = total.strategy
+            offset, limit = pagination_params.offset, pagination_params.page_size
+        items = await observe_query(
+            route="search",
+            operation="find",
+            query=self.analytics_event_store.find_events(
+                filter_dict=filter_dict, offset=offset, limit=limit
+            ),
         )
         for item in items:
             if "_id" in item:
@@ -170,3 +420,36 @@ class WebhookEventService:
         agg_data = await self.get_aggregates_by_filtered_dict(filter_dict=filter_dict)
 
         return {"events": items, "aggregates": agg_data}
+
+    async def export_filtered_webhook_events(
+        self, filter_params: Optional[WebhookEventFilter] = None, compress: bool = False
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream filtered events as NDJSON in chunks of roughly EXPORT_CHUNK_BYTES,
+        gzip-compressed when requested, holding at most one cursor batch and one chunk.
+        """
+        filter_dict = filter_params._build_filters_dict() if filter_params else {}
+        # wbits=31 writes a gzip container instead of a raw zlib stream
+        compressor = zlib.compressobj(wbits=31) if compress else None
+        buffer = bytearray()
+        # Time spent suspended at a yield is the client reading, not the query
+        query_seconds, started_at = 0.0, time.perf_counter()
+        async for document in self.analytics_event_store.iterate_events(
+            filter_dict=filter_dict, batch_size=EXPORT_CURSOR_BATCH_SIZE
+        ):
+            buffer += json.dumps(document, default=get_json_compatible_value).encode()
+            buffer += b"\n"
+            if len(buffer) >= EXPORT_CHUNK_BYTES:
+                chunk = compressor.compress(buffer) if compressor else bytes(buffer)
+                buffer.clear()
+                if chunk:
+                    query_seconds += time.perf_counter() - started_at
+                    yield chunk
+                    started_at = time.perf_counter()
+        query_seconds += time.perf_counter() - started_at
+        QUERY_SECONDS.labels(route="export", operation="iterate").observe(query_seconds)
+        chunk = bytes(buffer)
+        if compressor:
+            chunk = compressor.compress(chunk) + compressor.flush()
+        if chunk:
+            yield chunk
@@ -0,0 +1,173 @@
+import asyncio
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+from app.integrations.metrics import DELIVERY_CONCURRENCY_LIMIT
+from app.services.delivery_timeouts import delivery_timeout_tracker
+from app.utils.constants.webhooks import WORKER_RATE_WINDOW_SECONDS
+from app.utils.dtos.webhooks import InFlightAttemptDTO
+
+
+class DeliveryConcurrencyLimiter:
+    """
+    Semaphore whose limit can change at runtime. Lowering the limit lets the deliveries
+    holding a slot finish, new ones wait until usage is below the new limit.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self.waiting = 0
+        self._condition = asyncio.Condition()
+
+    def locked(self) -> bool:
+        """Return whether acquiring a slot would wait."""
+        return self.in_use >= self.limit
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the limit, waking waiters when slots became free."""
+        async with self._condition:
+            self.limit = limit
+            self._condition.notify_all()
+        DELIVERY_CONCURRENCY_LIMIT.set(limit)
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            self.waiting += 1
+            try:
+                await self._condition.wait_for(lambda: self.in_use < self.limit)
+            finally:
+                self.waiting -= 1
+            self.in_use += 1
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self.in_use -= 1
+            self._condition.notify()
+
+
+class RateCounter:
+    """Counts occurrences in one second slots and reports the rate over the window."""
+
+    def __init__(self, window_seconds: int):
+        self.window_seconds = window_seconds
+        self.slots: Dict[int, int] = {}
+
+    def record(self) -> None:
+        """Count one occurrence in the current slot."""
+        current_slot = int(time.monotonic())
+        self.slots[current_slot] = self.slots.get(current_slot, 0) + 1
+        if len(self.slots) > self.window_seconds + 1:
+            oldest_slot = current_slot - self.window_seconds
+            for slot in [slot for slot in self.slots if slot < oldest_slot]:
+                del self.slots[slot]
+
+    def get_rate(self) -> float:
+        """Return occurrences per second over the last complete slots of the window."""
+        current_slot = int(time.monotonic())
+        count = sum(
+            count
+            for slot, count in self.slots.items()
+            if current_slot - self.window_seconds <= slot < current_slot
+        )
+        return count / self.window_seconds
+
+
+class DeliveryWorkerRuntime:
+    """
+    Live state of the delivery loop of this process, read and changed by the worker admin
+    server: the concurrency limiter, whether dequeuing is paused, the in-flight attempts,
+    pop and claim rates and the event loop lag.
+    """
+
+    def __init__(self):
+        self.limiter: Optional[DeliveryConcurrencyLimiter] = None
+        self.dequeue_enabled: Optional[asyncio.Event] = None
+        self.in_flight: Dict[asyncio.Task, InFlightAttemptDTO] = {}
+        self.pop_rate = RateCounter(window_seconds=WORKER_RATE_WINDOW_SECONDS)
+        self.claim_rate = RateCounter(window_seconds=WORKER_RATE_WINDOW_SECONDS)
+        self.event_loop_lag_seconds = 0.0
+
+    def start(self, concurrency: int) -> DeliveryConcurrencyLimiter:
+        """Reset the state for a delivery loop starting with the given concurrency."""
+        self.limiter = DeliveryConcurrencyLimiter(limit=concurrency)
+        self.dequeue_enabled = asyncio.Event()
+        self.dequeue_enabled.set()
+        self.in_flight = {}
+        DELIVERY_CONCURRENCY_LIMIT.set(concurrency)
+        return self.limiter
+
+    def stop(self) -> None:
+        """Mark the delivery loop of this process as stopped."""
+        self.limiter = None
+        self.dequeue_enabled = None
+        self.in_flight = {}
+
+    def is_running(self) -> bool:
+        """Return whether a delivery loop runs in this process."""
+        return self.limiter is not None
+
+    def set_dequeue_enabled(self, enabled: bool) -> None:
+        """Pause or resume dequeuing. A pop already waiting for an event completes."""
+        if enabled:
+            self.dequeue_enabled.set()
+        else:
+            self.dequeue_enabled.clear()
+
+    def get_stats(self) -> dict:
+        """Return a snapshot of the runtime state."""
+        now = time.time()
+        in_flight_by_destination = Counter(
+            attempt.destination for attempt in self.in_flight.values()
+        )
+        oldest_attempt = min(
+            self.in_flight.values(),
+            key=lambda attempt: attempt.started_at,
+            default=None,
+        )
+        destinations = set(in_flight_by_destination) | set(
+            delivery_timeout_tracker.get_destinations()
+        )
+        destination_stats = []
+        for destination in sorted(destinations):
+            percentiles = delivery_timeout_tracker.get_latency_percentiles(
+                destination=destination, percentiles=(50, 99)
+            )
+            destination_stats.append(
+                {
+                    "destination": destination,
+                    "in_flight": in_flight_by_destination.get(destination, 0),
+                    "latency_p50_seconds": percentiles[50],
+                    "latency_p99_seconds": percentiles[99],
+                }
+            )
+        limiter = self.limiter
+        return {
+            "running": self.is_running(),
+            "dequeue_paused": bool(
+                self.dequeue_enabled and not self.dequeue_enabled.is_set()
+            ),
+            "concurrency_limit": limiter.limit if limiter else 0,
+            "concurrency_in_use": limiter.in_use if limiter else 0,
+            "concurrency_waiting": limiter.waiting if limiter else 0,
+            # Delivery tasks sending or waiting for a slot
+            "in_flight_tasks": limiter.in_use + limiter.waiting if limiter else 0,
+            "queue_pops_per_second": self.pop_rate.get_rate(),
+            "claims_per_second": self.claim_rate.get_rate(),
+            "event_loop_lag_seconds": self.event_loop_lag_seconds,
+            "oldest_in_flight": (
+                {
+                    "description": oldest_attempt.description,
+                    "destination": oldest_attempt.destination,
+                    "age_seconds": now - oldest_attempt.started_at,
+                }
+                if oldest_attempt
+                else None
+            ),
+            "destinations": destination_stats,
+        }
+
+
+# Process-wide runtime shared by the delivery loop and the worker admin server
+delivery_worker_runtime = DeliveryWorkerRuntime()
@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from typing import Set
+
+from app.dependencies.backends import get_dead_letter_service
+from app.services.dead_letters import DeadLetterService
+from app.utils.constants.webhooks import DEAD_LETTER_REPLAY_WATCHDOG_INTERVAL_SECONDS
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Keeping references to running replays so they are not garbage collected mid-run
+replay_job_tasks: Set[asyncio.Task] = set()
+
+
+def start_dead_letter_replay(
+    dead_letter_service: DeadLetterService, job: dict, filter_dict: dict
+) -> asyncio.Task:
+    """Run a replay job in the background of the current process."""
+    task = asyncio.create_task(
+        dead_letter_service.run_replay_job(job=job, filter_dict=filter_dict),
+        name=f"replay-job-{job['_id']}",
+    )
+    replay_job_tasks.add(task)
+    task.add_done_callback(replay_job_tasks.discard)
+    logger.info(f"Replay job {job['_id']} started")
+    return task
+
+
+async def cancel_dead_letter_replays() -> None:
+    """Cancel running replay jobs, recording them as cancelled."""
+    for task in replay_job_tasks:
+        task.cancel()
+    await asyncio.gather(*replay_job_tasks, return_exceptions=True)
+
+
+async def resume_stale_dead_letter_replays() -> None:
+    """Resume replay jobs left running by a process that stopped, from their cursor."""
+    dead_letter_service = get_dead_letter_service()
+    running_task_names = {task.get_name() for task in replay_job_tasks}
+    for job, filter_dict in await dead_letter_service.claim_stale_replay_jobs():
+        # A job of this process that stalled on a slow query is still running
+        if f"replay-job-{job['_id']}" in running_task_names:
+            continue
+        logger.info(f"Resuming stale replay job {job['_id']}")
+        start_dead_letter_replay(
+            dead_letter_service=dead_letter_service, job=job, filter_dict=filter_dict
+        )
+
+
+async def dead_letter_replay_watchdog():
+    """Periodically resumes replay jobs whose process crashed or was killed."""
+    while True:
+        try:
+            await resume_stale_dead_letter_replays()
+        except Exception as exc:
+            logger.warning(f"Failed to resume stale replay jobs: {exc}")
+        await asyncio.sleep(DEAD_LETTER_REPLAY_WATCHDOG_INTERVAL_SECONDS)
@@ -0,0 +1,19 @@
+import asyncio
+import logging
+
+from app.dependencies.backends import get_event_archival_service
+from app.utils.constants.webhooks import EVENT_ARCHIVE_INTERVAL_SECONDS
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+async def event_archiver():
+    """Periodically archives and removes finished webhook events past their retention."""
+    event_archival_service = get_event_archival_service()
+    while True:
+        try:
+            await event_archival_service.archive_finished_events()
+        except Exception as exc:
+            logger.warning(f"Failed to archive finished webhook events: {exc}")
+        await asyncio.sleep(EVENT_ARCHIVE_INTERVAL_SECONDS)
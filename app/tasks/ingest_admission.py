@@ -0,0 +1,20 @@
+import asyncio
+import logging
+
+from app.dependencies.admission import ingest_admission_controller
+from app.utils.constants.webhooks import INGEST_ADMISSION_SAMPLE_INTERVAL_SECONDS
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+async def ingest_admission_sampler():
+    """Periodically samples the delivery queue pressure read by ingest admission control."""
+    while True:
+        try:
+            await ingest_admission_controller.refresh()
+        except Exception as exc:
+            logger.warning(
+                f"Failed to sample queue pressure for ingest admission: {exc}"
+            )
+        await asyncio.sleep(INGEST_ADMISSION_SAMPLE_INTERVAL_SECONDS)
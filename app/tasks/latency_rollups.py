@@ -0,0 +1,32 @@
+import asyncio
+import logging
+
+from app.dependencies.backends import get_latency_breakdown_service
+from app.services.latency import stage_latency_recorder
+from app.utils.constants.webhooks import LATENCY_ROLLUP_FLUSH_INTERVAL_SECONDS
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+async def stage_latency_rollup_flusher():
+    """Periodically flushes the stage latencies recorded in this process to the rollup store."""
+    latency_breakdown_service = get_latency_breakdown_service()
+    try:
+        while True:
+            await asyncio.sleep(LATENCY_ROLLUP_FLUSH_INTERVAL_SECONDS)
+            try:
+                await latency_breakdown_service.flush_recorded_latencies(
+                    recorder=stage_latency_recorder
+                )
+            except Exception as exc:
+                logger.warning(f"Failed to flush stage latency rollups: {exc}")
+    except asyncio.CancelledError:
+        # Flushing what was recorded since the last interval before shutting down
+        try:
+            await latency_breakdown_service.flush_recorded_latencies(
+                recorder=stage_latency_recorder
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to flush stage latency rollups on shutdown: {exc}")
+        raise
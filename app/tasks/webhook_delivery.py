@@ -1,85 +1,334 @@
 import asyncio
+import json
 import logging
+import math
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 import httpx
 from bson import ObjectId
 from fastapi import status
 
 from app.config.settings import settings
-from app.dependencies.db import get_db
-from app.integrations.redis_client import RedisService
-from app.services.webhooks import WebhookEventService
+from app.dependencies.backends import get_webhook_event_service, get_webhook_queue
+from app.integrations.metrics import (
+    DELIVERY_ATTEMPTS,
+    DELIVERY_IN_FLIGHT,
+    DELIVERY_SECONDS,
+    DELIVERY_SEMAPHORE_WAIT_SECONDS,
+    DELIVERY_TIMEOUTS,
+    EVENTS_EXPIRED,
+    QUEUE_DEPTH,
+    QUEUE_OLDEST_ITEM_AGE_SECONDS,
+    get_destination_label,
+    get_status_class,
+)
+from app.services.delivery_timeouts import delivery_timeout_tracker
+from app.services.latency import stage_latency_recorder
+from app.services.worker_runtime import (
+    DeliveryConcurrencyLimiter,
+    delivery_worker_runtime,
+)
+from app.tasks.event_archiver import event_archiver
+from app.tasks.latency_rollups import stage_latency_rollup_flusher
+from app.tasks.worker_admin import (
+    bind_worker_admin_socket,
+    event_loop_lag_monitor,
+    is_worker_admin_enabled,
+    worker_admin_server,
+)
+from app.utils.backoff import get_retry_delay, get_retry_policy, parse_retry_after
 from app.utils.constants.webhooks import (
+    BATCH_DELIVERY_DEFAULT_LINGER_MS,
+    BATCH_DELIVERY_DEFAULT_MAX_BYTES,
+    BATCH_DELIVERY_DEFAULT_MAX_EVENTS,
+    BATCH_DELIVERY_MAX_LINGER_SECONDS,
     DELIVERY_TIMEOUT,
     DOWNSTREAM_URL,
-    EXPONENTIAL_BACKOFF,
-    MAX_RETRY_ATTEMPTS,
+    EXPIRE_EVENTS_BATCH_SIZE,
+    QUEUE_METRICS_INTERVAL_SECONDS,
+    RETRY_PROMOTE_BATCH_SIZE,
+    RETRY_PROMOTE_MAX_PER_SECOND,
+    WEBHOOK_QUEUE_KEY,
+    WEBHOOK_RETRY_KEY,
 )
+from app.utils.datetime_utils import get_utc_datetime
+from app.utils.dtos.webhooks import BatchDeliveryPolicyDTO, InFlightAttemptDTO
 from app.utils.enums.webhooks import WebhookStatusEnum
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-http_client = httpx.AsyncClient(timeout=DELIVERY_TIMEOUT)
-redis_service = RedisService()
-webhook_event_service = WebhookEventService(db=get_db())
+# Created on first delivery rather than at import, and closed when the delivery loop stops
+_http_client: Optional[httpx.AsyncClient] = None
 
 
-async def process_webhook_event_delivery(event: dict):
-    """Process a single webhook delivery attempt with info logs."""
-    event_id = event["_id"]
-    attempt_count = event["attempt_count"] + 1
-    now = datetime.now(tz=timezone.utc)
+def get_http_client() -> httpx.AsyncClient:
+    """Return the HTTP client shared by all deliveries of this process."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(timeout=DELIVERY_TIMEOUT)
+    return _http_client
 
-    status_code = None
-    retry_delay = None
-    final_status = None
-    success = False
-    response = None
 
-    logger.info(f"[Webhook {event_id}] Starting delivery attempt {attempt_count}")
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
+def get_previous_retry_delay(event: dict) -> Optional[float]:
+    """Return the retry delay chosen by the event's last attempt, if it was retried."""
+    delivery_logs = event.get("delivery_logs") or []
+    return delivery_logs[-1].get("retry_delay") if delivery_logs else None
+
+
+async def send_delivery_request(
+    log_prefix: str, **request_kwargs
+) -> Tuple[Optional[httpx.Response], int]:
+    """
+    POST to the destination with its current timeout and return the response, if any,
+    with the status code the attempt is judged by.
+    """
+    destination = get_destination_label(DOWNSTREAM_URL)
+    timeout = delivery_timeout_tracker.get_timeout(destination=destination)
+    response = None
+    request_start = time.perf_counter()
     try:
-        response = await http_client.post(
-            url=DOWNSTREAM_URL,
-            json=event["data"],
+        response = await get_http_client().post(
+            url=DOWNSTREAM_URL, timeout=timeout.seconds, **request_kwargs
         )
         status_code = response.status_code
-        success = 200 <= status_code < 300
-        logger.info(f"[Webhook {event_id}] Received response {status_code}")
+        logger.info(f"{log_prefix} Received response {status_code}")
     except httpx.TimeoutException:
         status_code = status.HTTP_504_GATEWAY_TIMEOUT
-        logger.info(f"[Webhook {event_id}] Timeout occurred")
+        # Adaptive timeouts are counted apart, so their bounds and factor can be tuned
+        DELIVERY_TIMEOUTS.labels(
+            destination=destination,
+            timeout="adaptive" if timeout.adaptive else "default",
+        ).inc()
+        logger.info(f"{log_prefix} Timeout occurred after {timeout.seconds:.2f}s")
     except Exception as exc:
-        logger.exception(f"[Webhook {event_id}] Unexpected error: {exc}")
+        logger.exception(f"{log_prefix} Unexpected error: {exc}")
         status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    request_seconds = time.perf_counter() - request_start
+    DELIVERY_SECONDS.labels(
+        destination=destination, status_class=get_status_class(status_code)
+    ).observe(request_seconds)
+    # Connection errors fail fast and say nothing about how long the receiver needs
+    if response is not None or status_code == status.HTTP_504_GATEWAY_TIMEOUT:
+        delivery_timeout_tracker.record(
+            destination=destination, seconds=request_seconds
+        )
+    return response, status_code
+
+
+async def process_webhook_event_delivery(
+    event: dict, stage_timestamps: Optional[Dict[str, float]] = None
+):
+    """Process a single webhook delivery attempt with info logs."""
+    stage_timestamps = dict(stage_timestamps or {})
+    event_id = event["_id"]
+    now = datetime.now(tz=timezone.utc)
+
+    logger.info(
+        f"[Webhook {event_id}] Starting delivery attempt {event['attempt_count'] + 1}"
+    )
+
+    stage_timestamps["request_sent"] = time.time()
+    response, status_code = await send_delivery_request(
+        log_prefix=f"[Webhook {event_id}]", json=event["data"]
+    )
+    stage_timestamps["response_received"] = time.time()
+
+    await finalize_webhook_event_delivery(
+        event=event,
+        status_code=status_code,
+        retry_after=response.headers.get("Retry-After") if response else None,
+        stage_timestamps=stage_timestamps,
+        now=now,
+    )
 
+
+async def process_webhook_event_batch_delivery(
+    events: List[dict],
+    item_bodies: List[bytes],
+    stage_timestamps_list: List[Dict[str, float]],
+):
+    """
+    Deliver a batch of events in one POST of a JSON array and finalize each event from
+    the receiver's per-item result, so every event is retried on its own.
+    """
+    now = datetime.now(tz=timezone.utc)
+    event_ids = [str(event["_id"]) for event in events]
+
+    logger.info(f"[Webhook batch] Delivering {len(events)} events in one request")
+
+    request_sent = time.time()
+    response, status_code = await send_delivery_request(
+        log_prefix="[Webhook batch]",
+        content=b"[" + b",".join(item_bodies) + b"]",
+        headers={"Content-Type": "application/json"},
+    )
+    response_received = time.time()
+
+    item_results = get_batch_item_results(
+        response=response, status_code=status_code, event_ids=event_ids
+    )
+    await asyncio.gather(
+        *(
+            finalize_webhook_event_delivery(
+                event=event,
+                status_code=item_results[event_id][0],
+                retry_after=item_results[event_id][1],
+                stage_timestamps={
+                    **stage_timestamps,
+                    "request_sent": request_sent,
+                    "response_received": response_received,
+                },
+                now=now,
+            )
+            for event, event_id, stage_timestamps in zip(
+                events, event_ids, stage_timestamps_list
+            )
+        )
+    )
+
+
+def get_batch_item_body(event: dict) -> bytes:
+    """Serialize one event as a batch item, carrying the id its result is mapped by."""
+    return json.dumps(
+        {
+            "id": str(event["_id"]),
+            "idempotency_key": event["idempotency_key"],
+            "event_type": event.get("event_type"),
+            "data": event["data"],
+        }
+    ).encode()
+
+
+def get_batch_item_status_code(value) -> int:
+    """Read the status code of a batch item, a missing or invalid one counting as 502."""
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    if isinstance(value, int) and not isinstance(value, bool) and 100 <= value < 600:
+        return value
+    return status.HTTP_502_BAD_GATEWAY
+
+
+def get_batch_item_retry_after(value) -> Optional[str]:
+    """Read the Retry-After of a batch item as a header value, rounding seconds up."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if math.isfinite(value) and value >= 0:
+            return str(math.ceil(value))
+    return None
+
+
+def get_batch_item_results(
+    response: Optional[httpx.Response], status_code: int, event_ids: List[str]
+) -> Dict[str, Tuple[int, Optional[str]]]:
+    """
+    Map a batch response to a status code and Retry-After per event id.
+
+    A failed request applies to every item. A successful one is read as
+    `{"results": [{"id", "status_code", "retry_after"?}]}`. Without results the batch
+    counts as accepted as a whole, while an item missing from the results or with an
+    invalid status code counts as a 502 and is retried.
+    """
+    retry_after = response.headers.get("Retry-After") if response else None
+    if not 200 <= status_code < 300:
+        return {event_id: (status_code, retry_after) for event_id in event_ids}
+    try:
+        results = response.json().get("results")
+    except (ValueError, AttributeError):
+        results = None
+    if not isinstance(results, list):
+        return {event_id: (status_code, None) for event_id in event_ids}
+
+    item_results = {
+        event_id: (status.HTTP_502_BAD_GATEWAY, None) for event_id in event_ids
+    }
+    for result in results:
+        if isinstance(result, dict) and result.get("id") in item_results:
+            item_results[result["id"]] = (
+                get_batch_item_status_code(result.get("status_code")),
+                get_batch_item_retry_after(result.get("retry_after")),
+            )
+    return item_results
+
+
+async def finalize_webhook_event_delivery(
+    event: dict,
+    status_code: int,
+    retry_after: Optional[str],
+    stage_timestamps: Dict[str, float],
+    now: datetime,
+):
+    """Decide the outcome of a delivery attempt, then persist it and schedule retries."""
+    event_id = event["_id"]
+    attempt_count = event["attempt_count"] + 1
+    success = 200 <= status_code < 300
+    retry_delay = None
+    final_status = None
+
+    retry_policy = get_retry_policy(destination=get_destination_label(DOWNSTREAM_URL))
     if success:
         final_status = WebhookStatusEnum.DELIVERED
         logger.info(f"[Webhook {event_id}] Delivery succeeded")
     else:
-        if attempt_count >= MAX_RETRY_ATTEMPTS:
+        if attempt_count >= retry_policy.max_attempts:
             final_status = WebhookStatusEnum.FAILED_PERMANENTLY
             logger.info(
                 f"[Webhook {event_id}] Max attempts reached, marking permanently failed"
             )
         else:
             if status_code == 429 or (500 <= status_code < 600):
-                retry_after = (
-                    response.headers.get("Retry-After")
-                    if response and status_code == 429
-                    else None
+                # Receivers send Retry-After with 429 and 503, as seconds or HTTP-date
+                parsed_retry_after = parse_retry_after(
+                    value=retry_after, now=now, max_delay=retry_policy.max_delay
                 )
                 retry_delay = (
-                    int(retry_after)
-                    if retry_after
-                    else EXPONENTIAL_BACKOFF[attempt_count - 1]
+                    parsed_retry_after
+                    if parsed_retry_after is not None
+                    else get_retry_delay(
+                        policy=retry_policy,
+                        attempt_count=attempt_count,
+                        previous_delay=get_previous_retry_delay(event=event),
+                    )
                 )
-                final_status = WebhookStatusEnum.FAILED_TEMPORARILY
-                logger.info(
-                    f"[Webhook {event_id}] Temporary failure, will retry in {retry_delay}s"
+                retry_at = now + timedelta(seconds=retry_delay)
+                deadline_exceeded = (
+                    retry_policy.delivery_deadline > 0
+                    and retry_at
+                    > get_utc_datetime(value=event["received_at"])
+                    + timedelta(seconds=retry_policy.delivery_deadline)
                 )
+                expires_at = event.get("expires_at")
+                if expires_at and retry_at >= get_utc_datetime(value=expires_at):
+                    final_status = WebhookStatusEnum.EXPIRED
+                    retry_delay = None
+                    EVENTS_EXPIRED.labels(stage="retry").inc()
+                    logger.info(
+                        f"[Webhook {event_id}] Event expires before its next attempt, "
+                        f"marking expired"
+                    )
+                elif deadline_exceeded:
+                    final_status = WebhookStatusEnum.FAILED_PERMANENTLY
+                    retry_delay = None
+                    logger.info(
+                        f"[Webhook {event_id}] Next attempt would miss the delivery "
+                        f"deadline, marking permanently failed"
+                    )
+                else:
+                    final_status = WebhookStatusEnum.FAILED_TEMPORARILY
+                    logger.info(
+                        f"[Webhook {event_id}] Temporary failure, will retry in {retry_delay:.2f}s"
+                    )
             else:
                 final_status = WebhookStatusEnum.FAILED_PERMANENTLY
                 logger.info(f"[Webhook {event_id}] Permanent failure, not retrying")
@@ -90,97 +339,381 @@ async def process_webhook_event_delivery(event: dict):
         else None
     )
 
+    stage_timestamps["finalized"] = time.time()
     log_entry = {
         "timestamp": now,
         "attempt_number": attempt_count,
         "status_code": status_code,
         "success": final_status == WebhookStatusEnum.DELIVERED,
+        "retry_delay": retry_delay,
+        "stage_timestamps": stage_timestamps,
     }
 
+    finalize_start = time.perf_counter()
+    webhook_event_service = get_webhook_event_service()
     await webhook_event_service.mark_webhook_event_delivery_status(
-        event_id=event_id,
+        event=event,
         log_entry=log_entry,
         status=final_status,
         next_retry_at=next_retry_at,
         attempt_count=attempt_count,
     )
     if final_status == WebhookStatusEnum.FAILED_TEMPORARILY:
-        retry_timestamp = int(next_retry_at.timestamp())
-
-        await redis_service.zadd_event_to_queue(
-            name="webhook:retry", mapping={str(event_id): retry_timestamp}
+        # A retried event keeps the head of its ordering lane, holding later events
+        await webhook_event_service.schedule_webhook_event_retry(
+            event_id=event_id, next_retry_at=next_retry_at
         )
+    else:
+        await webhook_event_service.release_webhook_event_ordering_key(event=event)
+        DELIVERY_ATTEMPTS.labels(final_status=final_status.value).observe(attempt_count)
+    stage_latency_recorder.record_delivery_attempt(
+        event=event,
+        stage_timestamps=stage_timestamps,
+        final_status=final_status,
+        retry_delay=retry_delay,
+        finalize_seconds=time.perf_counter() - finalize_start,
+    )
     logger.info(
         f"[Webhook {event_id}] Delivery attempt {attempt_count} processed with final status {final_status}"
     )
 
 
+class DeliveryBatcher:
+    """
+    Groups claimed events into batches for one destination. A batch is handed off once it
+    holds `max_events` events, would exceed `max_bytes`, or its first event has lingered
+    for `linger_seconds` and a delivery slot is free. While all slots are busy a lingering
+    batch keeps growing, so batches get larger exactly when the receiver is the bottleneck,
+    until BATCH_DELIVERY_MAX_LINGER_SECONDS keep the claims of its events from expiring.
+    """
+
+    def __init__(
+        self,
+        policy: BatchDeliveryPolicyDTO,
+        on_batch: Callable[[List[dict], List[bytes], List[Dict[str, float]]], None],
+        semaphore: DeliveryConcurrencyLimiter,
+    ):
+        self.policy = policy
+        self.on_batch = on_batch
+        self.semaphore = semaphore
+        self.events: List[dict] = []
+        self.item_bodies: List[bytes] = []
+        self.stage_timestamps_list: List[Dict[str, float]] = []
+        self.size = 0
+        self._linger_task: Optional[asyncio.Task] = None
+
+    def add(self, event: dict, stage_timestamps: Dict[str, float]) -> None:
+        """Add a claimed event, handing off the batch when a limit is reached."""
+        item_body = get_batch_item_body(event)
+        # Separators and brackets are ignored, they add a few bytes at most
+        if self.events and self.size + len(item_body) > self.policy.max_bytes:
+            self.flush()
+        self.events.append(event)
+        self.item_bodies.append(item_body)
+        self.stage_timestamps_list.append(stage_timestamps)
+        self.size += len(item_body)
+        if len(self.events) >= self.policy.max_events:
+            self.flush()
+        elif self._linger_task is None:
+            self._linger_task = asyncio.create_task(self._flush_after_linger())
+
+    def flush(self) -> None:
+        """Hand off the pending batch, if any."""
+        if self._linger_task is not None:
+            if self._linger_task is not asyncio.current_task():
+                self._linger_task.cancel()
+            self._linger_task = None
+        if self.events:
+            self.on_batch(self.events, self.item_bodies, self.stage_timestamps_list)
+        self.events, self.item_bodies, self.stage_timestamps_list = [], [], []
+        self.size = 0
+
+    def drain(self) -> List[dict]:
+        """Drop the pending batch without handing it off, returning its events."""
+        if self._linger_task is not None:
+            self._linger_task.cancel()
+            self._linger_task = None
+        events = self.events
+        self.events, self.item_bodies, self.stage_timestamps_list = [], [], []
+        self.size = 0
+        return events
+
+    async def _flush_after_linger(self) -> None:
+        """
+        Hand off a batch that stopped growing before reaching its limits, once a delivery
+        slot is free or BATCH_DELIVERY_MAX_LINGER_SECONDS have passed.
+        """
+        deadline = time.monotonic() + BATCH_DELIVERY_MAX_LINGER_SECONDS
+        await asyncio.sleep(self.policy.linger_seconds)
+        while self.semaphore.locked() and time.monotonic() < deadline:
+            await asyncio.sleep(
+                min(self.policy.linger_seconds, max(0.0, deadline - time.monotonic()))
+            )
+        self.flush()
+
+
+def get_batch_delivery_policy(destination: str) -> Optional[BatchDeliveryPolicyDTO]:
+    """Return the batch delivery policy of a destination, None when it is not batched."""
+    config = settings.DESTINATION_BATCH_DELIVERY.get(destination)
+    if config is None:
+        return None
+    return BatchDeliveryPolicyDTO(
+        max_events=int(config.get("max_events", BATCH_DELIVERY_DEFAULT_MAX_EVENTS)),
+        max_bytes=int(config.get("max_bytes", BATCH_DELIVERY_DEFAULT_MAX_BYTES)),
+        linger_seconds=config.get("linger_ms", BATCH_DELIVERY_DEFAULT_LINGER_MS) / 1000,
+    )
+
+
 async def webhook_retry_scheduler():
-    """Continuously moves due retry events from Redis ZSET back to the main queue."""
+    """
+    Continuously moves due retry events from the retry set back to the main queue, after
+    expiring pending events past their expiry, so neither queue hands them to workers.
+    """
+    webhook_queue = get_webhook_queue()
+    webhook_event_service = get_webhook_event_service()
     while True:
-        now = int(datetime.now(timezone.utc).timestamp())
-        # Fetching ready retries
-        ready_events = await redis_service.get_events_by_zrangescore(
-            key="webhook:retry",
-            now=now,
-        )
-        if ready_events:
-            for event_id in ready_events:
-                # Moving back to main queue
-                await redis_service.left_push_event_to_queue(
-                    key="webhook:queue",
-                    value=event_id,
+        try:
+            expired_count = EXPIRE_EVENTS_BATCH_SIZE
+            while expired_count == EXPIRE_EVENTS_BATCH_SIZE:
+                expired_count = await webhook_event_service.expire_webhook_events(
+                    current_time=datetime.now(tz=timezone.utc),
+                    limit=EXPIRE_EVENTS_BATCH_SIZE,
                 )
+        except Exception as exc:
+            logger.warning(f"Failed to expire webhook events: {exc}")
 
-                # Remove from retry set
-                await redis_service.remove_event_from_zset(
-                    key="webhook:retry",
-                    value=event_id,
+        # Using the exact timestamp, since a truncated one promotes retries before their
+        # next_retry_at and the claim would then reject them
+        now = datetime.now(timezone.utc).timestamp()
+        try:
+            # Moving ready retries in bounded batches until no due retries are left,
+            # paced so a burst coming due at once reaches the queue spread over a window
+            while True:
+                batch_start = time.monotonic()
+                promoted_events = await webhook_queue.promote_due_retries(
+                    now=now, limit=RETRY_PROMOTE_BATCH_SIZE
+                )
+                if len(promoted_events) < RETRY_PROMOTE_BATCH_SIZE:
+                    break
+                await asyncio.sleep(
+                    max(
+                        0.0,
+                        RETRY_PROMOTE_BATCH_SIZE / RETRY_PROMOTE_MAX_PER_SECOND
+                        - (time.monotonic() - batch_start),
+                    )
                 )
+        except Exception as exc:
+            logger.warning(f"Failed to promote due webhook retries: {exc}")
 
         await asyncio.sleep(1)
 
 
+async def webhook_queue_metrics_collector():
+    """Periodically samples depth and oldest item age of the webhook queues."""
+    webhook_queue = get_webhook_queue()
+    while True:
+        try:
+            queue_stats = await webhook_queue.get_queue_stats()
+            now = datetime.now(tz=timezone.utc).timestamp()
+            QUEUE_DEPTH.labels(queue=WEBHOOK_QUEUE_KEY).set(queue_stats.queue_depth)
+            QUEUE_DEPTH.labels(queue=WEBHOOK_RETRY_KEY).set(queue_stats.retry_depth)
+            # Queue entries are ObjectIds, so the oldest entry's age is derived from
+            # the id's embedded creation time.
+            oldest_queued_age = 0.0
+            if queue_stats.oldest_queue_item:
+                oldest_queued_age = max(
+                    0.0,
+                    now
+                    - ObjectId(
+                        queue_stats.oldest_queue_item
+                    ).generation_time.timestamp(),
+                )
+            # Retry entries are scored by due time, so only overdue entries have age.
+            oldest_retry_age = 0.0
+            if queue_stats.oldest_retry_score is not None:
+                oldest_retry_age = max(0.0, now - queue_stats.oldest_retry_score)
+            QUEUE_OLDEST_ITEM_AGE_SECONDS.labels(queue=WEBHOOK_QUEUE_KEY).set(
+                oldest_queued_age
+            )
+            QUEUE_OLDEST_ITEM_AGE_SECONDS.labels(queue=WEBHOOK_RETRY_KEY).set(
+                oldest_retry_age
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to collect webhook queue metrics: {exc}")
+        await asyncio.sleep(QUEUE_METRICS_INTERVAL_SECONDS)
+
+
 async def webhook_delivery_task():
-    """Main task that polls and processes webhook events with graceful shutdown."""
-    semaphore = asyncio.Semaphore(value=settings.CONCURRENT_WORKERS)
+    """
+    Main task that polls and processes webhook events. On cancellation it drains: it
+    stops dequeuing, gives in-flight deliveries WORKER_DRAIN_TIMEOUT_SECONDS to finish,
+    then unlocks and requeues the claimed events that are still unfinished.
+    """
+    # The runtime exposes the limiter and pause switch to the worker admin server
+    semaphore = delivery_worker_runtime.start(concurrency=settings.CONCURRENT_WORKERS)
+    destination = get_destination_label(DOWNSTREAM_URL)
+    webhook_queue = get_webhook_queue()
+    webhook_event_service = get_webhook_event_service()
     tasks = set()
+    # Claimed events per delivery task, kept until the task finishes its delivery
+    task_events: Dict[asyncio.Task, List[dict]] = {}
+    draining = False
 
-    async def worker(event: dict):
+    async def worker(delivery: Awaitable, description: str) -> bool:
+        """Run a delivery in a semaphore slot, returning False when skipped by the drain."""
         try:
+            wait_start = time.perf_counter()
             async with semaphore:
-                await process_webhook_event_delivery(event)
+                DELIVERY_SEMAPHORE_WAIT_SECONDS.observe(
+                    time.perf_counter() - wait_start
+                )
+                # Deliveries that got no slot before the drain are not started
+                if draining:
+                    delivery.close()
+                    return False
+                DELIVERY_IN_FLIGHT.inc()
+                delivery_worker_runtime.in_flight[asyncio.current_task()] = (
+                    InFlightAttemptDTO(
+                        description=description,
+                        destination=destination,
+                        started_at=time.time(),
+                    )
+                )
+                try:
+                    await delivery
+                finally:
+                    DELIVERY_IN_FLIGHT.dec()
+                    delivery_worker_runtime.in_flight.pop(asyncio.current_task(), None)
         except asyncio.CancelledError:
-            logger.info(f"Worker for event {event['_id']} cancelled during shutdown.")
+            logger.info(f"Worker for {description} cancelled during shutdown.")
             raise
         except Exception as e:
-            logger.exception(
-                f"Unexpected error in worker for event {event['_id']}: {e}"
-            )
+            logger.exception(f"Unexpected error in worker for {description}: {e}")
+        return True
+
+    def on_worker_done(task: asyncio.Task) -> None:
+        tasks.discard(task)
+        if not task.cancelled() and task.result():
+            task_events.pop(task, None)
 
+    def start_worker(delivery: Awaitable, description: str, events: List[dict]) -> None:
+        task = asyncio.create_task(worker(delivery, description))
+        tasks.add(task)
+        task_events[task] = events
+        task.add_done_callback(on_worker_done)
+
+    # Destinations with a batch policy receive claimed events grouped into one request
+    batch_policy = get_batch_delivery_policy(destination=destination)
+    batcher = (
+        DeliveryBatcher(
+            policy=batch_policy,
+            on_batch=lambda events, item_bodies, stage_timestamps_list: start_worker(
+                process_webhook_event_batch_delivery(
+                    events, item_bodies, stage_timestamps_list
+                ),
+                description=f"batch of {len(events)} events",
+                events=events,
+            ),
+            semaphore=semaphore,
+        )
+        if batch_policy
+        else None
+    )
+
+    # Popped from the queue but not yet handed to a worker, so a cancelled claim may
+    # have locked it
+    claiming_event_id: Optional[ObjectId] = None
     try:
         while True:
-            _, event_id = await redis_service.brpop_event_from_queue(
-                key="webhook:queue"
-            )
-            if isinstance(event_id, bytes):
-                event_id = event_id.decode()
+            # Paused from the worker admin server
+            await delivery_worker_runtime.dequeue_enabled.wait()
+            event_id = await webhook_queue.dequeue()
+            if not event_id:
+                continue
+            # Stage timestamps are wall-clock epoch seconds, since they are compared with
+            # the ingest timestamps of the API process, where monotonic clocks differ
+            dequeued = time.time()
+            delivery_worker_runtime.pop_rate.record()
+            claiming_event_id = ObjectId(event_id)
             event = await webhook_event_service.claim_webhook_event(
-                current_time=datetime.now(tz=timezone.utc), event_id=ObjectId(event_id)
+                current_time=datetime.now(tz=timezone.utc), event_id=claiming_event_id
             )
+            claiming_event_id = None
             if not event:
                 continue
-            task = asyncio.create_task(worker(event))
-            tasks.add(task)
-            task.add_done_callback(tasks.discard)
+            delivery_worker_runtime.claim_rate.record()
+            stage_timestamps = {"dequeued": dequeued, "claimed": time.time()}
+            if batcher:
+                batcher.add(event, stage_timestamps)
+            else:
+                start_worker(
+                    process_webhook_event_delivery(event, stage_timestamps),
+                    description=f"event {event['_id']}",
+                    events=[event],
+                )
     except asyncio.CancelledError:
-        logger.info("Webhook delivery main loop cancelled. Shutting down...")
+        logger.info("Webhook delivery main loop cancelled. Draining...")
     finally:
+        draining = True
+        unfinished_events = batcher.drain() if batcher else []
         if tasks:
-            logger.info(f"Waiting for {len(tasks)} running delivery tasks to finish...")
-            for task in tasks:
+            logger.info(
+                f"Waiting up to {settings.WORKER_DRAIN_TIMEOUT_SECONDS}s for "
+                f"{len(tasks)} running delivery tasks to finish..."
+            )
+            _, pending = await asyncio.wait(
+                set(tasks), timeout=settings.WORKER_DRAIN_TIMEOUT_SECONDS
+            )
+            for task in pending:
                 task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*pending, return_exceptions=True)
+        for events in task_events.values():
+            unfinished_events.extend(events)
+        unfinished_event_ids = [event["_id"] for event in unfinished_events]
+        if claiming_event_id is not None:
+            unfinished_event_ids.append(claiming_event_id)
+        if unfinished_event_ids:
+            try:
+                released_count = (
+                    await webhook_event_service.release_claimed_webhook_events(
+                        event_ids=unfinished_event_ids
+                    )
+                )
+                logger.info(
+                    f"Requeued {len(unfinished_event_ids)} unfinished events, "
+                    f"released {released_count} locks"
+                )
+            except Exception as exc:
+                logger.warning(
+                    f"Failed to release {len(unfinished_event_ids)} unfinished events, "
+                    f"they are retried once their locks expire: {exc}"
+                )
+        delivery_worker_runtime.stop()
         # Closing global HTTP client on shutdown
-        await http_client.aclose()
+        await close_http_client()
         logger.info("Webhook delivery task shutdown complete.")
+
+
+def start_webhook_worker_tasks() -> List[asyncio.Task]:
+    """
+    Start the delivery loop, retry scheduler, queue metrics collector, latency rollup
+    flusher and event loop lag monitor tasks, plus the event archiver and the admin
+    server when this process is configured to run them. An admin address that can't be
+    bound only disables the admin server.
+    """
+    tasks = [
+        asyncio.create_task(webhook_delivery_task()),
+        asyncio.create_task(webhook_retry_scheduler()),
+        asyncio.create_task(webhook_queue_metrics_collector()),
+        asyncio.create_task(stage_latency_rollup_flusher()),
+        asyncio.create_task(event_loop_lag_monitor()),
+    ]
+    admin_socket = bind_worker_admin_socket() if is_worker_admin_enabled() else None
+    if admin_socket is not None:
+        tasks.append(
+            asyncio.create_task(worker_admin_server(admin_socket=admin_socket))
+        )
+    # A single process should archive, so batches are not read twice concurrently
+    if settings.RUN_EVENT_ARCHIVER and settings.FINISHED_EVENT_RETENTION_DAYS > 0:
+        tasks.append(asyncio.create_task(event_archiver()))
+    return tasks
@@ -0,0 +1,134 @@
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import stat
+import time
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.exceptions import HTTPException
+
+from app.api.v1.worker_admin import worker_admin_router
+from app.config.settings import settings
+from app.integrations.metrics import EVENT_LOOP_LAG_SECONDS
+from app.services.worker_runtime import delivery_worker_runtime
+from app.utils.constants.webhooks import EVENT_LOOP_LAG_INTERVAL_SECONDS
+from app.utils.custom_exception_handlers import (
+    global_exception_handler,
+    http_exception_handler,
+    utils_exception_handler,
+)
+from app.utils.exceptions.core import UtilsException
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class WorkerAdminServer(uvicorn.Server):
+    """Uvicorn server leaving signal handling to the worker, which drains on SIGTERM."""
+
+    @contextlib.contextmanager
+    def capture_signals(self):
+        yield
+
+
+def create_worker_admin_app() -> FastAPI:
+    """Create the admin app served by the delivery worker."""
+    admin_app = FastAPI(
+        title=f"{settings.APP_NAME} worker admin",
+        version=settings.APP_VERSION,
+        docs_url="/docs",
+    )
+    admin_app.add_exception_handler(UtilsException, handler=utils_exception_handler)
+    admin_app.add_exception_handler(HTTPException, handler=http_exception_handler)
+    admin_app.add_exception_handler(Exception, handler=global_exception_handler)
+    admin_app.include_router(router=worker_admin_router)
+    return admin_app
+
+
+def is_worker_admin_enabled() -> bool:
+    """Return whether a port or a Unix socket is configured for the admin server."""
+    return bool(settings.WORKER_ADMIN_PORT or settings.WORKER_ADMIN_SOCKET)
+
+
+def get_worker_admin_address() -> str:
+    """Return the configured Unix socket path or host and port, for logging."""
+    return settings.WORKER_ADMIN_SOCKET or (
+        f"{settings.WORKER_ADMIN_HOST}:{settings.WORKER_ADMIN_PORT}"
+    )
+
+
+def bind_worker_admin_socket() -> Optional[socket.socket]:
+    """
+    Bind the admin socket before serving, since uvicorn exits the process when it fails
+    to bind. Returns None when the address can't be bound, so the worker runs without
+    the admin server instead of stopping its deliveries.
+    """
+    try:
+        if settings.WORKER_ADMIN_SOCKET:
+            path = settings.WORKER_ADMIN_SOCKET
+            # Replacing the socket file a previous run left behind
+            if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+                os.unlink(path)
+            admin_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                admin_socket.bind(path)
+            except OSError:
+                admin_socket.close()
+                raise
+            return admin_socket
+        family = (
+            socket.AF_INET6 if ":" in settings.WORKER_ADMIN_HOST else socket.AF_INET
+        )
+        return socket.create_server(
+            (settings.WORKER_ADMIN_HOST, settings.WORKER_ADMIN_PORT), family=family
+        )
+    except OSError as exc:
+        logger.error(
+            f"Worker admin could not bind {get_worker_admin_address()}, "
+            f"running without it: {exc}"
+        )
+        return None
+
+
+async def worker_admin_server(admin_socket: socket.socket):
+    """Serve the worker admin app on the bound Unix socket or port."""
+    config = uvicorn.Config(
+        app=create_worker_admin_app(),
+        lifespan="off",
+        log_config=None,
+        access_log=False,
+    )
+    server = WorkerAdminServer(config=config)
+    serve_task = asyncio.create_task(server.serve(sockets=[admin_socket]))
+    logger.info(f"Worker admin listening on {get_worker_admin_address()}")
+    try:
+        await asyncio.shield(serve_task)
+    except asyncio.CancelledError:
+        # Letting uvicorn close its connections instead of abandoning them
+        server.should_exit = True
+        await serve_task
+        raise
+    finally:
+        admin_socket.close()
+        if settings.WORKER_ADMIN_SOCKET:
+            with contextlib.suppress(OSError):
+                os.unlink(settings.WORKER_ADMIN_SOCKET)
+
+
+async def event_loop_lag_monitor():
+    """
+    Periodically measures how late a short sleep wakes up. The delay is time the event
+    loop spent on other callbacks, i.e. how long any ready delivery waits to resume.
+    """
+    while True:
+        started = time.monotonic()
+        await asyncio.sleep(EVENT_LOOP_LAG_INTERVAL_SECONDS)
+        lag_seconds = max(
+            0.0, time.monotonic() - started - EVENT_LOOP_LAG_INTERVAL_SECONDS
+        )
+        delivery_worker_runtime.event_loop_lag_seconds = lag_seconds
+        EVENT_LOOP_LAG_SECONDS.set(lag_seconds)
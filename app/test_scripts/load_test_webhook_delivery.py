@@ -0,0 +1,320 @@
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from app.test_scripts.stub_receiver import (
+    StubReceiverConfig,
+    StubReceiverStats,
+    create_stub_receiver_server,
+)
+
+# End-to-end load testing harness. It starts the stub downstream receiver, drives signed
+# ingest requests at a target RPS over one shared client, waits for the worker to deliver
+# them and writes throughput and latency percentiles as JSON for comparison between commits.
+#
+# The API and worker must deliver to the stub, i.e. run with BE_BASE_URL pointing at it, or
+# pass --spawn-services to let the harness start both with the right environment.
+#
+#   python -m app.test_scripts.load_test_webhook_delivery --rps 200 --duration 30
+
+load_dotenv()
+
+SECRET_KEY = os.getenv("SECRET_KEY", "").encode()
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Return the nearest-rank percentile of the given values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(values: List[float]) -> dict:
+    """Summarize latencies (seconds) into millisecond percentiles."""
+
+    def to_ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        "count": len(values),
+        "p50_ms": to_ms(percentile(values, 50)),
+        "p95_ms": to_ms(percentile(values, 95)),
+        "p99_ms": to_ms(percentile(values, 99)),
+        "max_ms": to_ms(max(values) if values else None),
+    }
+
+
+def get_git_commit() -> Optional[str]:
+    """Return the current git commit so results can be compared between commits."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_signed_request(sequence: int) -> tuple:
+    """Build a signed ingest body and headers carrying the harness tracking fields."""
+    payload = {
+        "event_type": "load_test",
+        "order_id": sequence,
+        "bench_id": str(uuid.uuid4()),
+        "bench_sent_at": time.time(),
+    }
+    raw_body = json.dumps(payload).encode()
+    timestamp = datetime.now(tz=timezone.utc).isoformat()
+    signature = hmac.new(
+        key=SECRET_KEY,
+        msg=timestamp.encode() + b"." + raw_body,
+        digestmod=hashlib.sha256,
+    ).hexdigest()
+    headers = {
+        "Content-Type": "application/json",
+        "x-timestamp": timestamp,
+        "x-signature": signature,
+        "Idempotency-Key": payload["bench_id"],
+    }
+    return payload, raw_body, headers
+
+
+class IngestLoadGenerator:
+    """Open-loop load generator sending signed ingest requests at a fixed rate."""
+
+    def __init__(self, client: httpx.AsyncClient, ingest_url: str):
+        self.client = client
+        self.ingest_url = ingest_url
+        self.latencies: List[float] = []
+        self.accepted_ids: set = set()
+        self.status_counts: dict = {}
+        self.errors = 0
+
+    async def send(self, sequence: int) -> None:
+        payload, raw_body, headers = build_signed_request(sequence=sequence)
+        start = time.perf_counter()
+        try:
+            response = await self.client.post(
+                self.ingest_url, headers=headers, content=raw_body
+            )
+        except httpx.HTTPError:
+            self.errors += 1
+            return
+        self.latencies.append(time.perf_counter() - start)
+        status_key = str(response.status_code)
+        self.status_counts[status_key] = self.status_counts.get(status_key, 0) + 1
+        if response.status_code == 201:
+            self.accepted_ids.add(payload["bench_id"])
+
+    async def run(self, rps: float, duration: float) -> float:
+        """Schedule requests on a fixed timetable so slow responses don't lower the rate."""
+        total_requests = int(rps * duration)
+        tasks = []
+        start = time.perf_counter()
+        for sequence in range(total_requests):
+            delay = start + sequence / rps - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self.send(sequence=sequence)))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+
+async def wait_for_url(client: httpx.AsyncClient, url: str, timeout: float) -> None:
+    """Poll a health URL until it answers or the timeout elapses."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get(url)).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError(f"Timed out waiting for {url}")
+
+
+def spawn_services(stub_base_url: str, api_port: int) -> List[subprocess.Popen]:
+    """Start the API and the delivery worker configured to deliver to the stub receiver."""
+    env = {**os.environ, "BE_BASE_URL": stub_base_url}
+    api = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(api_port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    worker = subprocess.Popen([sys.executable, "-m", "app.webhook_entry"], env=env)
+    return [api, worker]
+
+
+async def wait_for_deliveries(
+    stats: StubReceiverStats, expected_ids: set, timeout: float
+) -> float:
+    """Wait until every accepted event reached the stub or the drain timeout elapses."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        if expected_ids.issubset(stats.delivered_at.keys()):
+            break
+        await asyncio.sleep(0.1)
+    return time.perf_counter() - start
+
+
+def print_comparison(results: dict, baseline_path: str) -> None:
+    """Print percentage deltas of key figures against a previous results file."""
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    keys = [
+        ("ingest", "achieved_rps"),
+        ("ingest", "p99_ms"),
+        ("delivery", "throughput_per_second"),
+        ("delivery", "p50_ms"),
+        ("delivery", "p95_ms"),
+        ("delivery", "p99_ms"),
+    ]
+    print(f"\n=== COMPARISON AGAINST {baseline.get('commit')} ===")
+    for section, key in keys:
+        old = baseline.get(section, {}).get(key)
+        new = results.get(section, {}).get(key)
+        if old in (None, 0) or new is None:
+            print(f"{section}.{key}: {old} -> {new}")
+            continue
+        print(f"{section}.{key}: {old} -> {new} ({(new - old) / old * 100:+.1f}%)")
+
+
+async def main(args: argparse.Namespace) -> dict:
+    stub_config = StubReceiverConfig(
+        latency_ms=args.stub_latency_ms,
+        latency_jitter_ms=args.stub_latency_jitter_ms,
+        error_rate=args.stub_error_rate,
+        rate_limited_rate=args.stub_rate_limited_rate,
+        retry_after_seconds=args.stub_retry_after_seconds,
+        seed=args.seed,
+    )
+    stats = StubReceiverStats()
+    stub_server = create_stub_receiver_server(
+        config=stub_config, stats=stats, port=args.stub_port
+    )
+    stub_task = asyncio.create_task(stub_server.serve())
+    stub_base_url = f"http://127.0.0.1:{args.stub_port}"
+
+    processes: List[subprocess.Popen] = []
+    limits = httpx.Limits(
+        max_connections=args.max_connections,
+        max_keepalive_connections=args.max_connections,
+    )
+    try:
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            await wait_for_url(client, f"{stub_base_url}/health", timeout=10)
+            if args.spawn_services:
+                processes = spawn_services(
+                    stub_base_url=stub_base_url, api_port=args.api_port
+                )
+                await wait_for_url(
+                    client, f"http://127.0.0.1:{args.api_port}/health", timeout=30
+                )
+            ingest_url = args.ingest_url or (
+                f"http://127.0.0.1:{args.api_port}/api/v1/webhooks/ingest"
+            )
+
+            generator = IngestLoadGenerator(client=client, ingest_url=ingest_url)
+            ingest_elapsed = await generator.run(rps=args.rps, duration=args.duration)
+            drain_elapsed = await wait_for_deliveries(
+                stats=stats,
+                expected_ids=generator.accepted_ids,
+                timeout=args.drain_timeout,
+            )
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait(timeout=30)
+        stub_server.should_exit = True
+        await stub_task
+
+    delivered = len(generator.accepted_ids & stats.delivered_at.keys())
+    total_elapsed = ingest_elapsed + drain_elapsed
+    return {
+        "commit": get_git_commit(),
+        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+        "config": {
+            "target_rps": args.rps,
+            "duration_seconds": args.duration,
+            "stub_latency_ms": args.stub_latency_ms,
+            "stub_latency_jitter_ms": args.stub_latency_jitter_ms,
+            "stub_error_rate": args.stub_error_rate,
+            "stub_rate_limited_rate": args.stub_rate_limited_rate,
+        },
+        "ingest": {
+            "sent": int(args.rps * args.duration),
+            "accepted": len(generator.accepted_ids),
+            "transport_errors": generator.errors,
+            "status_counts": generator.status_counts,
+            "achieved_rps": round(len(generator.latencies) / ingest_elapsed, 2),
+            **summarize_latencies(generator.latencies),
+        },
+        "delivery": {
+            "delivered": delivered,
+            "undelivered": len(generator.accepted_ids) - delivered,
+            "duplicate_deliveries": stats.duplicate_deliveries,
+            "receiver_status_counts": {
+                str(code): count for code, count in stats.status_counts.items()
+            },
+            "throughput_per_second": round(delivered / total_elapsed, 2),
+            **summarize_latencies(stats.end_to_end_latencies),
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="End-to-end webhook load test.")
+    parser.add_argument("--rps", type=float, default=100.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--ingest-url", default=None)
+    parser.add_argument("--api-port", type=int, default=8000)
+    parser.add_argument("--spawn-services", action="store_true")
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument("--drain-timeout", type=float, default=60.0)
+    parser.add_argument("--stub-port", type=int, default=9000)
+    parser.add_argument("--stub-latency-ms", type=float, default=20.0)
+    parser.add_argument("--stub-latency-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--stub-error-rate", type=float, default=0.0)
+    parser.add_argument("--stub-rate-limited-rate", type=float, default=0.0)
+    parser.add_argument("--stub-retry-after-seconds", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default="load_test_results.json")
+    parser.add_argument("--compare", default=None, help="Previous results file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    cli_args = parse_args()
+    load_test_results = asyncio.run(main(cli_args))
+    with open(cli_args.output, "w") as output_file:
+        json.dump(load_test_results, output_file, indent=2)
+    print(json.dumps(load_test_results, indent=2))
+    if cli_args.compare:
+        print_comparison(results=load_test_results, baseline_path=cli_args.compare)
@@ -0,0 +1,161 @@
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
+
+# Stub downstream receiver used by the load testing harness. It serves the same path as the
+# demo downstream endpoint, so pointing the worker's BE_BASE_URL at it is enough to route
+# deliveries here. Latency, error and 429 behaviour are drawn from configurable distributions.
+# Batched deliveries (JSON arrays) are answered with a result per item, with errors drawn
+# per item and 429s per request.
+
+RECEIVE_PATH = "/api/v1/webhooks/downstream/receive"
+
+
+class StubReceiverConfig:
+    """Holds the latency and failure distributions applied by the stub receiver."""
+
+    def __init__(
+        self,
+        latency_ms: float = 20.0,
+        latency_jitter_ms: float = 10.0,
+        error_rate: float = 0.0,
+        rate_limited_rate: float = 0.0,
+        retry_after_seconds: int = 1,
+        seed: Optional[int] = None,
+    ):
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.rate_limited_rate = rate_limited_rate
+        self.retry_after_seconds = retry_after_seconds
+        self.random = random.Random(seed)
+
+    def get_latency_seconds(self) -> float:
+        """Draw a response latency from a gaussian around the configured mean."""
+        latency_ms = self.random.gauss(self.latency_ms, self.latency_jitter_ms)
+        return max(0.0, latency_ms) / 1000
+
+
+class StubReceiverStats:
+    """Collects delivery counts and end-to-end latencies observed by the stub receiver."""
+
+    def __init__(self):
+        self.status_counts: Dict[int, int] = {}
+        self.delivered_at: Dict[str, float] = {}
+        self.end_to_end_latencies: List[float] = []
+        self.duplicate_deliveries = 0
+
+    def record(self, status_code: int, payload: Optional[dict]) -> None:
+        """Record a response and, for successful deliveries, the end-to-end latency."""
+        self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+        if not payload or not 200 <= status_code < 300:
+            return
+        bench_id = payload.get("bench_id")
+        sent_at = payload.get("bench_sent_at")
+        if bench_id is None or sent_at is None:
+            return
+        if bench_id in self.delivered_at:
+            self.duplicate_deliveries += 1
+            return
+        now = time.time()
+        self.delivered_at[bench_id] = now
+        self.end_to_end_latencies.append(now - sent_at)
+
+
+def create_stub_receiver_app(
+    config: StubReceiverConfig, stats: StubReceiverStats
+) -> FastAPI:
+    """Build the stub receiver ASGI app bound to the given config and stats collector."""
+    stub_app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
+    @stub_app.post(RECEIVE_PATH)
+    async def receive(request: Request) -> Response:
+        await asyncio.sleep(config.get_latency_seconds())
+        try:
+            payload = await request.json()
+        except ValueError:
+            payload = None
+        draw = config.random.random()
+        if draw < config.rate_limited_rate:
+            stats.record(status.HTTP_429_TOO_MANY_REQUESTS, None)
+            return Response(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(config.retry_after_seconds)},
+            )
+        if isinstance(payload, list):
+            return JSONResponse(content={"results": receive_batch(items=payload)})
+        if draw < config.rate_limited_rate + config.error_rate:
+            stats.record(status.HTTP_503_SERVICE_UNAVAILABLE, None)
+            return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        stats.record(status.HTTP_200_OK, payload if isinstance(payload, dict) else None)
+        return Response(status_code=status.HTTP_200_OK)
+
+    def receive_batch(items: List[dict]) -> List[dict]:
+        """Fail batch items at the configured error rate and report a result per item."""
+        results = []
+        for item in items:
+            if config.random.random() < config.error_rate:
+                status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+                stats.record(status_code, None)
+            else:
+                status_code = status.HTTP_200_OK
+                stats.record(status_code, item.get("data"))
+            results.append({"id": item.get("id"), "status_code": status_code})
+        return results
+
+    @stub_app.get("/health")
+    async def health() -> dict:
+        return {"status": "OK"}
+
+    return stub_app
+
+
+def create_stub_receiver_server(
+    config: StubReceiverConfig,
+    stats: StubReceiverStats,
+    host: str = "127.0.0.1",
+    port: int = 9000,
+) -> uvicorn.Server:
+    """Create a uvicorn server for the stub receiver that can be served in a running loop."""
+    server_config = uvicorn.Config(
+        app=create_stub_receiver_app(config=config, stats=stats),
+        host=host,
+        port=port,
+        log_level="warning",
+        access_log=False,
+    )
+    return uvicorn.Server(config=server_config)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the stub downstream receiver.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limited-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after-seconds", type=int, default=1)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    stub_config = StubReceiverConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        rate_limited_rate=args.rate_limited_rate,
+        retry_after_seconds=args.retry_after_seconds,
+    )
+    server = create_stub_receiver_server(
+        config=stub_config, stats=StubReceiverStats(), host=args.host, port=args.port
+    )
+    asyncio.run(server.serve())
@@ -16,7 +16,7 @@ WEBHOOK_URL = "http://localhost:8000/api/v1/webhooks/ingest"  # NOTE: Use your o
 
 
 # Creating the required headers and calling the webhook ingest endpoint for testing the webhook delivery task
-async def send_webhook(i):
+async def send_webhook(client: httpx.AsyncClient, i):
     payload = {"order_id": i}
     raw_body = json.dumps(payload).encode()
     timestamp = datetime.now(tz=timezone.utc).isoformat()
@@ -31,15 +31,16 @@ async def send_webhook(i):
         "Idempotency-Key": idempotency_key,
     }
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(WEBHOOK_URL, headers=headers, content=raw_body)
-        print(f"[Order {i}] Status: {resp.status_code}, Response: {resp.text}")
+    resp = await client.post(WEBHOOK_URL, headers=headers, content=raw_body)
+    print(f"[Order {i}] Status: {resp.status_code}, Response: {resp.text}")
 
 
 async def main():
-    # Calling the no. of requests mentioned in loop range concurrently
-    tasks = [send_webhook(i) for i in range(1, 6)]
-    await asyncio.gather(*tasks)
+    # Calling the no. of requests mentioned in loop range concurrently over one shared client.
+    # For throughput and latency measurements use load_test_webhook_delivery.py instead.
+    async with httpx.AsyncClient() as client:
+        tasks = [send_webhook(client, i) for i in range(1, 6)]
+        await asyncio.gather(*tasks)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+import math
+import random
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from app.config.settings import settings
+from app.utils.constants.webhooks import MAX_RETRY_ATTEMPTS
+from app.utils.datetime_utils import get_utc_datetime
+from app.utils.dtos.webhooks import RetryPolicyDTO
+from app.utils.enums.webhooks import RetryJitterEnum
+
+
+def get_retry_policy(destination: str) -> RetryPolicyDTO:
+    """Resolve the backoff policy of a destination from its overrides and the defaults."""
+    overrides = settings.DESTINATION_RETRY_POLICIES.get(destination, {})
+    return RetryPolicyDTO(
+        jitter=RetryJitterEnum(overrides.get("jitter", settings.RETRY_BACKOFF_JITTER)),
+        base_delay=float(
+            overrides.get("base_delay", settings.RETRY_BASE_DELAY_SECONDS)
+        ),
+        max_delay=float(overrides.get("max_delay", settings.RETRY_MAX_DELAY_SECONDS)),
+        max_attempts=int(overrides.get("max_attempts", MAX_RETRY_ATTEMPTS)),
+        delivery_deadline=float(
+            overrides.get("delivery_deadline", settings.RETRY_DELIVERY_DEADLINE_SECONDS)
+        ),
+    )
+
+
+def get_retry_delay(
+    policy: RetryPolicyDTO, attempt_count: int, previous_delay: Optional[float] = None
+) -> float:
+    """
+    Return the wait in seconds before the next attempt.
+
+    Full jitter draws uniformly below the capped exponential delay, decorrelated jitter
+    draws between the base delay and three times the previous delay. Both keep events
+    that failed together from retrying together.
+    """
+    if policy.jitter == RetryJitterEnum.DECORRELATED:
+        upper_delay = max(policy.base_delay, (previous_delay or policy.base_delay) * 3)
+        return min(policy.max_delay, random.uniform(policy.base_delay, upper_delay))
+
+    exponential_delay = min(
+        policy.max_delay, policy.base_delay * 2 ** (attempt_count - 1)
+    )
+    if policy.jitter == RetryJitterEnum.FULL:
+        return random.uniform(0, exponential_delay)
+    return exponential_delay
+
+
+def parse_retry_after(
+    value: Optional[str], now: datetime, max_delay: float
+) -> Optional[float]:
+    """
+    Parse a Retry-After header given as delay seconds or as an HTTP-date.
+
+    Returns the wait in seconds, clamped to 0 and `max_delay`, or None for a missing,
+    invalid or out of range value.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        delay = float(value)
+    else:
+        try:
+            retry_at = parsedate_to_datetime(value)
+            delay = (get_utc_datetime(value=retry_at) - now).total_seconds()
+        except (TypeError, ValueError, OverflowError):
+            return None
+    if not math.isfinite(delay):
+        return None
+    return min(max_delay, max(0.0, delay))
@@ -1,12 +1,113 @@
-from typing import List
-
 from app.config.settings import settings
+from app.utils.enums.webhooks import WebhookStatusEnum
 
 # Webhook delivery tasks config
 MAX_RETRY_ATTEMPTS: int = 5
-EXPONENTIAL_BACKOFF: List[int] = [1, 2, 4, 8, 16]
 
 DOWNSTREAM_URL = f"{settings.BE_BASE_URL}/api/v1/webhooks/downstream/receive"
 
 TASK_LOCKED_SECONDS = 30
+# Default request timeout, also used by adaptive timeouts until enough samples exist
 DELIVERY_TIMEOUT = 3
+# Adaptive timeouts look at the latency of the last 10 minutes in 1 minute slices
+ADAPTIVE_TIMEOUT_WINDOW_SECONDS = 600
+ADAPTIVE_TIMEOUT_SLICE_SECONDS = 60
+ADAPTIVE_TIMEOUT_MIN_SAMPLES = 50
+ADAPTIVE_TIMEOUT_REFRESH_SECONDS = 1
+# Adaptive timeouts stay this far below the claim lock, whatever the configured maximum,
+# leaving time to finalize the attempt before another worker may claim the event
+ADAPTIVE_TIMEOUT_LOCK_MARGIN_SECONDS = 5
+# Due retries are promoted in small paced batches, so a burst coming due at once is
+# spread over a window instead of flooding the delivery queue
+RETRY_PROMOTE_BATCH_SIZE = 100
+RETRY_PROMOTE_MAX_PER_SECOND = 1000
+# Pending events past their expires_at are moved to EXPIRED in batches of this size
+EXPIRE_EVENTS_BATCH_SIZE = 1000
+
+# Batch delivery defaults of destinations configured without explicit limits
+BATCH_DELIVERY_DEFAULT_MAX_EVENTS = 100
+BATCH_DELIVERY_DEFAULT_MAX_BYTES = 1024 * 1024
+BATCH_DELIVERY_DEFAULT_LINGER_MS = 50
+# A batch waiting for a free delivery slot is handed off after this long at most, well
+# before the claims of its events expire and other workers could deliver them again
+BATCH_DELIVERY_MAX_LINGER_SECONDS = TASK_LOCKED_SECONDS / 6
+
+# Dead-letter replay config
+DEAD_LETTER_REPLAY_BATCH_SIZE = 500
+DEAD_LETTER_REPLAY_DEFAULT_RATE = 200
+DEAD_LETTER_REPLAY_MAX_RATE = 5000
+# A running job records progress every batch, one silent for this long lost its process
+DEAD_LETTER_REPLAY_STALE_SECONDS = 60
+DEAD_LETTER_REPLAY_WATCHDOG_INTERVAL_SECONDS = 30
+
+# Retention config
+FINISHED_WEBHOOK_STATUSES: tuple = (
+    WebhookStatusEnum.DELIVERED,
+    WebhookStatusEnum.FAILED_PERMANENTLY,
+    WebhookStatusEnum.EXPIRED,
+)
+EVENT_ARCHIVE_BATCH_SIZE = 1000
+EVENT_ARCHIVE_BATCH_PAUSE_SECONDS = 0.1
+EVENT_ARCHIVE_INTERVAL_SECONDS = 300
+
+# Export config
+EXPORT_CURSOR_BATCH_SIZE = 1000
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Promoted attribute config. Longer values are not promoted, keeping `attrs` compact.
+SEARCH_ATTRIBUTE_QUERY_PREFIX = "attr."
+EVENT_ATTRIBUTE_MAX_LENGTH = 256
+
+# Token lease config
+TOKEN_LEASE_REFILL_THRESHOLD = 0.25
+TOKEN_LEASE_MAX_KEYS = 10000
+
+# Ingest limits config
+DEFAULT_SIGNING_KEY_ID = "default"
+
+# Ingest admission config. Samples older than the stale limit admit every request.
+INGEST_ADMISSION_SAMPLE_INTERVAL_SECONDS = 1
+INGEST_ADMISSION_STALE_AFTER_SECONDS = 10
+
+# Signing key cache config
+SIGNING_KEY_CACHE_TTL_SECONDS = 60
+SIGNING_KEY_CACHE_MAX_KEYS = 10000
+# Unknown key ids are remembered briefly in a separate, smaller cache, so made-up key
+# ids neither evict real keys nor stay rejected long after the key is inserted
+SIGNING_KEY_NEGATIVE_CACHE_TTL_SECONDS = 5
+SIGNING_KEY_NEGATIVE_CACHE_MAX_KEYS = 1000
+# Key ids outside this format are rejected without a lookup
+SIGNING_KEY_ID_PATTERN = r"[A-Za-z0-9._:-]{1,64}"
+
+# Event status cache config. Entries are written on ingest and on every status change.
+EVENT_STATUS_CACHE_TTL_SECONDS = 300
+
+# Metrics config
+QUEUE_METRICS_INTERVAL_SECONDS = 5
+
+# Worker admin config. Pop and claim rates are averaged over the window.
+WORKER_RATE_WINDOW_SECONDS = 10
+WORKER_ADMIN_MAX_CONCURRENCY = 10000
+EVENT_LOOP_LAG_INTERVAL_SECONDS = 0.5
+
+# Queue keys
+WEBHOOK_QUEUE_KEY = "webhook:queue"
+WEBHOOK_RETRY_KEY = "webhook:retry"
+WEBHOOK_ORDERING_LANE_KEY_PREFIX = "webhook:ordered:"
+
+# Event status cache keys
+WEBHOOK_EVENT_STATUS_KEY_PREFIX = "webhook:event:status:"
+# Cached search totals, keyed by the hash of the normalized filter
+WEBHOOK_SEARCH_COUNT_KEY_PREFIX = "webhook:search:count:"
+WEBHOOK_EVENT_IDEMPOTENCY_KEY_PREFIX = "webhook:event:idempotency:"
+
+# Stage latency rollups config
+LATENCY_ROLLUP_BUCKET_SECONDS = 60
+LATENCY_ROLLUP_FLUSH_INTERVAL_SECONDS = 5
+LATENCY_ROLLUP_RETENTION_DAYS = 30
+LATENCY_BREAKDOWN_DEFAULT_WINDOW_HOURS = 1
+
+# Log-spaced latency histogram buckets: 1ms growing by 20% per bucket up to ~3 hours
+LATENCY_HISTOGRAM_BASE_SECONDS = 0.001
+LATENCY_HISTOGRAM_GROWTH_FACTOR = 1.2
+LATENCY_HISTOGRAM_BUCKET_COUNT = 90
@@ -82,11 +82,8 @@ def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse
     return CustomAPIResponse().get_error_response(
         code=exc.status_code,
         message=exc.detail,
-        headers=(
-            exc.headers
-            if exc.status_code == status.HTTP_429_TOO_MANY_REQUESTS
-            else None
-        ),
+        # Keeping headers such as Retry-After of 429 and 503 responses
+        headers=exc.headers,
     )
 
 
@@ -17,3 +17,17 @@ def get_timezone_aware_timestamp_from_string(timestamp: str) -> datetime:
         raise UtilsException(
             message="Invalid imestamp format! Must be ISO 8601.", error="bad-request"
         )
+
+
+def get_utc_timestamp(value: datetime) -> float:
+    """Return the epoch timestamp of a datetime, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def get_utc_datetime(value: datetime) -> datetime:
+    """Return a timezone-aware datetime, treating naive values (as read from MongoDB) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
@@ -0,0 +1,96 @@
+from datetime import datetime
+from hmac import HMAC
+from typing import Dict, NamedTuple, Optional
+
+from app.utils.enums.webhooks import RetryJitterEnum, SearchCountStrategyEnum
+
+
+class QueueStatsDTO(NamedTuple):
+    """Holds depth and oldest entry details of the main and retry webhook queues."""
+
+    queue_depth: int
+    oldest_queue_item: Optional[str]
+    retry_depth: int
+    oldest_retry_score: Optional[float]
+
+
+class LatencyRollupDTO(NamedTuple):
+    """Holds a pre-aggregated latency histogram for one stage, event type and minute."""
+
+    bucket_start: datetime
+    event_type: Optional[str]
+    stage: str
+    count: int
+    total_seconds: float
+    bucket_counts: Dict[int, int]
+
+
+class TokenLeaseDTO(NamedTuple):
+    """Holds the tokens granted by a lease and the wait before one becomes available."""
+
+    granted: int
+    retry_after: float
+
+
+class RateLimitDecisionDTO(NamedTuple):
+    """Holds a rate limit decision, the wait before retrying and the limit that denied it."""
+
+    allowed: bool
+    retry_after: float
+    reason: Optional[str]
+
+
+class IngestLimitsDTO(NamedTuple):
+    """Holds the ingest rate (per second), burst capacity and daily quota of a producer."""
+
+    rate: float
+    burst: int
+    daily_quota: int
+
+
+class SigningKeyDTO(NamedTuple):
+    """Holds a pre-keyed HMAC of a signing key and the window in which it is valid."""
+
+    keyed_hmac: HMAC
+    valid_from: Optional[datetime]
+    valid_until: Optional[datetime]
+
+
+class RetryPolicyDTO(NamedTuple):
+    """Holds the backoff policy of a destination, delays and deadline in seconds."""
+
+    jitter: RetryJitterEnum
+    base_delay: float
+    max_delay: float
+    max_attempts: int
+    delivery_deadline: float
+
+
+class BatchDeliveryPolicyDTO(NamedTuple):
+    """Holds the limits of batches sent to a destination, the linger in seconds."""
+
+    max_events: int
+    max_bytes: int
+    linger_seconds: float
+
+
+class DeliveryTimeoutDTO(NamedTuple):
+    """Holds the request timeout of a destination and whether it adapts to its latency."""
+
+    seconds: float
+    adaptive: bool
+
+
+class SearchCountDTO(NamedTuple):
+    """Holds the total count of a search and the strategy that produced it."""
+
+    count: int
+    strategy: SearchCountStrategyEnum
+
+
+class InFlightAttemptDTO(NamedTuple):
+    """Holds what a running delivery sends, to where, and when it started (epoch)."""
+
+    description: str
+    destination: str
+    started_at: float
@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class StorageBackendEnum(str, Enum):
+    """Enum class defining the supported event store and queue backends"""
+
+    MONGO_REDIS = "mongo_redis"
+    MEMORY = "memory"
+
+
+class MongoReadPreferenceEnum(str, Enum):
+    """Enum class defining the MongoDB read preference modes"""
+
+    PRIMARY = "primary"
+    PRIMARY_PREFERRED = "primaryPreferred"
+    SECONDARY = "secondary"
+    SECONDARY_PREFERRED = "secondaryPreferred"
+    NEAREST = "nearest"
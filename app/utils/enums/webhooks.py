@@ -8,3 +8,42 @@ class WebhookStatusEnum(str, Enum):
     FAILED_TEMPORARILY = "failed_temporarily"
     FAILED_PERMANENTLY = "failed_permanently"
     DELIVERED = "delivered"
+    EXPIRED = "expired"
+
+
+class DeliveryStageEnum(str, Enum):
+    """Enum class defining the lifecycle stages measured by the latency breakdown"""
+
+    INGEST = "ingest"
+    QUEUE_WAIT = "queue_wait"
+    CLAIM = "claim"
+    DISPATCH = "dispatch"
+    RECEIVER = "receiver"
+    FINALIZE = "finalize"
+    RETRY_BACKOFF = "retry_backoff"
+    END_TO_END = "end_to_end"
+
+
+class ReplayJobStatusEnum(str, Enum):
+    """Enum class defining dead-letter replay job statuses"""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class RetryJitterEnum(str, Enum):
+    """Enum class defining the jitter strategies of retry backoff policies"""
+
+    NONE = "none"
+    FULL = "full"
+    DECORRELATED = "decorrelated"
+
+
+class SearchCountStrategyEnum(str, Enum):
+    """Enum class defining how the total count of a search is computed"""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
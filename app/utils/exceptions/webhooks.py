@@ -12,3 +12,16 @@ class WebhookEventException(Exception):
 
     def __str__(self):
         return f"{self.message}: {self.error}"
+
+
+@dataclass
+class DuplicateWebhookEventException(Exception):
+    """
+    Exception raised by event stores when an event with the same idempotency key exists.
+    """
+
+    message: str
+    error: str
+
+    def __str__(self):
+        return f"{self.message}: {self.error}"
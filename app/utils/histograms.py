@@ -0,0 +1,46 @@
+import math
+from typing import Dict, Optional
+
+from app.utils.constants.webhooks import (
+    LATENCY_HISTOGRAM_BASE_SECONDS,
+    LATENCY_HISTOGRAM_BUCKET_COUNT,
+    LATENCY_HISTOGRAM_GROWTH_FACTOR,
+)
+
+_LOG_GROWTH_FACTOR = math.log(LATENCY_HISTOGRAM_GROWTH_FACTOR)
+
+
+def get_latency_bucket_index(seconds: float) -> int:
+    """Return the log-spaced histogram bucket holding the given duration."""
+    if seconds <= LATENCY_HISTOGRAM_BASE_SECONDS:
+        return 0
+    index = math.ceil(
+        math.log(seconds / LATENCY_HISTOGRAM_BASE_SECONDS) / _LOG_GROWTH_FACTOR
+    )
+    return min(index, LATENCY_HISTOGRAM_BUCKET_COUNT - 1)
+
+
+def get_latency_bucket_upper_bound(index: int) -> float:
+    """Return the upper bound in seconds of a histogram bucket."""
+    return LATENCY_HISTOGRAM_BASE_SECONDS * LATENCY_HISTOGRAM_GROWTH_FACTOR**index
+
+
+def get_percentile_from_buckets(
+    bucket_counts: Dict[int, int], percentile: float
+) -> Optional[float]:
+    """
+    Estimate a percentile from histogram bucket counts.
+
+    Returns the upper bound of the bucket containing the percentile rank, so the estimate
+    is never below the true value and at most one growth factor above it.
+    """
+    total = sum(bucket_counts.values())
+    if not total:
+        return None
+    rank = math.ceil(total * percentile / 100)
+    cumulative = 0
+    for index in sorted(bucket_counts):
+        cumulative += bucket_counts[index]
+        if cumulative >= rank:
+            return get_latency_bucket_upper_bound(index)
+    return get_latency_bucket_upper_bound(max(bucket_counts))
@@ -1,5 +1,6 @@
 import hashlib
 import hmac
+from typing import Optional
 
 from app.config.settings import settings
 
@@ -7,19 +8,23 @@ from app.config.settings import settings
 class HMACServices:
     """Service for generating and verifying HMAC-SHA256 signatures."""
 
-    def __init__(self):
-        self.secret_key = settings.SECRET_KEY.encode()
+    def __init__(self, keyed_hmac: Optional[hmac.HMAC] = None):
+        # Copying a pre-keyed HMAC skips re-deriving the key pads on every signature
+        self.keyed_hmac = keyed_hmac or self.get_keyed_hmac(secret=settings.SECRET_KEY)
+
+    @staticmethod
+    def get_keyed_hmac(secret: str) -> hmac.HMAC:
+        """Build an HMAC-SHA256 object keyed with the secret and holding no message yet."""
+        return hmac.new(key=secret.encode(), digestmod=hashlib.sha256)
 
     def generate_hmac_signature(
         self, signature_payload: bytes, x_timestamp: str
     ) -> str:
         """Generate HMAC-SHA256 signature for payload, including timestamp."""
         # Modifying payload with timestamp for preventing replay attacks
-        signature_payload = x_timestamp.encode() + b"." + signature_payload
-        signature = hmac.new(
-            key=self.secret_key, msg=signature_payload, digestmod=hashlib.sha256
-        ).hexdigest()
-        return signature
+        signature = self.keyed_hmac.copy()
+        signature.update(x_timestamp.encode() + b"." + signature_payload)
+        return signature.hexdigest()
 
     def compare_hmac_signatures(
         self, received_signature: str, expected_signature: str
@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from bson import ObjectId
+
+
+def get_json_compatible_value(value: Any) -> Any:
+    """
+    `default` hook for json.dumps rendering ObjectIds as strings and datetimes as UTC
+    ISO 8601, matching how the API responses serialize events.
+    """
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -1,7 +1,12 @@
 import asyncio
 import logging
+import signal
+
+from prometheus_client import start_http_server
 
 from app.config.database import close_db_client, init_db_client
+from app.config.settings import settings
+from app.dependencies.backends import is_memory_backend, reset_backends
 
 logging.basicConfig(
     level=logging.INFO,
@@ -15,30 +20,51 @@ async def main():
 
     logger.info("Webhook delivery worker startup initiated")
 
-    await init_db_client()
-    logger.info("MongoDB initialized successfully for worker")
-    from app.tasks.webhook_delivery import (
-        webhook_delivery_task,
-        webhook_retry_scheduler,
-    )
+    if is_memory_backend():
+        logger.warning(
+            "Memory storage backend is process-local; a standalone worker only sees "
+            "events ingested in this process. Use RUN_DELIVERY_WORKER_IN_API instead."
+        )
+    else:
+        await init_db_client()
+        logger.info("MongoDB initialized successfully for worker")
+    from app.tasks.webhook_delivery import start_webhook_worker_tasks
+
+    start_http_server(port=settings.WORKER_METRICS_PORT)
+    logger.info(f"Worker metrics exposed on port {settings.WORKER_METRICS_PORT}")
+
+    worker_tasks = start_webhook_worker_tasks()
 
-    delivery_task = asyncio.create_task(webhook_delivery_task())
-    retry_task = asyncio.create_task(webhook_retry_scheduler())
+    # Stopping on SIGTERM as on Ctrl+C, so the delivery loop drains before the exit.
+    # Unlike gather, wait leaves the tasks running, so each is cancelled exactly once.
+    stop_requested = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signal_number, stop_requested.set)
+    stop_task = asyncio.create_task(stop_requested.wait())
 
     try:
-        await asyncio.gather(delivery_task, retry_task)
+        done, _ = await asyncio.wait(
+            [stop_task, *worker_tasks], return_when=asyncio.FIRST_COMPLETED
+        )
+        # A worker task only returns by failing, so this raises its exception
+        for task in done - {stop_task}:
+            task.result()
+        logger.info("Webhook delivery worker shutdown requested")
 
     except Exception:
         logger.exception("Unhandled exception in webhook delivery worker")
         raise
 
     finally:
-        delivery_task.cancel()
-        retry_task.cancel()
+        stop_task.cancel()
+        for task in worker_tasks:
+            task.cancel()
 
-        await asyncio.gather(delivery_task, retry_task, return_exceptions=True)
+        await asyncio.gather(*worker_tasks, return_exceptions=True)
 
         await close_db_client()
+        reset_backends()
         logger.info("MongoDB connection closed for worker")
         logger.info("Webhook delivery worker shutdown completed")
 
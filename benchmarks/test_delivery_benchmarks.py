@@ -0,0 +1,62 @@
+import httpx
+import pytest
+from bson import ObjectId
+
+from app.utils.enums.webhooks import WebhookStatusEnum
+
+
+def build_mock_client(status_code: int) -> httpx.AsyncClient:
+    """Build an HTTP client whose transport answers every request in-process."""
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(status_code=status_code)
+        )
+    )
+
+
+def build_event(document_id: ObjectId) -> dict:
+    return {
+        "_id": document_id,
+        "data": {"event_type": "order_created", "order_id": 123456},
+        "attempt_count": 0,
+        "status": WebhookStatusEnum.RECEIVED,
+    }
+
+
+@pytest.fixture
+def delivery_module(memory_backends):
+    """Import the delivery task module; it resolves the in-memory backends at call time."""
+    from app.tasks import webhook_delivery
+
+    return webhook_delivery
+
+
+@pytest.mark.parametrize(
+    "status_code,expected_status",
+    [
+        (200, WebhookStatusEnum.DELIVERED),
+        (503, WebhookStatusEnum.FAILED_TEMPORARILY),
+    ],
+)
+def test_process_webhook_event_delivery(
+    benchmark,
+    event_loop_runner,
+    monkeypatch,
+    delivery_module,
+    memory_backends,
+    status_code,
+    expected_status,
+):
+    monkeypatch.setattr(
+        delivery_module, "_http_client", build_mock_client(status_code=status_code)
+    )
+    event_store = memory_backends.get_event_store()
+    document_id = ObjectId()
+
+    def deliver() -> None:
+        event = build_event(document_id=document_id)
+        event_store.documents[document_id] = dict(event)
+        event_loop_runner(delivery_module.process_webhook_event_delivery(event))
+
+    benchmark(deliver)
+    assert event_store.documents[document_id]["status"] == expected_status
@@ -0,0 +1,99 @@
+import hashlib
+import hmac
+import json
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from app.config.settings import settings
+from app.dependencies.auth import verify_webhook_signature
+from app.schemas.webhooks import WebhookIngestSchema
+
+PAYLOAD: dict = {
+    "event_type": "order_created",
+    "order_id": 123456,
+    "user_id": "user-42",
+    "amount": 600,
+    "items": [{"sku": f"sku-{index}", "quantity": index} for index in range(10)],
+}
+
+
+def build_signed_request() -> Request:
+    """Build a starlette request carrying a validly signed ingest body."""
+    raw_body = json.dumps(PAYLOAD).encode()
+    timestamp = datetime.now(tz=timezone.utc).isoformat()
+    signature = hmac.new(
+        key=settings.SECRET_KEY.encode(),
+        msg=timestamp.encode() + b"." + raw_body,
+        digestmod=hashlib.sha256,
+    ).hexdigest()
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": raw_body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/webhooks/ingest",
+        "headers": [
+            (b"x-signature", signature.encode()),
+            (b"x-timestamp", timestamp.encode()),
+        ],
+    }
+    request = Request(scope=scope, receive=receive)
+    request.x_signature = signature
+    request.x_timestamp = timestamp
+    return request
+
+
+def test_verify_webhook_signature(benchmark, event_loop_runner):
+    request = build_signed_request()
+
+    async def verify() -> str:
+        # Request caches the body after the first read, matching the per-request cost of
+        # verifying an already received body.
+        return await verify_webhook_signature(
+            request=request,
+            x_signature=request.x_signature,
+            x_timestamp=request.x_timestamp,
+            x_key_id=None,
+        )
+
+    assert benchmark(lambda: event_loop_runner(verify())) == "default"
+
+
+def test_webhook_ingest_schema_construction(benchmark):
+    schema = benchmark(
+        WebhookIngestSchema,
+        data=PAYLOAD,
+        event_type=PAYLOAD["event_type"],
+        idempotency_key="idempotency-key",
+    )
+    assert schema.event_type == "order_created"
+
+
+def test_webhook_ingest_schema_model_dump(benchmark):
+    schema = WebhookIngestSchema(
+        data=PAYLOAD,
+        event_type=PAYLOAD["event_type"],
+        idempotency_key="idempotency-key",
+    )
+    document = benchmark(schema.model_dump)
+    assert document["data"] == PAYLOAD
+
+
+def test_insert_webhook_event(benchmark, event_loop_runner, memory_backends):
+    service = memory_backends.get_webhook_event_service()
+    counter = iter(range(10**9))
+
+    def insert() -> dict:
+        schema = WebhookIngestSchema(
+            data=PAYLOAD,
+            event_type=PAYLOAD["event_type"],
+            idempotency_key=f"key-{next(counter)}",
+        )
+        return event_loop_runner(
+            service.insert_webhook_event(webhook_ingest_schema=schema)
+        )
+
+    assert benchmark(insert)["_id"] is not None
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+
+from app.dependencies.filtering import WebhookEventFilter
+from app.schemas.webhooks import WebhookListResponseSchema
+from app.utils.enums.webhooks import WebhookStatusEnum
+
+
+def build_search_response(item_count: int) -> dict:
+    """Build a search response dict shaped like the /search endpoint output."""
+    now = datetime.now(tz=timezone.utc)
+    events = [
+        {
+            "_id": str(ObjectId()),
+            "data": {"event_type": "order_created", "order_id": index},
+            "idempotency_key": f"key-{index}",
+            "status": WebhookStatusEnum.DELIVERED,
+            "received_at": now,
+            "event_type": "order_created",
+            "attempt_count": 2,
+            "delivery_logs": [
+                {
+                    "timestamp": now,
+                    "attempt_number": attempt,
+                    "status_code": 503 if attempt == 1 else 200,
+                    "success": attempt == 2,
+                }
+                for attempt in (1, 2)
+            ],
+            "locked_until": None,
+            "next_retry_at": None,
+        }
+        for index in range(item_count)
+    ]
+    aggregates = {
+        "count_by_status": [{"_id": "delivered", "count": item_count}],
+        "count_by_event_type": [{"_id": "order_created", "count": item_count}],
+        "hourly_histogram": [
+            {"_id": (now - timedelta(hours=hour)).isoformat(), "count": 10}
+            for hour in range(24)
+        ],
+    }
+    return {
+        "code": 200,
+        "message": "Webhook events retrieved successfully!",
+        "data": {
+            "total_count": item_count,
+            "results": {"events": events, "aggregates": aggregates},
+        },
+    }
+
+
+def test_build_filters_dict(benchmark):
+    now = datetime.now(tz=timezone.utc)
+    filter_params = WebhookEventFilter(
+        status=WebhookStatusEnum.FAILED_PERMANENTLY,
+        timestamp_from=now - timedelta(days=1),
+        timestamp_to=now,
+        event_type="order_created",
+    )
+    filters_dict = benchmark(filter_params._build_filters_dict)
+    assert set(filters_dict) == {"status", "event_type", "received_at"}
+
+
+def test_webhook_list_response_serialization(benchmark):
+    response = build_search_response(item_count=100)
+
+    def serialize() -> str:
+        # Mirrors FastAPI's response_model handling: validate then serialize to JSON
+        return WebhookListResponseSchema.model_validate(response).model_dump_json()
+
+    assert benchmark(serialize)
@@ -0,0 +1,47 @@
+import asyncio
+import os
+
+import pytest
+
+# Settings are read from the environment at import time, so test defaults are applied
+# before any app module is imported. Values from a real .env or environment take precedence.
+TEST_ENV_DEFAULTS: dict = {
+    "DEBUG": "false",
+    "ALLOWED_ORIGINS": "*",
+    "ALLOWED_HEADERS": "*",
+    "ALLOWED_METHODS": "*",
+    "APP_NAME": "webhook-delivery-tests",
+    "APP_DESCRIPTION": "tests",
+    "APP_VERSION": "0.0.0",
+    "MONGO_URL": "mongodb://127.0.0.1:27017",
+    "MONGO_DB_NAME": "webhook_tests",
+    "SECRET_KEY": "test-secret",
+    "TIMESTAMP_TOLERANCE_SECONDS": "300",
+    "REDIS_HOST": "127.0.0.1",
+    "REDIS_PORT": "6379",
+    "BE_BASE_URL": "http://downstream.local",
+    "CONCURRENT_WORKERS": "10",
+    "PAGE_SIZE": "100",
+    "DEFAULT_PAGE": "1",
+    "STORAGE_BACKEND": "memory",
+}
+for env_key, env_value in TEST_ENV_DEFAULTS.items():
+    os.environ.setdefault(env_key, env_value)
+
+
+@pytest.fixture(scope="session")
+def event_loop_runner():
+    """Run coroutines on one long-lived event loop shared by the tests."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def memory_backends():
+    """Provide fresh in-memory backend singletons for each test."""
+    from app.dependencies import backends
+
+    backends.reset_backends()
+    yield backends
+    backends.reset_backends()
@@ -0,0 +1,81 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+from app.config.settings import settings
+from app.dependencies.admission import ingest_admission_controller
+from app.utils.dtos.webhooks import QueueStatsDTO
+from app.utils.security.hmac_services import HMACServices
+
+
+@pytest.fixture
+def ingest_client(memory_backends, monkeypatch):
+    from app.main import app
+
+    monkeypatch.setattr(settings, "INGEST_DAILY_QUOTA", 100)
+    monkeypatch.setattr(settings, "INGEST_SHED_QUEUE_DEPTH", 10)
+    monkeypatch.setattr(settings, "INGEST_SHED_RETRY_AFTER_SECONDS", 5)
+    monkeypatch.setattr(ingest_admission_controller, "sampled_at", None)
+    return TestClient(app)
+
+
+def overload_queue() -> None:
+    ingest_admission_controller.update(
+        queue_stats=QueueStatsDTO(
+            queue_depth=100,
+            oldest_queue_item=str(ObjectId()),
+            retry_depth=0,
+            oldest_retry_score=None,
+        ),
+        now=datetime.now(tz=timezone.utc).timestamp(),
+    )
+
+
+def ingest(client: TestClient, payload: dict, idempotency_key: str):
+    body = json.dumps(payload).encode()
+    timestamp = datetime.now(tz=timezone.utc).isoformat()
+    return client.post(
+        "/api/v1/webhooks/ingest",
+        content=body,
+        headers={
+            "Content-Type": "application/json",
+            "Idempotency-Key": idempotency_key,
+            "X-Timestamp": timestamp,
+            "X-Signature": HMACServices().generate_hmac_signature(
+                signature_payload=body, x_timestamp=timestamp
+            ),
+        },
+    )
+
+
+def get_quota_used(memory_backends) -> int:
+    quota_counters = memory_backends.get_token_bucket_store().quota_counters
+    return sum(used for used, _ in quota_counters.values())
+
+
+def test_shed_request_does_not_consume_the_producer_quota(
+    ingest_client, memory_backends
+):
+    assert ingest(ingest_client, {"event_type": "a"}, "admitted").status_code == 201
+    assert get_quota_used(memory_backends) == 1
+
+    overload_queue()
+    response = ingest(ingest_client, {"event_type": "a"}, "shed")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "5"
+    assert get_quota_used(memory_backends) == 1
+
+
+def test_exempt_event_types_are_admitted_while_overloaded(
+    ingest_client, memory_backends, monkeypatch
+):
+    monkeypatch.setattr(settings, "INGEST_SHED_EXEMPT_EVENT_TYPES", ["payment"])
+    overload_queue()
+
+    assert ingest(ingest_client, {"event_type": "payment"}, "exempt").status_code == 201
+    assert ingest(ingest_client, {"event_type": "order"}, "shed").status_code == 503
+    assert len(memory_backends.get_event_store().documents) == 1
@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+
+from app.schemas.webhooks import WebhookReplayRequestSchema
+from app.utils.enums.webhooks import ReplayJobStatusEnum, WebhookStatusEnum
+
+
+def add_event(event_store, status: WebhookStatusEnum, **fields) -> ObjectId:
+    event_id = ObjectId()
+    event_store.documents[event_id] = {
+        "_id": event_id,
+        "idempotency_key": str(event_id),
+        "data": {"event_type": "order_created"},
+        "event_type": "order_created",
+        "attempt_count": 5,
+        "status": status,
+        "received_at": datetime.now(tz=timezone.utc),
+        "last_status_code": 503,
+        **fields,
+    }
+    return event_id
+
+
+def run_replay(event_loop_runner, dead_letter_service) -> dict:
+    job, filter_dict = event_loop_runner(
+        dead_letter_service.create_replay_job(
+            replay_request=WebhookReplayRequestSchema(max_events_per_second=1000)
+        )
+    )
+    event_loop_runner(
+        dead_letter_service.run_replay_job(job=job, filter_dict=filter_dict)
+    )
+    return event_loop_runner(dead_letter_service.replay_job_store.get_job(job["_id"]))
+
+
+def test_replay_resets_and_queues_dead_letters(event_loop_runner, memory_backends):
+    event_store = memory_backends.get_event_store()
+    failed_ids = [
+        add_event(event_store, WebhookStatusEnum.FAILED_PERMANENTLY) for _ in range(3)
+    ]
+    add_event(event_store, WebhookStatusEnum.DELIVERED)
+
+    job = run_replay(event_loop_runner, memory_backends.get_dead_letter_service())
+
+    assert job["status"] == ReplayJobStatusEnum.COMPLETED
+    assert job["replayed_count"] == 3
+    assert sorted(memory_backends.get_webhook_queue().queue) == sorted(
+        str(event_id) for event_id in failed_ids
+    )
+    for event_id in failed_ids:
+        assert event_store.documents[event_id]["status"] == WebhookStatusEnum.RECEIVED
+        assert event_store.documents[event_id]["attempt_count"] == 0
+
+
+def test_replay_skips_events_that_left_the_dead_letters(
+    event_loop_runner, monkeypatch, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    failed_id = add_event(event_store, WebhookStatusEnum.FAILED_PERMANENTLY)
+    # Delivered by another replay between the id query and the reset
+    delivered_id = add_event(event_store, WebhookStatusEnum.DELIVERED)
+    find_event_ids = event_store.find_event_ids
+
+    async def find_stale_event_ids(filter_dict, after_id, limit):
+        event_ids = await find_event_ids(
+            filter_dict=filter_dict, after_id=after_id, limit=limit
+        )
+        return sorted({*event_ids, delivered_id}) if after_id is None else event_ids
+
+    monkeypatch.setattr(event_store, "find_event_ids", find_stale_event_ids)
+
+    job = run_replay(event_loop_runner, memory_backends.get_dead_letter_service())
+
+    assert job["replayed_count"] == 1
+    assert list(memory_backends.get_webhook_queue().queue) == [str(failed_id)]
+    assert event_store.documents[delivered_id]["status"] == WebhookStatusEnum.DELIVERED
+
+
+def test_replayed_keyed_event_waits_in_its_lane(event_loop_runner, memory_backends):
+    event_store = memory_backends.get_event_store()
+    webhook_queue = memory_backends.get_webhook_queue()
+    in_flight_id = str(ObjectId())
+    event_loop_runner(
+        webhook_queue.enqueue_ordered(ordering_key="order-1", event_id=in_flight_id)
+    )
+    webhook_queue.queue.clear()
+    failed_id = add_event(
+        event_store, WebhookStatusEnum.FAILED_PERMANENTLY, ordering_key="order-1"
+    )
+
+    run_replay(event_loop_runner, memory_backends.get_dead_letter_service())
+
+    assert str(failed_id) not in webhook_queue.queue
+    assert list(webhook_queue.ordering_lanes["order-1"]) == [
+        in_flight_id,
+        str(failed_id),
+    ]
+
+
+def test_stale_running_job_resumes_from_its_cursor(event_loop_runner, memory_backends):
+    event_store = memory_backends.get_event_store()
+    dead_letter_service = memory_backends.get_dead_letter_service()
+    first_id, second_id = sorted(
+        add_event(event_store, WebhookStatusEnum.FAILED_PERMANENTLY) for _ in range(2)
+    )
+    job, _ = event_loop_runner(
+        dead_letter_service.create_replay_job(
+            replay_request=WebhookReplayRequestSchema(max_events_per_second=1000)
+        )
+    )
+    # A process replayed the first event, recorded its cursor and died
+    stale_at = datetime.now(tz=timezone.utc) - timedelta(minutes=5)
+    event_loop_runner(
+        dead_letter_service.replay_job_store.update_job(
+            job_id=job["_id"],
+            fields={
+                "after_id": first_id,
+                "replayed_count": 1,
+                "batch_count": 1,
+                "updated_at": stale_at,
+            },
+        )
+    )
+
+    stale_jobs = event_loop_runner(dead_letter_service.claim_stale_replay_jobs())
+    assert [stale_job["_id"] for stale_job, _ in stale_jobs] == [job["_id"]]
+    assert event_loop_runner(dead_letter_service.claim_stale_replay_jobs()) == []
+    stale_job, filter_dict = stale_jobs[0]
+    event_loop_runner(
+        dead_letter_service.run_replay_job(job=stale_job, filter_dict=filter_dict)
+    )
+
+    job = event_loop_runner(dead_letter_service.replay_job_store.get_job(job["_id"]))
+    assert job["status"] == ReplayJobStatusEnum.COMPLETED
+    assert job["replayed_count"] == 2
+    assert job["after_id"] == second_id
+    assert list(memory_backends.get_webhook_queue().queue) == [str(second_id)]
+    assert (
+        event_store.documents[first_id]["status"]
+        == WebhookStatusEnum.FAILED_PERMANENTLY
+    )
+
+
+def test_running_job_with_recent_progress_is_not_taken_over(
+    event_loop_runner, memory_backends
+):
+    dead_letter_service = memory_backends.get_dead_letter_service()
+    event_loop_runner(
+        dead_letter_service.create_replay_job(
+            replay_request=WebhookReplayRequestSchema(max_events_per_second=1000)
+        )
+    )
+
+    assert event_loop_runner(dead_letter_service.claim_stale_replay_jobs()) == []
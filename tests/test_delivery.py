@@ -0,0 +1,268 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from bson import ObjectId
+
+from app.services.worker_runtime import DeliveryConcurrencyLimiter
+from app.utils.backoff import parse_retry_after
+from app.utils.dtos.webhooks import BatchDeliveryPolicyDTO
+from app.utils.enums.webhooks import WebhookStatusEnum
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def delivery_module(memory_backends):
+    """Import the delivery task module; it resolves the in-memory backends at call time."""
+    from app.tasks import webhook_delivery
+
+    return webhook_delivery
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, None),
+        ("", None),
+        ("soon", None),
+        ("5", 5.0),
+        ("31536000", 300.0),
+        ("99999999999999", 300.0),
+        pytest.param("9" * 400, None, id="overflowing-digits"),
+        ("Thu, 01 Jan 2026 00:00:30 GMT", 30.0),
+        ("Wed, 31 Dec 2025 23:00:00 GMT", 0.0),
+        ("Fri, 31 Dec 9999 23:59:59 GMT", 300.0),
+    ],
+)
+def test_parse_retry_after_bounds(value, expected):
+    assert parse_retry_after(value=value, now=NOW, max_delay=300.0) == expected
+
+
+def test_long_retry_after_is_capped_when_finalizing(
+    event_loop_runner, memory_backends, delivery_module
+):
+    event_store = memory_backends.get_event_store()
+    now = datetime.now(tz=timezone.utc)
+    event = {
+        "_id": ObjectId(),
+        "idempotency_key": "retry-after",
+        "data": {"event_type": "order_created"},
+        "attempt_count": 0,
+        "status": WebhookStatusEnum.RECEIVED,
+        "received_at": now,
+    }
+    event_store.documents[event["_id"]] = dict(event)
+    max_delay = delivery_module.get_retry_policy(
+        destination=delivery_module.get_destination_label(
+            delivery_module.DOWNSTREAM_URL
+        )
+    ).max_delay
+
+    event_loop_runner(
+        delivery_module.finalize_webhook_event_delivery(
+            event=event,
+            status_code=503,
+            retry_after="99999999999999",
+            stage_timestamps={},
+            now=now,
+        )
+    )
+
+    document = event_store.documents[event["_id"]]
+    assert document["status"] == WebhookStatusEnum.FAILED_TEMPORARILY
+    assert document["next_retry_at"] == now + timedelta(seconds=max_delay)
+
+
+def test_batch_item_results_parse_items_defensively(delivery_module):
+    response = httpx.Response(
+        status_code=200,
+        json={
+            "results": [
+                {"id": "ok", "status_code": 201},
+                {"id": "text", "status_code": "ok"},
+                {"id": "object", "status_code": {}},
+                {"id": "range", "status_code": 42},
+                {"id": "numeric-string", "status_code": "429", "retry_after": "7"},
+                {"id": "fractional", "status_code": 503, "retry_after": 3.5},
+                "not-an-item",
+            ]
+        },
+    )
+    event_ids = [
+        "ok",
+        "text",
+        "object",
+        "range",
+        "numeric-string",
+        "fractional",
+        "missing",
+    ]
+
+    item_results = delivery_module.get_batch_item_results(
+        response=response, status_code=200, event_ids=event_ids
+    )
+
+    assert item_results == {
+        "ok": (201, None),
+        "text": (502, None),
+        "object": (502, None),
+        "range": (502, None),
+        "numeric-string": (429, "7"),
+        "fractional": (503, "4"),
+        "missing": (502, None),
+    }
+
+
+def test_batch_item_results_apply_a_failed_request_to_every_item(delivery_module):
+    response = httpx.Response(status_code=503, headers={"Retry-After": "10"})
+
+    item_results = delivery_module.get_batch_item_results(
+        response=response, status_code=503, event_ids=["a", "b"]
+    )
+
+    assert item_results == {"a": (503, "10"), "b": (503, "10")}
+
+
+def test_lingering_batch_is_handed_off_while_slots_stay_busy(
+    event_loop_runner, monkeypatch, delivery_module
+):
+    max_linger_seconds = 0.2
+    monkeypatch.setattr(
+        delivery_module, "BATCH_DELIVERY_MAX_LINGER_SECONDS", max_linger_seconds
+    )
+    batches = []
+
+    async def linger_until_handed_off() -> float:
+        handed_off = asyncio.Event()
+
+        def on_batch(events, item_bodies, stage_timestamps_list):
+            batches.append(events)
+            handed_off.set()
+
+        batcher = delivery_module.DeliveryBatcher(
+            policy=BatchDeliveryPolicyDTO(
+                max_events=10, max_bytes=1024, linger_seconds=0.01
+            ),
+            on_batch=on_batch,
+            # No slot ever becomes free
+            semaphore=DeliveryConcurrencyLimiter(limit=0),
+        )
+        started_at = time.monotonic()
+        batcher.add(
+            event={"_id": ObjectId(), "idempotency_key": "linger", "data": {}},
+            stage_timestamps={},
+        )
+        await asyncio.wait_for(handed_off.wait(), timeout=5)
+        return time.monotonic() - started_at
+
+    lingered_seconds = event_loop_runner(linger_until_handed_off())
+
+    assert len(batches) == 1
+    assert lingered_seconds >= max_linger_seconds
+
+
+def add_pending_event(event_store, **fields) -> dict:
+    now = datetime.now(tz=timezone.utc)
+    event = {
+        "_id": ObjectId(),
+        "idempotency_key": str(ObjectId()),
+        "data": {"event_type": "order_created"},
+        "attempt_count": 0,
+        "status": WebhookStatusEnum.RECEIVED,
+        "received_at": now,
+        "next_retry_at": now,
+        **fields,
+    }
+    event_store.documents[event["_id"]] = dict(event)
+    return event
+
+
+def test_expired_events_leave_their_lane_without_an_attempt(
+    event_loop_runner, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    webhook_queue = memory_backends.get_webhook_queue()
+    now = datetime.now(tz=timezone.utc)
+    expired = add_pending_event(
+        event_store, ordering_key="order-1", expires_at=now - timedelta(seconds=1)
+    )
+    waiting = add_pending_event(event_store, ordering_key="order-1")
+    for event in [expired, waiting]:
+        event_loop_runner(
+            webhook_queue.enqueue_ordered(
+                ordering_key="order-1", event_id=str(event["_id"])
+            )
+        )
+    service = memory_backends.get_webhook_event_service()
+
+    assert (
+        event_loop_runner(
+            service.claim_webhook_event(current_time=now, event_id=expired["_id"])
+        )
+        is None
+    )
+    assert event_loop_runner(service.expire_webhook_events(current_time=now, limit=10))
+
+    assert event_store.documents[expired["_id"]]["status"] == WebhookStatusEnum.EXPIRED
+    assert event_store.documents[expired["_id"]]["finished_at"] == now
+    assert str(waiting["_id"]) in webhook_queue.queue
+
+
+def test_retry_past_the_expiry_expires_the_event(
+    event_loop_runner, memory_backends, delivery_module
+):
+    event_store = memory_backends.get_event_store()
+    now = datetime.now(tz=timezone.utc)
+    event = add_pending_event(event_store, expires_at=now + timedelta(seconds=5))
+
+    event_loop_runner(
+        delivery_module.finalize_webhook_event_delivery(
+            event=event,
+            status_code=503,
+            retry_after="60",
+            stage_timestamps={},
+            now=now,
+        )
+    )
+
+    document = event_store.documents[event["_id"]]
+    assert document["status"] == WebhookStatusEnum.EXPIRED
+    assert document["next_retry_at"] is None
+
+
+def test_retry_scheduler_survives_queue_errors(
+    event_loop_runner, monkeypatch, memory_backends, delivery_module
+):
+    webhook_queue = memory_backends.get_webhook_queue()
+
+    class FlakyQueue:
+        """Fails the first promotion, then signals the next one."""
+
+        def __init__(self):
+            self.calls = 0
+            self.recovered = asyncio.Event()
+
+        async def promote_due_retries(self, now: float, limit: int):
+            self.calls += 1
+            if self.calls == 1:
+                raise ConnectionError("queue unavailable")
+            self.recovered.set()
+            return await webhook_queue.promote_due_retries(now=now, limit=limit)
+
+    flaky_queue = FlakyQueue()
+    monkeypatch.setattr(delivery_module, "get_webhook_queue", lambda: flaky_queue)
+
+    async def run_scheduler() -> None:
+        scheduler_task = asyncio.create_task(delivery_module.webhook_retry_scheduler())
+        try:
+            await asyncio.wait_for(flaky_queue.recovered.wait(), timeout=5)
+            assert not scheduler_task.done()
+        finally:
+            scheduler_task.cancel()
+            await asyncio.gather(scheduler_task, return_exceptions=True)
+
+    event_loop_runner(run_scheduler())
+    assert flaky_queue.calls >= 2
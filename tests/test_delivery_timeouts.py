@@ -0,0 +1,56 @@
+import pytest
+
+from app.config.settings import settings
+from app.services.delivery_timeouts import DeliveryTimeoutTracker
+from app.utils.constants.webhooks import (
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+    DELIVERY_TIMEOUT,
+    TASK_LOCKED_SECONDS,
+)
+
+
+@pytest.fixture
+def adaptive_timeouts(monkeypatch):
+    monkeypatch.setattr(settings, "ADAPTIVE_DELIVERY_TIMEOUT", True)
+    monkeypatch.setattr(settings, "DELIVERY_TIMEOUT_PERCENTILE", 99)
+    monkeypatch.setattr(settings, "DELIVERY_TIMEOUT_FACTOR", 3)
+    monkeypatch.setattr(settings, "DELIVERY_TIMEOUT_MIN_SECONDS", 0.5)
+    monkeypatch.setattr(settings, "DELIVERY_TIMEOUT_MAX_SECONDS", 20)
+
+
+def build_tracker(seconds: float, samples: int) -> DeliveryTimeoutTracker:
+    tracker = DeliveryTimeoutTracker()
+    for _ in range(samples):
+        tracker.record(destination="receiver", seconds=seconds)
+    return tracker
+
+
+def test_default_timeout_until_enough_samples(adaptive_timeouts):
+    tracker = build_tracker(seconds=1, samples=ADAPTIVE_TIMEOUT_MIN_SAMPLES - 1)
+
+    assert tracker.get_timeout(destination="receiver") == (DELIVERY_TIMEOUT, False)
+
+
+def test_timeout_follows_the_latency_percentile(adaptive_timeouts):
+    timeout = build_tracker(seconds=1, samples=100).get_timeout(destination="receiver")
+
+    assert timeout.adaptive
+    # Histogram buckets resolve latencies to within 20%
+    assert 3 * 0.8 <= timeout.seconds <= 3 * 1.2
+
+
+@pytest.mark.parametrize(
+    "latency_seconds,max_seconds,expected",
+    [
+        (0.01, 20, 0.5),
+        (10, 20, 20),
+        (20, 120, TASK_LOCKED_SECONDS - 5),
+    ],
+)
+def test_timeout_is_clamped_below_the_claim_lock(
+    adaptive_timeouts, monkeypatch, latency_seconds, max_seconds, expected
+):
+    monkeypatch.setattr(settings, "DELIVERY_TIMEOUT_MAX_SECONDS", max_seconds)
+    tracker = build_tracker(seconds=latency_seconds, samples=100)
+
+    assert tracker.get_timeout(destination="receiver").seconds == expected
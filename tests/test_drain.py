@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+
+from app.utils.enums.webhooks import WebhookStatusEnum
+
+
+def add_claimed_event(event_store, status: WebhookStatusEnum) -> dict:
+    now = datetime.now(tz=timezone.utc)
+    document = {
+        "_id": ObjectId(),
+        "idempotency_key": str(ObjectId()),
+        "data": {"event_type": "order_created"},
+        "attempt_count": 0,
+        "status": status,
+        "received_at": now,
+        "next_retry_at": now,
+        "locked_until": now + timedelta(minutes=1),
+    }
+    event_store.documents[document["_id"]] = document
+    return document
+
+
+def test_release_claimed_events_unlocks_and_requeues_them_first(
+    event_loop_runner, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    webhook_queue = memory_backends.get_webhook_queue()
+    document = add_claimed_event(event_store, WebhookStatusEnum.RECEIVED)
+    event_loop_runner(webhook_queue.enqueue(event_ids=["queued"]))
+
+    released_count = event_loop_runner(
+        memory_backends.get_webhook_event_service().release_claimed_webhook_events(
+            event_ids=[document["_id"]]
+        )
+    )
+
+    assert released_count == 1
+    assert document["locked_until"] is None
+    assert event_loop_runner(webhook_queue.dequeue(timeout=1)) == str(document["_id"])
+
+
+def test_released_events_can_be_claimed_again_right_away(
+    event_loop_runner, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    pending = add_claimed_event(event_store, WebhookStatusEnum.FAILED_TEMPORARILY)
+    delivered = add_claimed_event(event_store, WebhookStatusEnum.DELIVERED)
+    service = memory_backends.get_webhook_event_service()
+
+    released_count = event_loop_runner(
+        service.release_claimed_webhook_events(
+            event_ids=[pending["_id"], delivered["_id"]]
+        )
+    )
+    now = datetime.now(tz=timezone.utc)
+
+    # Finished events keep their state, their requeued ids are dropped by the claim
+    assert released_count == 1
+    assert event_loop_runner(
+        service.claim_webhook_event(current_time=now, event_id=pending["_id"])
+    )
+    assert (
+        event_loop_runner(
+            service.claim_webhook_event(current_time=now, event_id=delivered["_id"])
+        )
+        is None
+    )
@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+
+from app.schemas.webhooks import WebhookIngestSchema
+from app.utils.enums.webhooks import WebhookStatusEnum
+
+
+def ingest_event(event_loop_runner, service, idempotency_key: str = "status") -> dict:
+    return event_loop_runner(
+        service.insert_webhook_event(
+            WebhookIngestSchema(
+                data={"event_type": "order_created"},
+                idempotency_key=idempotency_key,
+                event_type="order_created",
+            )
+        )
+    )
+
+
+def fail_store_reads(event_store, monkeypatch) -> None:
+    async def unavailable(*args, **kwargs):
+        raise AssertionError("status lookup reached the event store")
+
+    monkeypatch.setattr(event_store, "get_event_by_id", unavailable)
+    monkeypatch.setattr(event_store, "get_event_by_idempotency_key", unavailable)
+
+
+def test_ingested_event_status_is_served_from_the_cache(
+    event_loop_runner, memory_backends, monkeypatch
+):
+    service = memory_backends.get_webhook_event_service()
+    document = ingest_event(event_loop_runner, service)
+    fail_store_reads(memory_backends.get_event_store(), monkeypatch)
+
+    by_id = event_loop_runner(service.get_webhook_event_status(document["_id"]))
+    by_key = event_loop_runner(
+        service.get_webhook_event_status_by_idempotency_key("status")
+    )
+
+    assert by_id == by_key
+    assert by_id["_id"] == str(document["_id"])
+    assert by_id["status"] == WebhookStatusEnum.RECEIVED
+
+
+def test_status_change_refreshes_the_cached_view(event_loop_runner, memory_backends):
+    service = memory_backends.get_webhook_event_service()
+    document = ingest_event(event_loop_runner, service)
+
+    event_loop_runner(
+        service.mark_webhook_event_delivery_status(
+            event=document,
+            log_entry={
+                "timestamp": datetime.now(tz=timezone.utc),
+                "attempt_number": 1,
+                "status_code": 200,
+                "success": True,
+            },
+            status=WebhookStatusEnum.DELIVERED,
+            next_retry_at=None,
+            attempt_count=1,
+        )
+    )
+    cached = event_loop_runner(
+        memory_backends.get_event_status_cache().get_status(str(document["_id"]))
+    )
+
+    assert cached["status"] == WebhookStatusEnum.DELIVERED
+    assert cached["last_status_code"] == 200
+    assert cached["finished_at"] is not None
+
+
+def test_status_lookup_falls_back_to_the_store(
+    event_loop_runner, memory_backends, monkeypatch
+):
+    service = memory_backends.get_webhook_event_service()
+    document = ingest_event(event_loop_runner, service)
+    status_cache = memory_backends.get_event_status_cache()
+    event_loop_runner(status_cache.delete_statuses([str(document["_id"])]))
+
+    # A miss is answered from the store and cached again
+    assert event_loop_runner(service.get_webhook_event_status(document["_id"]))
+    assert event_loop_runner(status_cache.get_status(str(document["_id"])))
+
+    async def unavailable(*args, **kwargs):
+        raise ConnectionError("cache unavailable")
+
+    monkeypatch.setattr(status_cache, "get_status", unavailable)
+    monkeypatch.setattr(status_cache, "set_status", unavailable)
+    status = event_loop_runner(service.get_webhook_event_status(document["_id"]))
+
+    assert status["_id"] == str(document["_id"])
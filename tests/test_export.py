@@ -0,0 +1,64 @@
+import gzip
+import json
+
+from bson import ObjectId
+
+from app.dependencies.filtering import WebhookEventFilter
+from app.services import webhooks as webhook_services
+from app.utils.enums.webhooks import WebhookStatusEnum
+
+
+def add_events(event_store, status: WebhookStatusEnum, count: int) -> None:
+    for order_id in range(count):
+        event_id = ObjectId()
+        event_store.documents[event_id] = {
+            "_id": event_id,
+            "idempotency_key": str(event_id),
+            "data": {"order_id": order_id},
+            "status": status,
+        }
+
+
+def collect_export(event_loop_runner, service, **kwargs) -> list:
+    async def collect():
+        return [
+            chunk async for chunk in service.export_filtered_webhook_events(**kwargs)
+        ]
+
+    return event_loop_runner(collect())
+
+
+def test_export_streams_matching_events_as_ndjson(event_loop_runner, memory_backends):
+    event_store = memory_backends.get_event_store()
+    add_events(event_store, WebhookStatusEnum.DELIVERED, count=3)
+    add_events(event_store, WebhookStatusEnum.FAILED_PERMANENTLY, count=2)
+
+    chunks = collect_export(
+        event_loop_runner,
+        memory_backends.get_webhook_event_service(),
+        filter_params=WebhookEventFilter(
+            status=WebhookStatusEnum.DELIVERED,
+            timestamp_from=None,
+            timestamp_to=None,
+            event_type=None,
+        ),
+    )
+
+    lines = b"".join(chunks).decode().splitlines()
+    assert len(lines) == 3
+    assert {json.loads(line)["status"] for line in lines} == {"delivered"}
+
+
+def test_export_splits_chunks_and_compresses_incrementally(
+    event_loop_runner, memory_backends, monkeypatch
+):
+    add_events(memory_backends.get_event_store(), WebhookStatusEnum.DELIVERED, 50)
+    monkeypatch.setattr(webhook_services, "EXPORT_CHUNK_BYTES", 256)
+    service = memory_backends.get_webhook_event_service()
+
+    plain_chunks = collect_export(event_loop_runner, service)
+    gzip_chunks = collect_export(event_loop_runner, service, compress=True)
+
+    assert len(plain_chunks) > 1
+    assert len(gzip_chunks) > 1
+    assert gzip.decompress(b"".join(gzip_chunks)) == b"".join(plain_chunks)
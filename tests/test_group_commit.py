@@ -0,0 +1,108 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.services.group_commit import IngestGroupCommitter
+from app.utils.enums.webhooks import WebhookStatusEnum
+from app.utils.exceptions.webhooks import DuplicateWebhookEventException
+
+
+def build_document(idempotency_key: str, ordering_key: Optional[str] = None) -> dict:
+    return {
+        "idempotency_key": idempotency_key,
+        "data": {"event_type": "order_created"},
+        "event_type": "order_created",
+        "ordering_key": ordering_key,
+        "attempt_count": 0,
+        "status": WebhookStatusEnum.RECEIVED,
+        "received_at": datetime.now(tz=timezone.utc),
+    }
+
+
+def build_committer(memory_backends, max_events: int = 10) -> IngestGroupCommitter:
+    return IngestGroupCommitter(
+        event_store=memory_backends.get_event_store(),
+        webhook_queue=memory_backends.get_webhook_queue(),
+        window_seconds=0.01,
+        max_events=max_events,
+    )
+
+
+def commit_concurrently(event_loop_runner, committer, documents: list) -> list:
+    async def commit_group() -> list:
+        return await asyncio.gather(
+            *(committer.commit(document=document) for document in documents),
+            return_exceptions=True,
+        )
+
+    return event_loop_runner(commit_group())
+
+
+def test_group_commit_reports_duplicates_per_request(
+    event_loop_runner, memory_backends
+):
+    results = commit_concurrently(
+        event_loop_runner,
+        build_committer(memory_backends),
+        [
+            build_document(idempotency_key="same"),
+            build_document(idempotency_key="same"),
+        ],
+    )
+
+    assert sum(isinstance(result, dict) for result in results) == 1
+    assert (
+        sum(isinstance(result, DuplicateWebhookEventException) for result in results)
+        == 1
+    )
+    assert len(memory_backends.get_webhook_queue().queue) == 1
+
+
+def test_group_commit_writes_full_groups_in_one_insert(
+    event_loop_runner, memory_backends, monkeypatch
+):
+    event_store = memory_backends.get_event_store()
+    group_sizes = []
+    insert_events = event_store.insert_events
+
+    async def counting_insert_events(documents):
+        group_sizes.append(len(documents))
+        return await insert_events(documents=documents)
+
+    monkeypatch.setattr(event_store, "insert_events", counting_insert_events)
+
+    results = commit_concurrently(
+        event_loop_runner,
+        build_committer(memory_backends, max_events=4),
+        [build_document(idempotency_key=f"key-{index}") for index in range(10)],
+    )
+
+    assert all(isinstance(result, dict) for result in results)
+    assert group_sizes == [4, 4, 2]
+    # Events keep their arrival order in the queue, which pops from the right
+    assert list(reversed(memory_backends.get_webhook_queue().queue)) == [
+        str(result["_id"]) for result in results
+    ]
+
+
+def test_group_commit_holds_keyed_events_in_their_lane(
+    event_loop_runner, memory_backends
+):
+    results = commit_concurrently(
+        event_loop_runner,
+        build_committer(memory_backends),
+        [
+            build_document(idempotency_key="first", ordering_key="order-1"),
+            build_document(idempotency_key="second", ordering_key="order-1"),
+            build_document(idempotency_key="unkeyed"),
+        ],
+    )
+
+    webhook_queue = memory_backends.get_webhook_queue()
+    assert sorted(webhook_queue.queue) == sorted(
+        [str(results[0]["_id"]), str(results[2]["_id"])]
+    )
+    assert list(webhook_queue.ordering_lanes["order-1"]) == [
+        str(results[0]["_id"]),
+        str(results[1]["_id"]),
+    ]
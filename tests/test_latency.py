@@ -0,0 +1,150 @@
+import time
+from datetime import datetime, timezone
+
+import httpx
+from bson import ObjectId
+
+from app.schemas.webhooks import WebhookIngestSchema
+from app.services.group_commit import IngestGroupCommitter
+from app.services.latency import StageLatencyRecorder
+from app.utils.enums.webhooks import DeliveryStageEnum, WebhookStatusEnum
+
+ATTEMPT_STAGES = {
+    "dequeued",
+    "claimed",
+    "request_sent",
+    "response_received",
+    "finalized",
+}
+
+
+def build_mock_client(status_code: int) -> httpx.AsyncClient:
+    """Build an HTTP client whose transport answers every request in-process."""
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(status_code=status_code)
+        )
+    )
+
+
+def build_ingest_schema(idempotency_key: str) -> WebhookIngestSchema:
+    return WebhookIngestSchema(
+        data={"event_type": "order_created", "order_id": 1},
+        idempotency_key=idempotency_key,
+        event_type="order_created",
+    )
+
+
+def test_ingest_records_received_and_enqueued_on_the_event(
+    event_loop_runner, memory_backends
+):
+    webhook_event_service = memory_backends.get_webhook_event_service()
+
+    document = event_loop_runner(
+        webhook_event_service.insert_webhook_event(
+            webhook_ingest_schema=build_ingest_schema(idempotency_key="single")
+        )
+    )
+
+    stage_timestamps = memory_backends.get_event_store().documents[document["_id"]][
+        "stage_timestamps"
+    ]
+    assert stage_timestamps["received"] <= stage_timestamps["enqueued"]
+
+
+def test_group_commit_records_enqueued_on_every_event(
+    event_loop_runner, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    committer = IngestGroupCommitter(
+        event_store=event_store,
+        webhook_queue=memory_backends.get_webhook_queue(),
+        window_seconds=0.001,
+        max_events=10,
+    )
+    document = build_ingest_schema(idempotency_key="grouped").model_dump()
+
+    document = event_loop_runner(committer.commit(document=document))
+
+    assert "enqueued" in event_store.documents[document["_id"]]["stage_timestamps"]
+
+
+def test_delivery_log_records_the_stage_timestamps_of_the_attempt(
+    event_loop_runner, monkeypatch, memory_backends
+):
+    from app.tasks import webhook_delivery
+
+    monkeypatch.setattr(
+        webhook_delivery, "_http_client", build_mock_client(status_code=200)
+    )
+    event_store = memory_backends.get_event_store()
+    event = {
+        "_id": ObjectId(),
+        "idempotency_key": "logged",
+        "data": {"event_type": "order_created"},
+        "attempt_count": 0,
+        "status": WebhookStatusEnum.RECEIVED,
+        "stage_timestamps": {"received": time.time()},
+    }
+    event_store.documents[event["_id"]] = dict(event)
+    now = time.time()
+
+    event_loop_runner(
+        webhook_delivery.process_webhook_event_delivery(
+            event, stage_timestamps={"dequeued": now, "claimed": now}
+        )
+    )
+
+    (log_entry,) = event_store.documents[event["_id"]]["delivery_logs"]
+    assert set(log_entry["stage_timestamps"]) == ATTEMPT_STAGES
+    assert (
+        log_entry["stage_timestamps"]["request_sent"]
+        <= log_entry["stage_timestamps"]["response_received"]
+        <= log_entry["stage_timestamps"]["finalized"]
+    )
+
+
+def test_replayed_event_latency_is_measured_from_the_replay(
+    event_loop_runner, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    document = {
+        "_id": ObjectId(),
+        "idempotency_key": "replay",
+        "data": {"event_type": "order_created"},
+        "event_type": "order_created",
+        "attempt_count": 5,
+        "status": WebhookStatusEnum.FAILED_PERMANENTLY,
+        "stage_timestamps": {"received": time.time() - 3600},
+    }
+    event_store.documents[document["_id"]] = document
+
+    event_loop_runner(
+        event_store.reset_events_for_redelivery(
+            event_ids=[document["_id"]], current_time=datetime.now(tz=timezone.utc)
+        )
+    )
+    now = time.time()
+    recorder = StageLatencyRecorder()
+    recorder.record_delivery_attempt(
+        event=document,
+        stage_timestamps={stage: now for stage in ATTEMPT_STAGES},
+        final_status=WebhookStatusEnum.DELIVERED,
+        retry_delay=None,
+        finalize_seconds=0.0,
+    )
+
+    rollups = {rollup.stage: rollup for rollup in recorder.drain()}
+    assert rollups[DeliveryStageEnum.QUEUE_WAIT.value].total_seconds < 60
+    assert rollups[DeliveryStageEnum.END_TO_END.value].total_seconds < 60
+
+
+def test_negative_cross_process_durations_are_recorded_as_zero():
+    recorder = StageLatencyRecorder()
+
+    recorder.record(
+        DeliveryStageEnum.QUEUE_WAIT, event_type=None, seconds=-0.5, at=time.time()
+    )
+
+    (rollup,) = recorder.drain()
+    assert rollup.total_seconds == 0.0
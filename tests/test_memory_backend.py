@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from bson import ObjectId
+
+from app.utils.enums.webhooks import WebhookStatusEnum
+from app.utils.exceptions.webhooks import DuplicateWebhookEventException
+
+
+def build_document(idempotency_key: str = "key") -> dict:
+    now = datetime.now(tz=timezone.utc)
+    return {
+        "idempotency_key": idempotency_key,
+        "data": {"event_type": "order_created"},
+        "event_type": "order_created",
+        "attempt_count": 0,
+        "status": WebhookStatusEnum.RECEIVED,
+        "received_at": now,
+        "next_retry_at": now,
+    }
+
+
+def test_insert_rejects_a_duplicate_idempotency_key(event_loop_runner, memory_backends):
+    event_store = memory_backends.get_event_store()
+    event_loop_runner(event_store.insert_event(document=build_document()))
+
+    with pytest.raises(DuplicateWebhookEventException):
+        event_loop_runner(event_store.insert_event(document=build_document()))
+
+
+def test_claim_locks_a_due_event_once(event_loop_runner, memory_backends):
+    event_store = memory_backends.get_event_store()
+    document = event_loop_runner(event_store.insert_event(document=build_document()))
+    now = datetime.now(tz=timezone.utc)
+    locked_until = now + timedelta(seconds=30)
+
+    claimed = event_loop_runner(
+        event_store.claim_event(
+            event_id=document["_id"], current_time=now, locked_until=locked_until
+        )
+    )
+    claimed_again = event_loop_runner(
+        event_store.claim_event(
+            event_id=document["_id"], current_time=now, locked_until=locked_until
+        )
+    )
+
+    assert claimed["locked_until"] == locked_until
+    assert claimed_again is None
+
+
+def test_claim_skips_an_event_not_yet_due(event_loop_runner, memory_backends):
+    event_store = memory_backends.get_event_store()
+    now = datetime.now(tz=timezone.utc)
+    document = build_document()
+    document["next_retry_at"] = now + timedelta(minutes=1)
+    document = event_loop_runner(event_store.insert_event(document=document))
+
+    claimed = event_loop_runner(
+        event_store.claim_event(
+            event_id=document["_id"],
+            current_time=now,
+            locked_until=now + timedelta(seconds=30),
+        )
+    )
+
+    assert claimed is None
+
+
+def test_mark_delivery_status_unlocks_and_appends_the_log(
+    event_loop_runner, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    document = event_loop_runner(event_store.insert_event(document=build_document()))
+
+    event_loop_runner(
+        event_store.mark_delivery_status(
+            event_id=document["_id"],
+            log_entry={"status_code": 200, "attempt_number": 1},
+            status=WebhookStatusEnum.DELIVERED,
+            next_retry_at=None,
+            attempt_count=1,
+        )
+    )
+
+    stored = event_loop_runner(event_store.get_event_by_id(event_id=document["_id"]))
+    assert stored["status"] == WebhookStatusEnum.DELIVERED
+    assert stored["locked_until"] is None
+    assert stored["delivery_logs"] == [{"status_code": 200, "attempt_number": 1}]
+
+
+def test_queue_pops_in_fifo_order(event_loop_runner, memory_backends):
+    webhook_queue = memory_backends.get_webhook_queue()
+    first, second = str(ObjectId()), str(ObjectId())
+    event_loop_runner(webhook_queue.enqueue(event_ids=[first]))
+    event_loop_runner(webhook_queue.enqueue(event_ids=[second]))
+
+    assert event_loop_runner(webhook_queue.dequeue(timeout=1)) == first
+    assert event_loop_runner(webhook_queue.dequeue(timeout=1)) == second
+    assert event_loop_runner(webhook_queue.dequeue(timeout=0.01)) is None
+
+
+def test_claimed_and_logged_documents_do_not_alias_the_stored_one(
+    event_loop_runner, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    document = build_document()
+    document["stage_timestamps"] = {"received": 1.0}
+    document = event_loop_runner(event_store.insert_event(document=document))
+    now = datetime.now(tz=timezone.utc)
+    claimed = event_loop_runner(
+        event_store.claim_event(
+            event_id=document["_id"],
+            current_time=now,
+            locked_until=now + timedelta(seconds=30),
+        )
+    )
+    log_entry = {"status_code": 503, "stage_timestamps": {"claimed": 2.0}}
+    event_loop_runner(
+        event_store.mark_delivery_status(
+            event_id=document["_id"],
+            log_entry=log_entry,
+            status=WebhookStatusEnum.FAILED_TEMPORARILY,
+            next_retry_at=now,
+            attempt_count=1,
+        )
+    )
+
+    claimed["stage_timestamps"]["received"] = 99.0
+    log_entry["stage_timestamps"]["claimed"] = 99.0
+
+    stored = event_store.documents[document["_id"]]
+    assert stored["stage_timestamps"] == {"received": 1.0}
+    assert stored["delivery_logs"][0]["stage_timestamps"] == {"claimed": 2.0}
@@ -0,0 +1,76 @@
+from app.schemas.webhooks import WebhookIngestSchema
+
+
+def test_ordering_lane_queues_next_event_once_head_resolves(
+    event_loop_runner, memory_backends
+):
+    webhook_queue = memory_backends.get_webhook_queue()
+    event_loop_runner(
+        webhook_queue.enqueue_ordered(ordering_key="order-1", event_id="a")
+    )
+    event_loop_runner(
+        webhook_queue.enqueue_ordered(ordering_key="order-1", event_id="b")
+    )
+    event_loop_runner(
+        webhook_queue.enqueue_ordered(ordering_key="order-2", event_id="c")
+    )
+    assert sorted(webhook_queue.queue) == ["a", "c"]
+
+    released = event_loop_runner(
+        webhook_queue.release_ordering_key(ordering_key="order-1", event_id="a")
+    )
+
+    assert released == "b"
+    assert "b" in webhook_queue.queue
+
+
+def test_event_leaving_the_middle_of_a_lane_keeps_the_head(
+    event_loop_runner, memory_backends
+):
+    webhook_queue = memory_backends.get_webhook_queue()
+    for event_id in ["a", "b", "c"]:
+        event_loop_runner(
+            webhook_queue.enqueue_ordered(ordering_key="order-1", event_id=event_id)
+        )
+
+    # "b" expired while waiting behind "a"
+    assert (
+        event_loop_runner(
+            webhook_queue.release_ordering_key(ordering_key="order-1", event_id="b")
+        )
+        is None
+    )
+    released = event_loop_runner(
+        webhook_queue.release_ordering_key(ordering_key="order-1", event_id="a")
+    )
+
+    assert released == "c"
+    assert "c" in webhook_queue.queue
+    event_loop_runner(
+        webhook_queue.release_ordering_key(ordering_key="order-1", event_id="c")
+    )
+    assert "order-1" not in webhook_queue.ordering_lanes
+
+
+def test_ingest_holds_keyed_events_behind_their_lane_head(
+    event_loop_runner, memory_backends
+):
+    service = memory_backends.get_webhook_event_service()
+    documents = [
+        event_loop_runner(
+            service.insert_webhook_event(
+                WebhookIngestSchema(
+                    data={"step": step},
+                    idempotency_key=f"order-1-{step}",
+                    ordering_key="order-1",
+                )
+            )
+        )
+        for step in range(3)
+    ]
+
+    webhook_queue = memory_backends.get_webhook_queue()
+    assert list(webhook_queue.queue) == [str(documents[0]["_id"])]
+    assert list(webhook_queue.ordering_lanes["order-1"]) == [
+        str(document["_id"]) for document in documents
+    ]
@@ -0,0 +1,116 @@
+import asyncio
+
+from app.config.settings import settings
+from app.dependencies.rate_limiter import (
+    ProducerIngestLimiter,
+    TokenBucketRateLimiter,
+)
+
+
+def count_lease_calls(token_store, monkeypatch) -> list:
+    """Record the requested size of every lease the store hands out."""
+    calls = []
+    lease_tokens = token_store.lease_tokens
+
+    async def counting_lease_tokens(**kwargs):
+        calls.append(kwargs["requested"])
+        return await lease_tokens(**kwargs)
+
+    monkeypatch.setattr(token_store, "lease_tokens", counting_lease_tokens)
+    return calls
+
+
+def test_leasing_never_admits_more_than_the_bucket(
+    event_loop_runner, memory_backends, monkeypatch
+):
+    calls = count_lease_calls(memory_backends.get_token_bucket_store(), monkeypatch)
+    # A negligible rate keeps the bucket from refilling during the test
+    limiter = TokenBucketRateLimiter(
+        rate=0.001, capacity=10, name="test-lease", lease_size=5
+    )
+
+    async def send_requests():
+        decisions = []
+        for _ in range(15):
+            decisions.append(await limiter.is_request_allowed(key="producer"))
+            await asyncio.sleep(0)
+        return decisions
+
+    decisions = event_loop_runner(send_requests())
+
+    assert decisions == [True] * 10 + [False] * 5
+    # Two full leases, one empty lease, then denials served from the lease
+    assert len(calls) == 3
+
+
+def test_concurrent_requests_share_one_lease_call(
+    event_loop_runner, memory_backends, monkeypatch
+):
+    calls = count_lease_calls(memory_backends.get_token_bucket_store(), monkeypatch)
+    limiter = TokenBucketRateLimiter(
+        rate=100, capacity=100, name="test-lease", lease_size=20
+    )
+
+    async def send_requests():
+        return await asyncio.gather(
+            *(limiter.is_request_allowed(key="producer") for _ in range(5))
+        )
+
+    assert event_loop_runner(send_requests()) == [True] * 5
+    assert calls == [20]
+
+
+def test_producer_overrides_replace_the_default_limits(monkeypatch):
+    monkeypatch.setattr(settings, "INGEST_RATE_LIMIT", 50)
+    monkeypatch.setattr(settings, "INGEST_BURST_CAPACITY", 0)
+    monkeypatch.setattr(settings, "INGEST_DAILY_QUOTA", 1000)
+    monkeypatch.setattr(
+        settings, "INGEST_PRODUCER_LIMITS", {"bulk": {"rate": 5, "daily_quota": 10}}
+    )
+    limiter = ProducerIngestLimiter(name="test-ingest")
+
+    assert limiter.get_limits(producer_id="bulk") == (5, 5, 10)
+    # Without a burst capacity a producer may burst one second of its rate
+    assert limiter.get_limits(producer_id="other") == (50, 50, 1000)
+
+
+def test_quota_counts_only_admitted_requests(
+    event_loop_runner, memory_backends, monkeypatch
+):
+    monkeypatch.setattr(
+        settings,
+        "INGEST_PRODUCER_LIMITS",
+        {"producer": {"rate": 0.001, "burst": 2, "daily_quota": 3}},
+    )
+    limiter = ProducerIngestLimiter(name="test-ingest")
+
+    async def send_requests():
+        return [await limiter.check_request(producer_id="producer") for _ in range(4)]
+
+    decisions = event_loop_runner(send_requests())
+
+    assert [decision.allowed for decision in decisions] == [True, True, False, False]
+    assert {decision.reason for decision in decisions[2:]} == {"rate"}
+    assert decisions[2].retry_after > 0
+    ((used, _),) = memory_backends.get_token_bucket_store().quota_counters.values()
+    assert used == 2
+
+
+def test_exhausted_quota_denies_until_the_next_day(
+    event_loop_runner, memory_backends, monkeypatch
+):
+    monkeypatch.setattr(
+        settings,
+        "INGEST_PRODUCER_LIMITS",
+        {"producer": {"rate": 0, "daily_quota": 2}},
+    )
+    limiter = ProducerIngestLimiter(name="test-ingest")
+
+    async def send_requests():
+        return [await limiter.check_request(producer_id="producer") for _ in range(3)]
+
+    decisions = event_loop_runner(send_requests())
+
+    assert [decision.allowed for decision in decisions] == [True, True, False]
+    assert decisions[2].reason == "quota"
+    assert 0 < decisions[2].retry_after <= 24 * 60 * 60
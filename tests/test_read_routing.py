@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+from pymongo.read_preferences import Primary, SecondaryPreferred
+
+from app.backends.memory_store import InMemoryWebhookEventStore
+from app.config.database import get_analytics_read_preference
+from app.config.settings import settings
+from app.dependencies.filtering import WebhookDeadLetterFilter
+from app.dependencies.pagination import PaginationParams
+from app.schemas.webhooks import WebhookReplayRequestSchema
+from app.services.dead_letters import DeadLetterService
+from app.utils.enums.core import MongoReadPreferenceEnum
+from app.utils.enums.webhooks import ReplayJobStatusEnum, WebhookStatusEnum
+
+
+@pytest.mark.parametrize(
+    "read_preference,max_staleness,expected",
+    [
+        (MongoReadPreferenceEnum.PRIMARY, 90, Primary()),
+        (MongoReadPreferenceEnum.SECONDARY_PREFERRED, -1, SecondaryPreferred()),
+        (
+            MongoReadPreferenceEnum.SECONDARY_PREFERRED,
+            90,
+            SecondaryPreferred(max_staleness=90),
+        ),
+    ],
+)
+def test_analytics_read_preference(
+    monkeypatch, read_preference, max_staleness, expected
+):
+    monkeypatch.setattr(settings, "ANALYTICS_READ_PREFERENCE", read_preference)
+    monkeypatch.setattr(settings, "ANALYTICS_MAX_STALENESS_SECONDS", max_staleness)
+
+    assert get_analytics_read_preference() == expected
+
+
+def test_dead_letters_are_listed_from_the_secondary_and_replayed_from_the_primary(
+    event_loop_runner, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    # A secondary still lagging behind a dead letter that was already replayed
+    secondary_event_store = InMemoryWebhookEventStore()
+    event_id = ObjectId()
+    secondary_event_store.documents[event_id] = {
+        "_id": event_id,
+        "idempotency_key": str(event_id),
+        "data": {},
+        "status": WebhookStatusEnum.FAILED_PERMANENTLY,
+        "received_at": datetime.now(tz=timezone.utc),
+    }
+    dead_letter_service = DeadLetterService(
+        event_store=event_store,
+        webhook_queue=memory_backends.get_webhook_queue(),
+        replay_job_store=memory_backends.get_replay_job_store(),
+        analytics_event_store=secondary_event_store,
+    )
+    pagination_params = PaginationParams(page=1, page_size=10)
+
+    listed = event_loop_runner(
+        dead_letter_service.get_dead_letter_events(
+            pagination_params=pagination_params,
+            filter_params=WebhookDeadLetterFilter(
+                timestamp_from=None,
+                timestamp_to=None,
+                event_type=None,
+                status_code=None,
+            ),
+        )
+    )
+    job, filter_dict = event_loop_runner(
+        dead_letter_service.create_replay_job(
+            replay_request=WebhookReplayRequestSchema(max_events_per_second=1000)
+        )
+    )
+    event_loop_runner(
+        dead_letter_service.run_replay_job(job=job, filter_dict=filter_dict)
+    )
+    job = event_loop_runner(dead_letter_service.get_replay_job(job["_id"]))
+
+    assert len(listed) == 1
+    assert job["status"] == ReplayJobStatusEnum.COMPLETED
+    assert job["replayed_count"] == 0
+    assert not memory_backends.get_webhook_queue().queue
@@ -0,0 +1,94 @@
+import gzip
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from bson import ObjectId, json_util
+
+from app.schemas.webhooks import WebhookIngestSchema
+from app.services.archival import EventArchivalService
+from app.utils.enums.webhooks import WebhookStatusEnum
+from app.utils.exceptions.webhooks import WebhookEventException
+
+
+def build_ingest_schema(data: dict) -> WebhookIngestSchema:
+    return WebhookIngestSchema(data=data, idempotency_key="retained")
+
+
+def add_finished_event(event_store, finished_days_ago: int, received_days_ago: int):
+    now = datetime.now(tz=timezone.utc)
+    event_id = ObjectId()
+    event_store.documents[event_id] = {
+        "_id": event_id,
+        "idempotency_key": str(event_id),
+        "data": {},
+        "status": WebhookStatusEnum.DELIVERED,
+        "received_at": now - timedelta(days=received_days_ago),
+        "finished_at": now - timedelta(days=finished_days_ago),
+    }
+    event_store.idempotency_index[str(event_id)] = event_id
+    return event_id
+
+
+def test_duplicate_returns_the_stored_event(event_loop_runner, memory_backends):
+    service = memory_backends.get_webhook_event_service()
+    first = event_loop_runner(
+        service.insert_webhook_event(build_ingest_schema(data={"order_id": 1}))
+    )
+    duplicate = event_loop_runner(
+        service.insert_webhook_event(build_ingest_schema(data={"order_id": 1}))
+    )
+
+    assert duplicate["_id"] == first["_id"]
+    with pytest.raises(WebhookEventException) as exc_info:
+        event_loop_runner(
+            service.insert_webhook_event(build_ingest_schema(data={"order_id": 2}))
+        )
+    assert exc_info.value.error == "bad-request"
+
+
+def test_duplicate_of_an_archived_event_is_a_conflict(
+    event_loop_runner, memory_backends
+):
+    service = memory_backends.get_webhook_event_service()
+    event_store = memory_backends.get_event_store()
+    first = event_loop_runner(
+        service.insert_webhook_event(build_ingest_schema(data={"order_id": 1}))
+    )
+    # Archived between the duplicate insert and the read of the original
+    del event_store.documents[first["_id"]]
+
+    with pytest.raises(WebhookEventException) as exc_info:
+        event_loop_runner(
+            service.insert_webhook_event(build_ingest_schema(data={"order_id": 1}))
+        )
+    assert exc_info.value.error == "duplicate-entity"
+
+
+def test_archival_keeps_events_inside_the_idempotency_window(
+    event_loop_runner, memory_backends, tmp_path
+):
+    event_store = memory_backends.get_event_store()
+    expired_id = add_finished_event(
+        event_store, finished_days_ago=10, received_days_ago=10
+    )
+    retained_id = add_finished_event(
+        event_store, finished_days_ago=1, received_days_ago=10
+    )
+    deduplicating_id = add_finished_event(
+        event_store, finished_days_ago=10, received_days_ago=2
+    )
+    archival_service = EventArchivalService(
+        event_store=event_store,
+        retention_days=7,
+        idempotency_window_days=3,
+        archive_dir=str(tmp_path),
+    )
+
+    removed_count = event_loop_runner(archival_service.archive_finished_events())
+
+    assert removed_count == 1
+    assert set(event_store.documents) == {retained_id, deduplicating_id}
+    (archive_path,) = tmp_path.iterdir()
+    with gzip.open(archive_path, mode="rt") as archive_file:
+        archived = [json_util.loads(line) for line in archive_file]
+    assert [document["_id"] for document in archived] == [expired_id]
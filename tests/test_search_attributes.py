@@ -0,0 +1,92 @@
+import pytest
+from bson import ObjectId
+from starlette.requests import Request
+
+from app.config.settings import settings
+from app.dependencies.filtering import WebhookEventFilter, get_attribute_filters
+from app.dependencies.payload import get_event_attrs
+from app.utils.constants.webhooks import EVENT_ATTRIBUTE_MAX_LENGTH
+from app.utils.exceptions.core import UtilsException
+
+
+@pytest.fixture(autouse=True)
+def attribute_paths(monkeypatch):
+    monkeypatch.setattr(
+        settings,
+        "EVENT_TYPE_ATTRIBUTE_PATHS",
+        {
+            "order_created": {
+                "order_id": "order.id",
+                "user_id": "customer.id",
+                "note": "order.note",
+                "paid": "order.paid",
+                "items": "order.items",
+            }
+        },
+    )
+
+
+def build_request(query_string: str) -> Request:
+    return Request(
+        {"type": "http", "method": "GET", "query_string": query_string.encode()}
+    )
+
+
+def test_only_short_scalar_values_are_promoted():
+    attrs = get_event_attrs(
+        event_type="order_created",
+        payload={
+            "order": {
+                "id": 1042,
+                "note": "x" * (EVENT_ATTRIBUTE_MAX_LENGTH + 1),
+                "paid": True,
+                "items": ["a"],
+            },
+            "customer": {"id": "u-7"},
+        },
+    )
+
+    assert attrs == {"order_id": "1042", "user_id": "u-7"}
+    assert get_event_attrs(event_type="other", payload={"order": {"id": 1}}) == {}
+
+
+def test_attribute_query_parameters_build_attrs_filters():
+    filter_params = WebhookEventFilter(
+        status=None,
+        timestamp_from=None,
+        timestamp_to=None,
+        event_type=None,
+        request=build_request("attr.order_id=1&attr.user_id=u-1&attr.user_id=u-2"),
+    )
+
+    assert filter_params._build_filters_dict() == {
+        "attrs.order_id": "1",
+        "attrs.user_id": {"$in": ["u-1", "u-2"]},
+    }
+
+
+def test_unknown_attributes_are_rejected():
+    with pytest.raises(UtilsException) as exc_info:
+        get_attribute_filters(request=build_request("attr.secret=1"))
+
+    assert exc_info.value.error == "bad-request"
+
+
+def test_search_matches_promoted_attributes(event_loop_runner, memory_backends):
+    event_store = memory_backends.get_event_store()
+    for order_id in ["1", "2", "3"]:
+        event_id = ObjectId()
+        event_store.documents[event_id] = {
+            "_id": event_id,
+            "idempotency_key": str(event_id),
+            "data": {"order": {"id": order_id}},
+            "attrs": {"order_id": order_id},
+        }
+
+    events = event_loop_runner(
+        event_store.find_events(
+            filter_dict={"attrs.order_id": {"$in": ["1", "3"]}}, offset=0, limit=None
+        )
+    )
+
+    assert sorted(event["attrs"]["order_id"] for event in events) == ["1", "3"]
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from bson import ObjectId
+
+from app.services.webhooks import get_filter_hash
+from app.utils.enums.webhooks import SearchCountStrategyEnum, WebhookStatusEnum
+
+
+def add_events(event_store, count: int) -> None:
+    for _ in range(count):
+        event_id = ObjectId()
+        event_store.documents[event_id] = {
+            "_id": event_id,
+            "idempotency_key": str(event_id),
+            "data": {},
+            "status": WebhookStatusEnum.RECEIVED,
+            "received_at": datetime.now(tz=timezone.utc),
+        }
+
+
+def test_reset_backends_drops_every_singleton(memory_backends):
+    getters = [
+        memory_backends.get_event_store,
+        memory_backends.get_webhook_queue,
+        memory_backends.get_event_status_cache,
+        memory_backends.get_search_count_cache,
+    ]
+    before = [getter() for getter in getters]
+
+    memory_backends.reset_backends()
+
+    for getter, instance in zip(getters, before):
+        assert getter() is not instance, getter.__name__
+
+
+@pytest.mark.parametrize("strategy", list(SearchCountStrategyEnum))
+def test_search_count_strategies(event_loop_runner, memory_backends, strategy):
+    add_events(memory_backends.get_event_store(), count=3)
+    webhook_event_service = memory_backends.get_webhook_event_service()
+
+    # The first cached lookup misses and counts, the second one is served from the cache
+    for _ in range(2):
+        search_count = event_loop_runner(
+            webhook_event_service.get_search_total_count(
+                filter_dict={}, strategy=strategy
+            )
+        )
+
+    assert search_count.count == 3
+    assert search_count.strategy == strategy
+
+
+def test_filtered_estimates_fall_back_to_cached_counts(
+    event_loop_runner, memory_backends
+):
+    event_store = memory_backends.get_event_store()
+    add_events(event_store, count=3)
+    webhook_event_service = memory_backends.get_webhook_event_service()
+    filter_dict = {"status": WebhookStatusEnum.RECEIVED}
+
+    def count(strategy: SearchCountStrategyEnum):
+        return event_loop_runner(
+            webhook_event_service.get_search_total_count(
+                filter_dict=filter_dict, strategy=strategy
+            )
+        )
+
+    assert count(SearchCountStrategyEnum.ESTIMATED) == (
+        3,
+        SearchCountStrategyEnum.EXACT,
+    )
+    add_events(event_store, count=2)
+    # Served from the cache until it expires, exact counts always query the store
+    assert count(SearchCountStrategyEnum.ESTIMATED) == (
+        3,
+        SearchCountStrategyEnum.CACHED,
+    )
+    assert count(SearchCountStrategyEnum.EXACT) == (5, SearchCountStrategyEnum.EXACT)
+
+
+def test_equal_filters_share_a_filter_hash():
+    timestamp_from = datetime(2026, 1, 1, 1, tzinfo=timezone.utc)
+
+    assert get_filter_hash(
+        {"status": "received", "received_at": {"$gte": timestamp_from}}
+    ) == get_filter_hash(
+        {
+            "received_at": {
+                "$gte": timestamp_from.astimezone(timezone(timedelta(hours=2)))
+            },
+            "status": "received",
+        }
+    )
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.backends.memory_store import InMemorySigningKeyStore
+from app.services.signing_keys import SigningKeyService
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class CountingSigningKeyStore(InMemorySigningKeyStore):
+    def __init__(self):
+        super().__init__()
+        self.lookups = []
+
+    async def find_signing_keys(self, key_id: str):
+        self.lookups.append(key_id)
+        return await super().find_signing_keys(key_id=key_id)
+
+
+def build_service(
+    key_store, negative_cache_ttl_seconds: float = 60
+) -> SigningKeyService:
+    return SigningKeyService(
+        key_store=key_store,
+        cache_ttl_seconds=60,
+        max_keys=10,
+        negative_cache_ttl_seconds=negative_cache_ttl_seconds,
+        max_unknown_keys=2,
+    )
+
+
+def add_key(event_loop_runner, key_store, key_id: str, **fields) -> None:
+    event_loop_runner(
+        key_store.insert_signing_key({"key_id": key_id, "secret": "secret", **fields})
+    )
+
+
+def test_rotation_accepts_both_keys_while_they_overlap(event_loop_runner):
+    key_store = CountingSigningKeyStore()
+    add_key(
+        event_loop_runner, key_store, "producer", valid_until=NOW + timedelta(hours=1)
+    )
+    add_key(event_loop_runner, key_store, "producer", valid_from=NOW)
+    service = build_service(key_store)
+
+    def valid_key_count(now: datetime) -> int:
+        return len(
+            event_loop_runner(
+                service.get_valid_signing_keys(key_id="producer", now=now)
+            )
+        )
+
+    assert valid_key_count(NOW - timedelta(minutes=1)) == 1
+    assert valid_key_count(NOW) == 2
+    assert valid_key_count(NOW + timedelta(hours=2)) == 1
+    assert key_store.lookups == ["producer"]
+
+
+def test_unknown_key_ids_do_not_evict_known_keys(event_loop_runner):
+    key_store = CountingSigningKeyStore()
+    add_key(event_loop_runner, key_store, "producer")
+    service = build_service(key_store)
+    event_loop_runner(service.get_valid_signing_keys(key_id="producer", now=NOW))
+
+    for index in range(50):
+        assert not event_loop_runner(
+            service.get_valid_signing_keys(key_id=f"made-up-{index}", now=NOW)
+        )
+    event_loop_runner(service.get_valid_signing_keys(key_id="producer", now=NOW))
+
+    assert key_store.lookups.count("producer") == 1
+    assert len(service._unknown_cache) == 2
+
+
+def test_inserted_key_is_accepted_once_the_unknown_entry_expires(event_loop_runner):
+    key_store = CountingSigningKeyStore()
+    service = build_service(key_store, negative_cache_ttl_seconds=0)
+    assert not event_loop_runner(
+        service.get_valid_signing_keys(key_id="producer", now=NOW)
+    )
+
+    add_key(event_loop_runner, key_store, "producer")
+
+    assert event_loop_runner(service.get_valid_signing_keys(key_id="producer", now=NOW))
+    assert "producer" not in service._unknown_cache
+
+
+@pytest.mark.parametrize("key_id", ["", "a" * 65, "producer\n", "$where", "ключ"])
+def test_malformed_key_ids_are_rejected_without_a_lookup(event_loop_runner, key_id):
+    key_store = CountingSigningKeyStore()
+    service = build_service(key_store)
+
+    assert not event_loop_runner(service.get_valid_signing_keys(key_id=key_id, now=NOW))
+    assert key_store.lookups == []
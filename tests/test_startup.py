@@ -0,0 +1,94 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.config import indexes
+from app.scripts import SCRIPTS_DIR, load_lua_script
+
+
+class FakeCollection:
+    def __init__(self):
+        self.created_indexes = []
+        self.documents = {}
+
+    async def create_index(self, keys, **options):
+        self.created_indexes.append((keys, options))
+
+    async def find_one(self, filter_dict):
+        return self.documents.get(filter_dict["_id"])
+
+    async def update_one(self, filter, update, upsert):
+        self.documents.setdefault(filter["_id"], {"_id": filter["_id"]}).update(
+            update["$set"]
+        )
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.collections = {}
+
+    def get_collection(self, name):
+        return self.collections.setdefault(name, FakeCollection())
+
+    def count_created_indexes(self) -> int:
+        return sum(
+            len(collection.created_indexes) for collection in self.collections.values()
+        )
+
+
+@pytest.fixture
+def fake_db(monkeypatch) -> FakeDatabase:
+    db = FakeDatabase()
+    monkeypatch.setattr(indexes, "get_db", lambda: db)
+    return db
+
+
+def test_indexes_are_created_only_when_the_spec_changes(
+    event_loop_runner, fake_db, monkeypatch
+):
+    spec_count = sum(len(index_specs) for index_specs in indexes.INDEX_SPECS.values())
+
+    assert event_loop_runner(
+        indexes.CreateDbCollectionIndexes().ensure_collections_indexes()
+    )
+    assert fake_db.count_created_indexes() == spec_count
+    assert not event_loop_runner(
+        indexes.CreateDbCollectionIndexes().ensure_collections_indexes()
+    )
+    assert fake_db.count_created_indexes() == spec_count
+
+    monkeypatch.setitem(
+        indexes.INDEX_SPECS, "webhook_new_collection", [([("field", 1)], {})]
+    )
+    assert event_loop_runner(
+        indexes.CreateDbCollectionIndexes().ensure_collections_indexes()
+    )
+
+
+@pytest.mark.parametrize(
+    "file_name", sorted(path.name for path in SCRIPTS_DIR.glob("*.lua"))
+)
+def test_lua_scripts_load_from_any_working_directory(file_name, tmp_path, monkeypatch):
+    load_lua_script.cache_clear()
+    monkeypatch.chdir(tmp_path)
+
+    assert "redis.call" in load_lua_script(file_name=file_name)
+
+
+def test_importing_the_delivery_task_has_no_side_effects():
+    # A fresh interpreter, since this test session may already have built the client
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from app.tasks import webhook_delivery; "
+            "assert webhook_delivery._http_client is None",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parents[1],
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,73 @@
+import asyncio
+import socket
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config.settings import settings
+from app.services.worker_runtime import (
+    DeliveryConcurrencyLimiter,
+    delivery_worker_runtime,
+)
+from app.tasks.worker_admin import bind_worker_admin_socket, create_worker_admin_app
+
+
+@pytest.fixture
+def admin_client():
+    yield TestClient(create_worker_admin_app())
+    delivery_worker_runtime.stop()
+
+
+def test_worker_admin_skips_an_address_in_use(monkeypatch):
+    with socket.create_server(("127.0.0.1", 0)) as occupied:
+        monkeypatch.setattr(settings, "WORKER_ADMIN_SOCKET", None)
+        monkeypatch.setattr(settings, "WORKER_ADMIN_HOST", "127.0.0.1")
+        monkeypatch.setattr(settings, "WORKER_ADMIN_PORT", occupied.getsockname()[1])
+
+        assert bind_worker_admin_socket() is None
+
+
+def test_controls_are_rejected_without_a_delivery_loop(admin_client):
+    assert admin_client.get("/admin/stats").json()["data"]["running"] is False
+    assert admin_client.post("/admin/dequeue/pause").status_code == 503
+
+
+def test_controls_change_the_running_delivery_loop(admin_client):
+    delivery_worker_runtime.start(concurrency=4)
+
+    paused = admin_client.post("/admin/dequeue/pause").json()["data"]
+    resized = admin_client.put("/admin/concurrency", json={"limit": 8}).json()["data"]
+    resumed = admin_client.post("/admin/dequeue/resume").json()["data"]
+
+    assert paused["running"] and paused["dequeue_paused"]
+    assert resized["concurrency_limit"] == 8
+    assert not resumed["dequeue_paused"]
+
+
+def test_lowering_the_limit_lets_running_deliveries_finish(event_loop_runner):
+    async def lower_limit_while_busy() -> list:
+        limiter = DeliveryConcurrencyLimiter(limit=2)
+        await limiter.__aenter__()
+        await limiter.__aenter__()
+        await limiter.set_limit(limit=1)
+        states = [limiter.locked()]
+        await limiter.__aexit__(None, None, None)
+        states.append(limiter.locked())
+        await limiter.__aexit__(None, None, None)
+        states.append(limiter.locked())
+        return states
+
+    assert event_loop_runner(lower_limit_while_busy()) == [True, True, False]
+
+
+def test_waiting_deliveries_start_once_the_limit_is_raised(event_loop_runner):
+    async def raise_limit_while_waiting() -> bool:
+        limiter = DeliveryConcurrencyLimiter(limit=0)
+        waiting = asyncio.create_task(limiter.__aenter__())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+        await limiter.set_limit(limit=1)
+        await asyncio.wait_for(waiting, timeout=5)
+        return limiter.in_use == 1
+
+    assert event_loop_runner(raise_limit_while_waiting())